@@ -1,4 +1,5 @@
 """Contains show related classes."""
+from copy import copy
 from functools import partial
 
 from mpf.core.assets import Asset, AssetPool
@@ -38,6 +39,7 @@ class Show(Asset):
     class_priority = 100
     pool_config_section = 'show_pools'
     asset_group_class = ShowPool
+    max_cached_token_sets = 100
 
     # pylint: disable-msg=too-many-arguments
     def __init__(self, machine, name, file=None, config=None, data=None):
@@ -51,6 +53,8 @@ class Show(Asset):
         self.tokens = set()
         self.token_values = dict()
         self.token_keys = dict()
+        self._show_steps_with_tokens = dict()
+        self._show_plans = dict()
 
         self.running = set()
         '''Set of RunningShow() instances which represents running instances
@@ -106,6 +110,8 @@ class Show(Asset):
     def _do_load_show(self, data):
         # do not use machine or the logger here because it will block
         self.show_steps = list()
+        self._show_steps_with_tokens = dict()
+        self._show_plans = dict()
 
         if not data and self.file:
             data = self.load_show_from_disk()
@@ -197,6 +203,8 @@ class Show(Asset):
 
     def _do_unload(self):
         self.show_steps = None
+        self._show_steps_with_tokens = dict()
+        self._show_plans = dict()
 
     def _get_tokens(self):
         self._walk_show(self.show_steps)
@@ -241,6 +249,111 @@ class Show(Asset):
         else:
             return data
 
+    def get_show_steps_with_tokens(self, show_tokens) -> list:
+        """Return the show steps with show_tokens replaced.
+
+        The steps are shared with other running instances of this show and must not be modified. Only the containers
+        on the path to a token are copied and the result is cached per set of show_tokens.
+        """
+        if not show_tokens or not self.tokens:
+            return self.show_steps
+
+        try:
+            cache_key = frozenset(show_tokens.items())
+        except TypeError:
+            # unhashable token value. cannot cache those
+            return self._replace_tokens(show_tokens)
+
+        try:
+            return self._show_steps_with_tokens[cache_key]
+        except KeyError:
+            pass
+
+        if len(self._show_steps_with_tokens) >= self.max_cached_token_sets:
+            self._show_steps_with_tokens = dict()
+
+        show_steps = self._replace_tokens(show_tokens)
+        self._show_steps_with_tokens[cache_key] = show_steps
+        return show_steps
+
+    def get_show_plan(self, show_steps) -> list:
+        """Return a list of (player_name, player, settings) per step for show steps of this show.
+
+        Settings are prepared by the players once and cached for every list of show steps.
+        """
+        try:
+            return self._show_plans[id(show_steps)][1]
+        except KeyError:
+            pass
+
+        show_players = self.machine.show_controller.show_players
+        plan = []
+        for step in show_steps:
+            step_plan = []
+            for item_type, item_dict in step.items():
+                if item_type == 'duration':
+                    continue
+                elif item_type in show_players:
+                    player = show_players[item_type]
+                    step_plan.append((item_type, player, player.prepare_show_settings(item_dict)))
+                else:
+                    raise ValueError("Invalid entry in show: {}".format(item_type))
+            plan.append(step_plan)
+
+        if len(self._show_plans) >= self.max_cached_token_sets:
+            self._show_plans = dict()
+
+        # keep a reference to show_steps to make sure its id is not reused
+        self._show_plans[id(show_steps)] = (show_steps, plan)
+        return plan
+
+    def _replace_tokens(self, show_tokens) -> list:
+        """Return a copy of the show steps with tokens replaced which only copies containers on token paths."""
+        show_steps = list(self.show_steps)
+        copied = set()
+        keys_replaced = dict()
+
+        def get_target(path):
+            """Return the container at path and copy all containers on the way which are still shared."""
+            target = show_steps
+            for x in path:
+                if x in keys_replaced:
+                    x = keys_replaced[x]
+                child = target[x]
+                if id(child) not in copied:
+                    child = copy(child)
+                    copied.add(id(child))
+                    target[x] = child
+                target = child
+            return target
+
+        for token, replacement in show_tokens.items():
+            if token in self.token_values:
+                for token_path in self.token_values[token]:
+                    get_target(token_path[:-1])[token_path[-1]] = replacement
+
+        for token, replacement in show_tokens.items():
+            if token in self.token_keys:
+                key_name = '({})'.format(token)
+                for token_path in self.token_keys[token]:
+                    target = get_target(token_path)
+
+                    if key_name in target:
+                        target[replacement] = target.pop(key_name)
+                    else:
+                        # Fallback in case the token is no lowercase. Unfortunately, this can happen since every config
+                        # player has its own config validator. Additionally, keys in dicts are not properly lowercased.
+                        for key in target:
+                            if key.lower() == key_name:
+                                target[replacement] = target.pop(key)
+                                break
+                        else:   # pragma: no cover
+                            raise KeyError("Could not find token {}".format(key_name))
+
+                    keys_replaced[key_name] = replacement
+
+        return show_steps
+
     def _check_token(self, path, data, token_type):
         if not isinstance(data, str):
             return
@@ -352,7 +465,7 @@ class Show(Asset):
                              format(self.name, self.tokens, set(show_tokens.keys())))
 
         if self.loaded:
-            show_steps = self.get_show_steps()
+            show_steps = self.get_show_steps_with_tokens(show_tokens)
         else:
             show_steps = False
 
@@ -392,6 +505,9 @@ class Show(Asset):
                                                        __version__,
                                                        __show_version__))
 
+        if self.machine.config_file_cache:
+            return self.machine.config_file_cache.load(self.file)
+
         return FileManager.load(self.file)
 
 
@@ -444,6 +560,7 @@ class RunningShow(object):
 
         self.id = self.machine.show_controller.get_next_show_id()
         self._players = list()
+        self._show_plan = None
 
         # if show_tokens:
         #     self.show_tokens = show_tokens
@@ -469,7 +586,7 @@ class RunningShow(object):
         """
         del show
         self._show_loaded = True
-        self.show_steps = self.show.get_show_steps()
+        self.show_steps = self.show.get_show_steps_with_tokens(self.show_tokens)
         self._start_play()
 
     def _start_play(self):
@@ -477,6 +594,7 @@ class RunningShow(object):
             return
 
         self._total_steps = len(self.show_steps)
+        self._show_plan = self.show.get_show_plan(self.show_steps)
 
         if self.start_step > 0:
             self.next_step_index = self.start_step - 1
@@ -485,9 +603,6 @@ class RunningShow(object):
         else:
             self.next_step_index = 0
 
-        if self.show_tokens and self.show.tokens:
-            self._replace_tokens(**self.show_tokens)
-
         self.show.running.add(self)
         self.machine.show_controller.notify_show_starting(self)
 
@@ -509,43 +624,6 @@ class RunningShow(object):
         """Return str representation."""
         return 'Running Show Instance: "{}" {} {}'.format(self.name, self.show_tokens, self.next_step_index)
 
-    def _replace_tokens(self, **kwargs):
-        keys_replaced = dict()
-
-        for token, replacement in kwargs.items():
-            if token in self.show.token_values:
-                for token_path in self.show.token_values[token]:
-                    target = self.show_steps
-                    for x in token_path[:-1]:
-                        target = target[x]
-
-                    target[token_path[-1]] = replacement
-
-        for token, replacement in kwargs.items():
-            if token in self.show.token_keys:
-                key_name = '({})'.format(token)
-                for token_path in self.show.token_keys[token]:
-                    target = self.show_steps
-                    for x in token_path:
-                        if x in keys_replaced:
-                            x = keys_replaced[x]
-
-                        target = target[x]
-
-                    if key_name in target:
-                        target[replacement] = target.pop(key_name)
-                    else:
-                        # Fallback in case the token is no lowercase. Unfortunately, this can happen since every config
-                        # player has its own config validator. Additionally, keys in dicts are not properly lowercased.
-                        for key in target:
-                            if key.lower() == key_name:
-                                target[replacement] = target.pop(key)
-                                break
-                        else:   # pragma: no cover
-                            raise KeyError("Could not find token {}".format(key_name))
-
-                    keys_replaced[key_name] = replacement
-
     def stop(self):
         """Stop show."""
         if self._stopped:
@@ -647,26 +725,16 @@ class RunningShow(object):
 
         self.current_step_index = self.next_step_index
 
-        for item_type, item_dict in (
-                iter(self.show_steps[self.current_step_index].items())):
-
-            if item_type == 'duration':
-                continue
-
-            elif item_type in self.machine.show_controller.show_players:
+        for item_type, player, settings in self._show_plan[self.current_step_index]:
+            player.show_play_callback(
+                settings=settings,
+                context="show_" + str(self.id),
+                calling_context=self.current_step_index,
+                priority=self.priority,
+                show_tokens=self.show_tokens)
 
-                self.machine.show_controller.show_players[item_type].show_play_callback(
-                    settings=item_dict,
-                    context="show_" + str(self.id),
-                    calling_context=self.current_step_index,
-                    priority=self.priority,
-                    show_tokens=self.show_tokens)
-
-                if item_type not in self._players:
-                    self._players.append(item_type)
-
-            else:
-                raise ValueError("Invalid entry in show: {}".format(item_type))
+            if item_type not in self._players:
+                self._players.append(item_type)
 
         self.next_step_index += 1
 
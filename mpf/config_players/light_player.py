@@ -1,5 +1,4 @@
 """Light config player."""
-from copy import deepcopy
 from mpf.config_players.device_config_player import DeviceConfigPlayer
 from mpf.core.rgb_color import RGBColor
 from mpf.core.utility_functions import Util
@@ -20,43 +19,65 @@ class LightPlayer(DeviceConfigPlayer):
         del kwargs
 
         for light, s in settings.items():
-            s = deepcopy(s)
+            s = dict(s)
             try:
                 s['priority'] += priority
             except KeyError:
                 s['priority'] = priority
             if isinstance(light, str):
-                if light in self.machine.lights:
-                    self._light_named_color(light, instance_dict, full_context, **s)
-                else:
-                    light_list = Util.string_to_list(light)
-                    if len(light_list) > 1:
-                        for light1 in light_list:
-                            self._light_named_color(light1, instance_dict, full_context, **s)
-                    else:
-                        # TODO: this case fails silently if leds do not exist
-                        for light1 in self.machine.lights.items_tagged(light):
-                            self._light_color(light1, instance_dict, full_context, **s)
+                for light1 in self._get_lights(light):
+                    self._light_color(light1, instance_dict, full_context, **s)
             else:
                 self._light_color(light, instance_dict, full_context, **s)
 
-    def _light_named_color(self, light_name, instance_dict, full_context, color, **s):
-        light = self.machine.lights[light_name]
-        self._light_color(light, instance_dict, full_context, color, **s)
+    def prepare_show_settings(self, settings):
+        """Resolve light names and tags and parse colors once per show step."""
+        prepared_settings = dict()
+        for light, s in settings.items():
+            if isinstance(light, str):
+                try:
+                    lights = self._get_lights(light)
+                except KeyError:
+                    # keep it and fail when the step runs
+                    prepared_settings[light] = s
+                    continue
+            else:
+                lights = [light]
+
+            for light1 in lights:
+                prepared_settings[light1] = dict(s, color=self._parse_color(light1, s['color']))
+
+        return prepared_settings
+
+    def _get_lights(self, light):
+        """Return a list of lights for a light name, a list of names or a tag."""
+        if light in self.machine.lights:
+            return [self.machine.lights[light]]
+
+        light_list = Util.string_to_list(light)
+        if len(light_list) > 1:
+            return [self.machine.lights[light1] for light1 in light_list]
+
+        # TODO: this case fails silently if leds do not exist
+        return self.machine.lights.items_tagged(light)
 
     @staticmethod
-    def _light_color(light, instance_dict, full_context, color, **s):
-        if color == "on":
-            color = light.config['default_on_color']
-        else:
-            # hack to keep compatibility for matrix_light values
-            if len(color) == 1:
-                color = "0" + color + "0" + color + "0" + color
-            elif len(color) == 2:
-                color = color + color + color
-
-            color = RGBColor(color)
-        light.color(color, key=full_context, **s)
+    def _parse_color(light, color):
+        if isinstance(color, RGBColor):
+            return color
+        elif color == "on":
+            return light.config['default_on_color']
+
+        # hack to keep compatibility for matrix_light values
+        if len(color) == 1:
+            color = "0" + color + "0" + color + "0" + color
+        elif len(color) == 2:
+            color = color + color + color
+
+        return RGBColor(color)
+
+    def _light_color(self, light, instance_dict, full_context, color, **s):
+        light.color(self._parse_color(light, color), key=full_context, **s)
         instance_dict[light.name] = light
 
     def clear_context(self, context):
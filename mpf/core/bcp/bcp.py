@@ -69,6 +69,9 @@ class Bcp(MpfController):
 
             client = Util.string_to_class(settings['type'])(self.machine, name, self.machine.bcp)
             client.exit_on_close = settings['exit_on_close']
+            client.max_send_queue = settings['max_send_queue']
+            client.monitor_drop_policy = settings['monitor_drop_policy']
+            client.binary_framing = settings['binary_framing']
             connect_future = Util.ensure_future(client.connect(settings), loop=self.machine.clock.loop)
             connect_future.add_done_callback(partial(self.transport.register_transport, client))
             client_connect_futures.append(connect_future)
@@ -96,7 +99,9 @@ class Bcp(MpfController):
         servers_start_futures = []
         for settings in self.machine.config['bcp']['servers'].values():
             settings = self.machine.config_validator.validate_config("bcp:servers", settings)
-            server = BcpServer(self.machine, settings['ip'], settings['port'], settings['type'])
+            server = BcpServer(self.machine, settings['ip'], settings['port'], settings['type'],
+                               settings['max_send_queue'], settings['monitor_drop_policy'],
+                               settings['binary_framing'])
             server_future = Util.ensure_future(server.start(), loop=self.machine.clock.loop)
             server_future.add_done_callback(lambda x: self.servers.append(server))
             servers_start_futures.append(server_future)
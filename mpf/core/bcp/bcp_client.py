@@ -6,6 +6,42 @@ import asyncio
 from mpf.core.mpf_controller import MpfController
 
 
+class BcpMessage(object):
+
+    """A BCP message which may be sent to multiple clients.
+
+    Clients encode the message with encode(). Every encoder only runs once per message, no matter how many clients
+    use it.
+    """
+
+    __slots__ = ["bcp_command", "kwargs", "monitor", "_encoded"]
+
+    def __init__(self, bcp_command, kwargs, monitor=False):
+        """Initialise message.
+
+        Args:
+            bcp_command: Command to send
+            kwargs: Parameters of the command
+            monitor: True if this is monitor traffic which clients may drop when they cannot keep up.
+        """
+        self.bcp_command = bcp_command
+        self.kwargs = kwargs
+        self.monitor = monitor
+        self._encoded = {}
+
+    def encode(self, encoder):
+        """Return the result of encoder(self) and cache it."""
+        try:
+            return self._encoded[encoder]
+        except KeyError:
+            encoded = self._encoded[encoder] = encoder(self)
+            return encoded
+
+    def __repr__(self):
+        """Return str representation."""
+        return '<BcpMessage {} {}>'.format(self.bcp_command, self.kwargs)
+
+
 class BaseBcpClient(MpfController, metaclass=abc.ABCMeta):
 
     """Base class for bcp clients."""
@@ -16,6 +52,9 @@ class BaseBcpClient(MpfController, metaclass=abc.ABCMeta):
         self.name = name
         self.bcp = bcp
         self.exit_on_close = False
+        self.max_send_queue = 1000
+        self.monitor_drop_policy = "drop_oldest"
+        self.binary_framing = False
 
     @asyncio.coroutine
     def connect(self, config):
@@ -35,6 +74,14 @@ class BaseBcpClient(MpfController, metaclass=abc.ABCMeta):
         """Send data to client."""
         raise NotImplementedError("implement")
 
+    def send_message(self, message: BcpMessage):
+        """Send a message which may be shared with other clients.
+
+        Clients which encode messages should override this and use message.encode() so the message is only encoded
+        once.
+        """
+        self.send(message.bcp_command, message.kwargs)
+
     def stop(self):
         """Stop client connection."""
         raise NotImplementedError("implement")
@@ -1,4 +1,5 @@
 """RPC Interface for BCP clients."""
+from collections import OrderedDict
 from copy import deepcopy
 
 from mpf.core.events import PostedEvent
@@ -31,6 +32,9 @@ class BcpInterface(MpfController):
 
     """
 
+    # monitor handlers which support batch mode and their categories
+    _batch_categories = {"_monitor_events": "events", "_devices": "devices", "_switches": "switches"}
+
     def __init__(self, machine):
         """Initialise BCP."""
         super().__init__(machine)
@@ -46,6 +50,10 @@ class BcpInterface(MpfController):
         self._client_reset_queue = None
         self._client_reset_complete_status = {}
 
+        # changes for clients which monitor in batch mode. flushed once per loop iteration
+        self._monitor_batches = {}
+        self._monitor_batch_flush_scheduled = False
+
         self.bcp_receive_commands = dict(
             reset_complete=self._bcp_receive_reset_complete,
             error=self._bcp_receive_error,
@@ -94,18 +102,28 @@ class BcpInterface(MpfController):
         del client
         self.machine.set_machine_var(name, value)
 
-    def _bcp_receive_monitor_start(self, client, category):
-        """Start monitoring the specified category."""
+    def _bcp_receive_monitor_start(self, client, category, batch=False):
+        """Start monitoring the specified category.
+
+        Clients which pass batch=true receive all changes of one loop iteration in a single monitor_batch message.
+        This is supported for events, devices and switches. MPF answers with monitor_batching to tell the client
+        whether it will receive batches.
+        """
         category = str.lower(category)
+        batch = str(batch).lower() in ("true", "1")
+
+        if batch:
+            self.machine.bcp.transport.send_to_client(client, "monitor_batching", category=category,
+                                                      enabled=category in ("events", "devices", "switches"))
 
         if category == "events":
-            self._monitor_events(client)
+            self._monitor_events(client, batch)
         elif category == "devices":
-            self._monitor_devices(client)
+            self._monitor_devices(client, batch)
         elif category == "drivers":
             self._monitor_drivers(client)
         elif category == "switches":
-            self._monitor_switches(client)
+            self._monitor_switches(client, batch)
         elif category == "machine_vars":
             self._monitor_machine_vars(client)
         elif category == "player_vars":
@@ -154,9 +172,9 @@ class BcpInterface(MpfController):
         """Monitor all drivers."""
         self.machine.bcp.transport.remove_transport_from_handle("_monitor_drivers", client)
 
-    def _monitor_events(self, client):
+    def _monitor_events(self, client, batch=False):
         """Monitor all events."""
-        self.machine.bcp.transport.add_handler_to_transport("_monitor_events", client)
+        self.machine.bcp.transport.add_handler_to_transport("_monitor_events", client, batch)
         self.machine.events.monitor_events = True
 
     def _monitor_events_stop(self, client):
@@ -168,9 +186,7 @@ class BcpInterface(MpfController):
 
     def monitor_posted_event(self, posted_event: PostedEvent):
         """Send monitored posted event to bcp clients."""
-        self.machine.bcp.transport.send_to_clients_with_handler(
-            handler="_monitor_events",
-            bcp_command="monitored_event",
+        event = dict(
             event_name=posted_event.event,
             event_type=posted_event.type,
             event_callback=posted_event.callback,
@@ -179,9 +195,41 @@ class BcpInterface(MpfController):
                 self.machine.events.registered_handlers.get(posted_event.event, []))
         )
 
-    def _monitor_devices(self, client):
+        if self.machine.bcp.transport.get_batching_transports_for_handler("_monitor_events"):
+            self._get_monitor_batch("_monitor_events", list).append(event)
+
+        self.machine.bcp.transport.send_to_clients_with_handler(
+            handler="_monitor_events",
+            bcp_command="monitored_event",
+            **event
+        )
+
+    def _get_monitor_batch(self, handler, batch_type):
+        """Return the pending batch for a handler and make sure it will be flushed."""
+        if not self._monitor_batch_flush_scheduled:
+            self._monitor_batch_flush_scheduled = True
+            self.machine.clock.loop.call_soon(self._flush_monitor_batches)
+
+        if handler not in self._monitor_batches:
+            self._monitor_batches[handler] = batch_type()
+
+        return self._monitor_batches[handler]
+
+    def _flush_monitor_batches(self):
+        """Send all pending changes to batching clients."""
+        self._monitor_batch_flush_scheduled = False
+        batches = self._monitor_batches
+        self._monitor_batches = {}
+
+        for handler, items in batches.items():
+            if isinstance(items, dict):
+                items = list(items.values())
+            self.machine.bcp.transport.send_batch_to_clients_with_handler(
+                handler, "monitor_batch", category=self._batch_categories[handler], items=items)
+
+    def _monitor_devices(self, client, batch=False):
         """Register client to get notified of device changes."""
-        self.machine.bcp.transport.add_handler_to_transport("_devices", client)
+        self.machine.bcp.transport.add_handler_to_transport("_devices", client, batch)
         # trigger updates of lights
         self.machine.light_controller.monitor_lights()
 
@@ -205,6 +253,9 @@ class BcpInterface(MpfController):
         if not self.configured:
             return
 
+        if self.machine.bcp.transport.get_batching_transports_for_handler("_devices"):
+            self._batch_device_change(device, attribute_name, old_value, new_value)
+
         self.machine.bcp.transport.send_to_clients_with_handler(
             handler="_devices",
             bcp_command='device',
@@ -213,14 +264,33 @@ class BcpInterface(MpfController):
             changes=(attribute_name, Util.convert_to_simply_type(old_value), Util.convert_to_simply_type(new_value)),
             state=device.get_monitorable_state())
 
-    def _monitor_switches(self, client):
+    def _batch_device_change(self, device, attribute_name, old_value, new_value):
+        """Merge a device change into the pending batch.
+
+        Only the latest state of a device is sent. Changes keep the first old value and the latest new value of
+        every attribute.
+        """
+        batch = self._get_monitor_batch("_devices", OrderedDict)
+        key = (device.class_label, device.name)
+        if key not in batch:
+            batch[key] = dict(type=device.class_label, name=device.name, changes={})
+
+        entry = batch[key]
+        new_value = Util.convert_to_simply_type(new_value)
+        if attribute_name in entry["changes"]:
+            entry["changes"][attribute_name][1] = new_value
+        else:
+            entry["changes"][attribute_name] = [Util.convert_to_simply_type(old_value), new_value]
+        entry["state"] = device.get_monitorable_state()
+
+    def _monitor_switches(self, client, batch=False):
         """Register client to get notified of switch changes."""
         self.machine.switch_controller.add_monitor(self._notify_switch_changes)
-        self.machine.bcp.transport.add_handler_to_transport("_switches", client)
+        self.machine.bcp.transport.add_handler_to_transport("_switches", client, batch)
 
     def _monitor_switches_stop(self, client):
         """Remove client to no longer get notified of switch changes."""
-        self.machine.bcp.transport.add_handler_to_transport("_switches", client)
+        self.machine.bcp.transport.remove_transport_from_handle("_switches", client)
 
         # If there are no more clients monitoring switches, remove monitor
         if not self.machine.bcp.transport.get_transports_for_handler("_switches"):
@@ -228,6 +298,9 @@ class BcpInterface(MpfController):
 
     def _notify_switch_changes(self, change: MonitoredSwitchChange):
         """Notify all listeners about switch change."""
+        if self.machine.bcp.transport.get_batching_transports_for_handler("_switches"):
+            self._get_monitor_batch("_switches", list).append(dict(name=change.name, state=change.state))
+
         self.machine.bcp.transport.send_to_clients_with_handler(
             handler="_switches",
             bcp_command='switch',
@@ -9,13 +9,17 @@ class BcpServer(MpfController):
 
     """Server socket which listens for incoming BCP clients."""
 
-    def __init__(self, machine, ip, port, server_type):
+    def __init__(self, machine, ip, port, server_type, max_send_queue=1000, monitor_drop_policy="drop_oldest",
+                 binary_framing=False):
         """Initialise BCP server."""
         super().__init__(machine)
         self._server = None
         self._ip = ip
         self._port = port
         self._type = server_type
+        self._max_send_queue = max_send_queue
+        self._monitor_drop_policy = monitor_drop_policy
+        self._binary_framing = binary_framing
 
     @asyncio.coroutine
     def start(self):
@@ -35,6 +39,9 @@ class BcpServer(MpfController):
         """Accept an connection and create client."""
         self.info_log("New client connected.")
         client = Util.string_to_class(self._type)(self.machine, None, self.machine.bcp)
-        client.accept_connection(client_reader, client_writer)
         client.exit_on_close = False
+        client.max_send_queue = self._max_send_queue
+        client.monitor_drop_policy = self._monitor_drop_policy
+        client.binary_framing = self._binary_framing
+        client.accept_connection(client_reader, client_writer)
         self.machine.bcp.transport.register_transport(client)
@@ -1,11 +1,17 @@
 """BCP socket client."""
 import json
+import struct
+from collections import deque
 from urllib.parse import urlsplit, parse_qs, quote, unquote, urlunparse
 
 import asyncio
 
 from mpf._version import __version__, __bcp_version__
-from mpf.core.bcp.bcp_client import BaseBcpClient
+from mpf.core.bcp.bcp_client import BaseBcpClient, BcpMessage
+
+
+# length of the JSON payload and of the raw bytes which follow it
+BINARY_FRAME_HEADER = struct.Struct("!II")
 
 
 class MpfJSONEncoder(json.JSONEncoder):
@@ -120,6 +126,37 @@ def encode_command_string(bcp_command, **kwargs):
     return str(urlunparse(('', '', bcp_command.lower(), '', kwarg_string, '')))
 
 
+def encode_binary_frame(bcp_command, **kwargs):
+    """Encode a BCP command and kwargs into a length-prefixed binary frame.
+
+    The frame starts with BINARY_FRAME_HEADER. It is followed by the command and kwargs as compact JSON array and the
+    raw bytes of the rawbytes kwarg (if any). Unlike encode_command_string this does not need any URL quoting and
+    keeps the types of all JSON types.
+
+    Returns:
+        bytes
+    """
+    rawbytes = kwargs.pop('rawbytes', b'')
+    payload = json.dumps([bcp_command.lower(), kwargs], cls=MpfJSONEncoder, separators=(',', ':')).encode()
+    return BINARY_FRAME_HEADER.pack(len(payload), len(rawbytes)) + payload + rawbytes
+
+
+def decode_binary_frame(payload, rawbytes=None):
+    """Decode the payload of a binary frame into command and kwargs.
+
+    Args:
+        payload: The JSON part of the frame (without header).
+        rawbytes: The raw bytes part of the frame. Will be added as rawbytes kwarg.
+
+    Returns:
+        A tuple of the command string and a dictionary of kwargs.
+    """
+    bcp_command, kwargs = json.loads(payload.decode())
+    if rawbytes:
+        kwargs['rawbytes'] = rawbytes
+    return bcp_command, kwargs
+
+
 class BCPClientSocket(BaseBcpClient):
 
     """Parent class for a BCP client socket.
@@ -144,8 +181,18 @@ class BCPClientSocket(BaseBcpClient):
         self._send_goodbye = True
         self._receive_buffer = b''
 
+        # messages which are waiting for the transport to drain. entries are (data, monitor)
+        self._send_queue = deque()
+        self._drain_future = None
+        self.dropped_messages = 0
+
+        # binary framing is negotiated in hello. every direction switches after a framing command
+        self._send_binary = False
+        self._receive_binary = False
+
         self._bcp_client_socket_commands = {'hello': self._receive_hello,
-                                            'goodbye': self._receive_goodbye}
+                                            'goodbye': self._receive_goodbye,
+                                            'framing': self._receive_framing}
 
     def __repr__(self):
         return self.module_name
@@ -198,6 +245,14 @@ class BCPClientSocket(BaseBcpClient):
         if self._send_goodbye:
             self.send_goodbye()
 
+        if self._drain_future:
+            self._drain_future.cancel()
+            self._drain_future = None
+
+        # hand everything which is still queued to the transport. it will be sent before the socket closes
+        while self._send_queue:
+            self._sender.write(self._send_queue.popleft()[0])
+
         self._sender.close()
 
     def send(self, bcp_command, bcp_command_args):
@@ -207,21 +262,100 @@ class BCPClientSocket(BaseBcpClient):
             bcp_command: command to send
             bcp_command_args: parameters to command
         """
+        self.send_message(BcpMessage(bcp_command, bcp_command_args))
+
+    def send_message(self, message: BcpMessage):
+        """Send a message which may be shared with other clients."""
         try:
-            bcp_string = encode_command_string(bcp_command, **bcp_command_args)
+            data = message.encode(self._encode_binary_message if self._send_binary else self._encode_message)
         # pylint: disable-msg=broad-except
         except Exception as e:
-            self.warning_log("Failed to encode bcp_command %s with args %s. %s", bcp_command, bcp_command_args, e)
+            self.warning_log("Failed to encode bcp_command %s with args %s. %s", message.bcp_command,
+                             message.kwargs, e)
             return
 
         if self.debug_log:
-            self.debug_log('Sending "%s"', bcp_string)
-        self._sender.write((bcp_string + '\n').encode())
+            self.debug_log('Sending "%s"', data)
+        self._write(data, message.monitor)
+
+    @staticmethod
+    def _encode_message(message: BcpMessage) -> bytes:
+        return (encode_command_string(message.bcp_command, **message.kwargs) + '\n').encode()
+
+    @staticmethod
+    def _encode_binary_message(message: BcpMessage) -> bytes:
+        return encode_binary_frame(message.bcp_command, **message.kwargs)
+
+    def _is_sender_blocked(self) -> bool:
+        """Return true if the transport buffered more than its high-water mark."""
+        transport = self._sender.transport
+        return transport.get_write_buffer_size() > transport.get_write_buffer_limits()[1]
+
+    def _write(self, data: bytes, monitor: bool):
+        """Write data or queue it while the client cannot keep up.
+
+        Monitor messages are dropped according to monitor_drop_policy when the queue is full. Other messages are
+        always queued.
+        """
+        if not self._send_queue and not self._is_sender_blocked():
+            self._sender.write(data)
+            return
+
+        if monitor and len(self._send_queue) >= self.max_send_queue:
+            if self.monitor_drop_policy == "drop_newest":
+                self._drop_message()
+                return
+            elif self.monitor_drop_policy == "drop_oldest":
+                self._drop_oldest_monitor_message()
+
+        self._send_queue.append((data, monitor))
+        if not self._drain_future:
+            self._drain_future = self.machine.clock.loop.create_task(self._send_queued())
+            self._drain_future.add_done_callback(self._done)
+
+    def _drop_oldest_monitor_message(self):
+        for entry in self._send_queue:
+            if entry[1]:
+                self._send_queue.remove(entry)
+                self._drop_message()
+                return
+
+    def _drop_message(self):
+        if not self.dropped_messages:
+            self.warning_log("Client cannot keep up. Dropping monitor messages.")
+        self.dropped_messages += 1
+
+    @staticmethod
+    def _done(future):
+        try:
+            future.result()
+        except asyncio.CancelledError:
+            pass
+
+    @asyncio.coroutine
+    def _send_queued(self):
+        """Write queued messages whenever the transport drained."""
+        try:
+            while self._send_queue:
+                yield from self._sender.drain()
+                while self._send_queue and not self._is_sender_blocked():
+                    self._sender.write(self._send_queue.popleft()[0])
+        except (ConnectionError, OSError):
+            # the reader will notice and unregister the client
+            self._send_queue.clear()
+        finally:
+            self._drain_future = None
 
     @asyncio.coroutine
     def read_message(self):
         """Read the next message."""
         while True:
+            if self._receive_binary:
+                message_obj = yield from self._read_binary_frame()
+                if message_obj:
+                    return message_obj
+                continue
+
             message = yield from self._receiver.readline()
 
             # handle EOF
@@ -245,6 +379,23 @@ class BCPClientSocket(BaseBcpClient):
             if message_obj:
                 return message_obj
 
+    @asyncio.coroutine
+    def _read_binary_frame(self):
+        """Read one length-prefixed frame."""
+        try:
+            header = yield from self._receiver.readexactly(BINARY_FRAME_HEADER.size)
+            payload_length, bytes_length = BINARY_FRAME_HEADER.unpack(header)
+            frame = yield from self._receiver.readexactly(payload_length + bytes_length)
+        except asyncio.IncompleteReadError:
+            # handle EOF
+            raise BrokenPipeError()
+
+        if self.debug_log:
+            self.debug_log('Received binary frame "%s"', frame[:payload_length])
+
+        cmd, kwargs = decode_binary_frame(frame[:payload_length], frame[payload_length:])
+        return self._handle_command(cmd, kwargs)
+
     def _process_command(self, message, rawbytes=None):
         if self.debug_log:
             self.debug_log('Received "%s"', message)
@@ -253,14 +404,32 @@ class BCPClientSocket(BaseBcpClient):
         if rawbytes:
             kwargs['rawbytes'] = rawbytes
 
+        return self._handle_command(cmd, kwargs)
+
+    def _handle_command(self, cmd, kwargs):
         if cmd in self._bcp_client_socket_commands:
             self._bcp_client_socket_commands[cmd](**kwargs)
         else:
             return cmd, kwargs
 
     def _receive_hello(self, **kwargs):
-        """Process incoming BCP 'hello' command."""
+        """Process incoming BCP 'hello' command.
+
+        If both sides offered binary_framing, we announce the switch with a framing command and send binary frames
+        afterwards.
+        """
         self.debug_log('Received BCP Hello from host with kwargs: %s', kwargs)
+        if self.binary_framing and kwargs.get('binary_framing') is True and not self._send_binary:
+            self.send('framing', {'mode': 'binary'})
+            self._send_binary = True
+
+    def _receive_framing(self, mode):
+        """Process incoming BCP 'framing' command. All following messages from the host use this framing."""
+        if mode not in ("text", "binary"):
+            self.warning_log("Ignoring unknown framing %s", mode)
+            return
+        self.debug_log('Host switched to %s framing', mode)
+        self._receive_binary = mode == "binary"
 
     def _receive_goodbye(self):
         """Process incoming BCP 'goodbye' command."""
@@ -269,9 +438,12 @@ class BCPClientSocket(BaseBcpClient):
 
     def send_hello(self):
         """Send BCP 'hello' command."""
-        self.send('hello', {"version": __bcp_version__,
-                            "controller_name": 'Mission Pinball Framework',
-                            "controller_version": __version__})
+        kwargs = {"version": __bcp_version__,
+                  "controller_name": 'Mission Pinball Framework',
+                  "controller_version": __version__}
+        if self.binary_framing:
+            kwargs["binary_framing"] = True
+        self.send('hello', kwargs)
 
     def send_goodbye(self):
         """Send BCP 'goodbye' command."""
@@ -3,23 +3,32 @@ import asyncio
 
 from typing import Union
 
-from mpf.core.bcp.bcp_client import BaseBcpClient
+from mpf.core.bcp.bcp_client import BaseBcpClient, BcpMessage
 
 
 class BcpTransportManager:
 
     """Manages BCP transports."""
 
+    # messages to these handlers are only used for monitoring and may be dropped by slow clients
+    monitor_handlers = frozenset(["_monitor_events", "_monitor_drivers", "_devices", "_switches", "_modes",
+                                  "_core_events", "_player_vars", "_machine_vars"])
+
     def __init__(self, machine):
         """Initialise BCP transport manager."""
         self._machine = machine
         self._transports = []
         self._readers = {}
         self._handlers = {}
+        self._batching_handlers = {}
         self._machine.events.add_handler("shutdown", self.shutdown)
 
-    def add_handler_to_transport(self, handler, transport: BaseBcpClient):
-        """Register client as handler."""
+    def add_handler_to_transport(self, handler, transport: BaseBcpClient, batch=False):
+        """Register client as handler.
+
+        Clients with batch set do not receive single messages for this handler. They only receive what is sent with
+        send_batch_to_clients_with_handler.
+        """
         if handler not in self._handlers:
             self._handlers[handler] = []
 
@@ -28,15 +37,27 @@ class BcpTransportManager:
 
         self._handlers[handler].append(transport)
 
+        if batch:
+            self._batching_handlers.setdefault(handler, set()).add(transport)
+        elif handler in self._batching_handlers:
+            self._batching_handlers[handler].discard(transport)
+
     def remove_transport_from_handle(self, handler, transport: BaseBcpClient):
         """Remove client from a certain handler."""
         if transport in self._handlers[handler]:
             self._handlers[handler].remove(transport)
 
+        if transport not in self._handlers[handler] and handler in self._batching_handlers:
+            self._batching_handlers[handler].discard(transport)
+
     def get_transports_for_handler(self, handler):
         """Get clients which registered for a certain handler."""
         return self._handlers.get(handler, [])
 
+    def get_batching_transports_for_handler(self, handler):
+        """Get clients which registered for batches of a certain handler."""
+        return self._batching_handlers.get(handler, set())
+
     def register_transport(self, transport, future=None, **kwargs):
         """Register a client."""
         del future
@@ -77,6 +98,9 @@ class BcpTransportManager:
             if transport in self._handlers[handler]:
                 self._handlers[handler].remove(transport)
 
+        for clients in self._batching_handlers.values():
+            clients.discard(transport)
+
         if transport in self._readers:
             self._readers[transport].cancel()
             del self._readers[transport]
@@ -97,27 +121,49 @@ class BcpTransportManager:
 
     def send_to_clients(self, clients, bcp_command, **kwargs):
         """Send command to a list of clients."""
-        for client in set(clients):
-            self.send_to_client(client, bcp_command, **kwargs)
+        self._send_message_to_clients(set(clients), BcpMessage(bcp_command, kwargs))
 
     def send_to_clients_with_handler(self, handler, bcp_command, **kwargs):
         """Send command to clients which registered for a specific handler."""
         clients = self.get_transports_for_handler(handler)
-        self.send_to_clients(clients, bcp_command, **kwargs)
+        if not clients:
+            return
+
+        clients = set(clients)
+        batching_clients = self._batching_handlers.get(handler)
+        if batching_clients:
+            clients.difference_update(batching_clients)
+        if clients:
+            self._send_message_to_clients(clients, BcpMessage(bcp_command, kwargs, handler in self.monitor_handlers))
+
+    def send_batch_to_clients_with_handler(self, handler, bcp_command, **kwargs):
+        """Send command to clients which registered for batches of a specific handler."""
+        clients = self._batching_handlers.get(handler)
+        if clients:
+            self._send_message_to_clients(list(clients),
+                                          BcpMessage(bcp_command, kwargs, handler in self.monitor_handlers))
 
     def send_to_client(self, client: BaseBcpClient, bcp_command, **kwargs):
         """Send command to a specific bcp client."""
+        self._send_message(client, BcpMessage(bcp_command, kwargs))
+
+    def send_to_all_clients(self, bcp_command, **kwargs):
+        """Send command to all bcp clients."""
+        # clients may be removed while sending
+        self._send_message_to_clients(list(self._transports), BcpMessage(bcp_command, kwargs))
+
+    def _send_message_to_clients(self, clients, message: BcpMessage):
+        """Send one message to multiple clients. It is only encoded once per encoding and not once per client."""
+        for client in clients:
+            self._send_message(client, message)
+
+    def _send_message(self, client: BaseBcpClient, message: BcpMessage):
         try:
-            client.send(bcp_command, kwargs)
+            client.send_message(message)
         except IOError:
             client.stop()
             self.unregister_transport(client)
 
-    def send_to_all_clients(self, bcp_command, **kwargs):
-        """Send command to all bcp clients."""
-        for client in self._transports:
-            self.send_to_client(client, bcp_command, **kwargs)
-
     def shutdown(self, **kwargs):
         """Prepare the BCP clients for MPF shutdown."""
         del kwargs
@@ -0,0 +1,133 @@
+"""Contains the ConfigFileCache which keeps parsed config and show files on disk."""
+import hashlib
+import logging
+import os
+import pickle
+import threading
+
+from typing import Dict, Tuple
+
+from mpf._version import __version__
+from mpf.core.file_manager import FileManager
+
+
+class ConfigFileCache(object):
+
+    """Content-hash keyed cache of parsed config and show files.
+
+    Every entry stores the hash of the file contents together with the parsed (but not validated) data. A file which
+    changed on disk will no longer match its entry and is parsed again. Other files stay in the cache. Validation
+    still runs on every boot because validated configs reference devices and other machine objects.
+
+    Files are loaded in the main thread and in the asset loader thread so access to the entries is locked.
+    """
+
+    def __init__(self, cache_file: str) -> None:
+        """Initialise cache and read existing entries from cache_file."""
+        self.log = logging.getLogger("ConfigFileCache")
+        self.cache_file = cache_file
+        self.hits = 0
+        self.misses = 0
+        self._entries = dict()      # type: Dict[str, Tuple[str, bool, bytes]]
+        self._loaded_files = dict()     # type: Dict[str, Tuple[int, float, str]]
+        self._dirty = False
+        self._lock = threading.Lock()
+
+        self._load_cache_file()
+
+    def _load_cache_file(self) -> None:
+        try:
+            with open(self.cache_file, 'rb') as f:
+                version, entries = pickle.load(f)
+        except FileNotFoundError:
+            return
+        # unfortunately pickle can raise all kinds of exceptions and we dont want to crash on corrupted cache
+        # pylint: disable-msg=broad-except
+        except Exception:   # pragma: no cover
+            self.log.warning("Could not load file cache %s", self.cache_file)
+            return
+
+        if version != __version__:
+            self.log.info("File cache is from a different version of MPF.")
+            return
+
+        self._entries = entries
+
+    @staticmethod
+    def get_file_hash(filename: str) -> str:
+        """Return hash of the contents of a file."""
+        with open(filename, 'rb') as f:
+            return hashlib.sha1(f.read()).hexdigest()
+
+    def load(self, filename: str, verify_version=False, halt_on_error=True):
+        """Load a file from cache or from disk.
+
+        Takes the same arguments as FileManager.load. Every call returns a new copy of the data so callers may modify
+        it.
+        """
+        try:
+            file = os.path.abspath(FileManager.locate_file(filename))
+            stat = os.stat(file)
+            file_hash = self.get_file_hash(file)
+        except (FileNotFoundError, OSError):
+            # let the FileManager handle and report missing files
+            return FileManager.load(filename, verify_version, halt_on_error)
+
+        with self._lock:
+            self._loaded_files[file] = (stat.st_size, stat.st_mtime, file_hash)
+            entry = self._entries.get(file)
+
+        if entry and entry[0] == file_hash and (entry[1] or not verify_version):
+            self.hits += 1
+            return pickle.loads(entry[2])
+
+        self.misses += 1
+        data = FileManager.load(file, verify_version, halt_on_error)
+        with self._lock:
+            self._entries[file] = (file_hash, verify_version, pickle.dumps(data, protocol=4))
+            self._dirty = True
+
+        return data
+
+    def get_manifest(self) -> Dict[str, Tuple[int, float, str]]:
+        """Return size, mtime and hash of all files which were loaded through this cache."""
+        with self._lock:
+            return dict(self._loaded_files)
+
+    @classmethod
+    def check_manifest(cls, manifest: Dict[str, Tuple[int, float, str]]) -> bool:
+        """Return true if none of the files in the manifest changed.
+
+        Files with the same size and mtime are considered unchanged. Only files with a new mtime are hashed.
+        """
+        for file, (size, mtime, file_hash) in manifest.items():
+            try:
+                stat = os.stat(file)
+                if stat.st_size != size:
+                    return False
+                if stat.st_mtime != mtime and cls.get_file_hash(file) != file_hash:
+                    return False
+            except OSError:
+                return False
+
+        return True
+
+    def save(self) -> None:
+        """Write the cache to disk if it changed."""
+        with self._lock:
+            if not self._dirty:
+                return
+            entries = dict(self._entries)
+            self._dirty = False
+
+        # save to temp file and move afterwards. prevents broken files
+        temp_file = self.cache_file + ".tmp"
+        try:
+            with open(temp_file, 'wb') as f:
+                pickle.dump((__version__, entries), f, protocol=4)
+            os.replace(temp_file, self.cache_file)
+        except OSError as e:    # pragma: no cover
+            self.log.warning("Could not write file cache %s: %s", self.cache_file, e)
+            return
+
+        self.log.info('File cache written: %s (%s hits, %s misses)', self.cache_file, self.hits, self.misses)
@@ -227,38 +227,41 @@ class ConfigPlayer(object, metaclass=abc.ABCMeta):
         key_list = list()
 
         if config:
-            for event, settings in config.items():
-                event, actual_priority = self._parse_event_priority(event, priority)
-
-                if mode and event in mode.config['mode']['start_events']:
-                    self.machine.log.error(
-                        "{0} mode's {1}: section contains a \"{2}:\" event "
-                        "which is also in the start_events: for the {0} mode. "
-                        "Change the {1}: {2}: event name to "
-                        "\"mode_{0}_started:\"".format(
-                            mode.name, self.config_file_section, event))
-
-                    raise ValueError(
-                        "{0} mode's {1}: section contains a \"{2}:\" event "
-                        "which is also in the start_events: for the {0} mode. "
-                        "Change the {1}: {2}: event name to "
-                        "\"mode_{0}_started:\"".format(
-                            mode.name, self.config_file_section, event))
-
-                # prevent runtime crashes
-                if (not mode or (mode and not mode.is_game_mode)) and not self.is_entry_valid_outside_mode(settings):
-                    raise ConfigFileError("Section not valid outside of game modes. {} {}:{} Mode: {}".format(
-                        self, event, settings, mode
-                    ))
-
-                key_list.append(
-                    self.machine.events.add_handler(
-                        event=event,
-                        handler=self.config_play_callback,
-                        calling_context=event,
-                        priority=actual_priority,
-                        mode=mode,
-                        settings=settings))
+            # register all handlers in one batch
+            with self.machine.events.handler_transaction():
+                for event, settings in config.items():
+                    event, actual_priority = self._parse_event_priority(event, priority)
+
+                    if mode and event in mode.config['mode']['start_events']:
+                        self.machine.log.error(
+                            "{0} mode's {1}: section contains a \"{2}:\" event "
+                            "which is also in the start_events: for the {0} mode. "
+                            "Change the {1}: {2}: event name to "
+                            "\"mode_{0}_started:\"".format(
+                                mode.name, self.config_file_section, event))
+
+                        raise ValueError(
+                            "{0} mode's {1}: section contains a \"{2}:\" event "
+                            "which is also in the start_events: for the {0} mode. "
+                            "Change the {1}: {2}: event name to "
+                            "\"mode_{0}_started:\"".format(
+                                mode.name, self.config_file_section, event))
+
+                    # prevent runtime crashes
+                    if ((not mode or (mode and not mode.is_game_mode)) and
+                            not self.is_entry_valid_outside_mode(settings)):
+                        raise ConfigFileError("Section not valid outside of game modes. {} {}:{} Mode: {}".format(
+                            self, event, settings, mode
+                        ))
+
+                    key_list.append(
+                        self.machine.events.add_handler(
+                            event=event,
+                            handler=self.config_play_callback,
+                            calling_context=event,
+                            priority=actual_priority,
+                            mode=mode,
+                            settings=settings))
 
         return key_list
 
@@ -285,6 +288,14 @@ class ConfigPlayer(object, metaclass=abc.ABCMeta):
 
         self.play(settings=settings, context=context, calling_context=calling_context, priority=priority, **kwargs)
 
+    def prepare_show_settings(self, settings):
+        """Prepare the settings of a show step once before the show plays.
+
+        The result is cached by the show and passed to show_play_callback on every run of the step. Players may
+        resolve devices or parse values here. The settings are shared and must not be modified.
+        """
+        return settings
+
     # pylint: disable-msg=too-many-arguments
     def show_play_callback(self, settings, priority, calling_context, show_tokens, context):
         """Callback if used in a show."""
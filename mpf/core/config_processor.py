@@ -17,11 +17,17 @@ class ConfigProcessor(object):
 
     @staticmethod
     def load_config_file(filename, config_type: str, verify_version=True, halt_on_error=True,
-                         ignore_unknown_sections=False) -> dict:   # pragma: no cover
-        """Load a config file."""
+                         ignore_unknown_sections=False, file_cache=None) -> dict:   # pragma: no cover
+        """Load a config file.
+
+        If file_cache is passed the file and all included files are loaded through that ConfigFileCache.
+        """
         # config_type is str 'machine' or 'mode', which specifies whether this
         # file being loaded is a machine config or a mode config file
-        config = FileManager.load(filename, verify_version, halt_on_error)
+        if file_cache:
+            config = file_cache.load(filename, verify_version, halt_on_error)
+        else:
+            config = FileManager.load(filename, verify_version, halt_on_error)
 
         if not ConfigValidator.config_spec:
             ConfigValidator.load_config_spec()
@@ -47,7 +53,7 @@ class ConfigProcessor(object):
                     full_file = os.path.join(path, file)
                     config = Util.dict_merge(config,
                                              ConfigProcessor.load_config_file(
-                                                 full_file, config_type))
+                                                 full_file, config_type, file_cache=file_cache))
             return config
         except TypeError:
             return dict()
@@ -187,10 +187,16 @@ bcp:
         type: single|str|
         required: single|bool|True
         exit_on_close: single|bool|True
+        max_send_queue: single|int|1000
+        monitor_drop_policy: single|enum(drop_oldest,drop_newest,keep)|drop_oldest
+        binary_framing: single|bool|False
     servers:
         ip: single|str|None
         port: single|int|5050
         type: single|str|
+        max_send_queue: single|int|1000
+        monitor_drop_policy: single|enum(drop_oldest,drop_newest,keep)|drop_oldest
+        binary_framing: single|bool|False
 bitmap_fonts:
     __valid_in__: machine, mode
     file: single|str|None
@@ -351,6 +357,7 @@ dmds:
     brightness: single|float|1.0
     gamma: single|float|1.0
     only_send_changes: single|bool|False
+    partial_updates: single|bool|False
 drop_targets:
     __valid_in__: machine
     switch: single|machine(switches)|
@@ -727,6 +734,9 @@ mpf:
     switch_tag_event: single|str|sw_%
     allow_invalid_config_sections: single|bool|false
     save_machine_vars_to_disk: single|bool|true
+    use_data_journal: single|bool|false
+    data_journal_compact_records: single|int|1000
+    data_write_coalesce_ms: single|ms|100
     default_show_sync_ms: single|int|0
     default_platform_hz: single|float|1000
 mpf-mc:
@@ -852,6 +862,7 @@ rgb_dmds:
     fps: single|int|30
     source_display: single|str|dmd
     only_send_changes: single|bool|False
+    partial_updates: single|bool|False
     brightness: single|float|0.5
     gamma: single|float|2.2
 score_reels:
@@ -1056,6 +1067,7 @@ smartmatrix:
     port: single|str|
     baud: single|int|
     old_cookie: single|bool|False
+    partial_updates: single|bool|False
     console_log: single|enum(none,basic,full)|none
     file_log: single|enum(none,basic,full)|basic
 smart_virtual:
@@ -1,9 +1,8 @@
 """Config specs and validator."""
 import logging
 import re
-from copy import deepcopy
 
-from typing import Any, Union, List
+from typing import Any, Callable, List, Tuple
 from typing import Dict
 
 from mpf.core.config_spec import mpf_config_spec
@@ -21,11 +20,20 @@ class ConfigValidator(object):
 
     config_spec = None      # type: Any
 
+    # incremented whenever config_spec changes to invalidate the spec caches
+    config_spec_version = 0
+
     def __init__(self, machine):
         """Initialise validator."""
         self.machine = machine
         self.log = logging.getLogger('ConfigValidator')
 
+        # caches for merged and compiled specs. specs are only parsed once
+        self._spec_cache_version = None
+        self._section_specs = dict()    # type: Dict[Any, Tuple[dict, bool, List[Tuple[str, Any]]]]
+        self._item_validators = dict()  # type: Dict[str, Callable[[Any, Any], Any]]
+        self._validators = dict()       # type: Dict[str, Callable[[Any, Any], Any]]
+
         self.validator_list = {
             "str": self._validate_type_str,
             "lstr": self._validate_type_lstr,
@@ -60,6 +68,7 @@ class ConfigValidator(object):
     def load_device_config_spec(cls, config_section, config_spec):
         """Load config specs for a device."""
         cls.config_spec[config_section] = YamlInterface.process(config_spec)
+        cls.config_spec_version += 1
 
     @classmethod
     def load_mode_config_spec(cls, mode_string, config_spec):
@@ -68,6 +77,7 @@ class ConfigValidator(object):
             cls.config_spec['_mode_settings'] = {}
         if mode_string not in cls.config_spec['_mode_settings']:
             cls.config_spec['_mode_settings'][mode_string] = YamlInterface.process(config_spec)
+            cls.config_spec_version += 1
 
     @classmethod
     def load_config_spec(cls, config_spec=None):
@@ -76,6 +86,7 @@ class ConfigValidator(object):
             config_spec = mpf_config_spec
 
         cls.config_spec = YamlInterface.process(config_spec)
+        cls.config_spec_version += 1
 
     @classmethod
     def unload_config_spec(cls):
@@ -104,15 +115,37 @@ class ConfigValidator(object):
             this_base_spec = self.config_spec
             spec_element = spec_element.split(':')
             for spec in spec_element:
-                # need to deepcopy so the orig base spec doesn't get polluted
-                # with this widget's spec
-                this_base_spec = deepcopy(this_base_spec[spec])
+                this_base_spec = this_base_spec[spec]
 
+            # need to copy so the orig base spec doesn't get polluted with
+            # this widget's spec
+            this_base_spec = dict(this_base_spec)
             this_base_spec.update(this_spec)
             this_spec = this_base_spec
 
         return this_spec
 
+    def _get_section_spec(self, config_spec, base_spec):
+        """Return merged spec, allow_others and a list of (key, spec) to validate.
+
+        Cached for every combination of config_spec and base_spec. The result must not be modified.
+        """
+        if self._spec_cache_version != self.config_spec_version:
+            self._section_specs = dict()
+            self._spec_cache_version = self.config_spec_version
+
+        cache_key = (config_spec, tuple(base_spec) if isinstance(base_spec, list) else base_spec)
+        try:
+            return self._section_specs[cache_key]
+        except KeyError:
+            pass
+
+        this_spec = self._build_spec(config_spec, base_spec)
+        items = [(k, v) for k, v in this_spec.items() if v != 'ignore' and k[0] != '_']
+        section_spec = (this_spec, '__allow_others__' in this_spec, items)
+        self._section_specs[cache_key] = section_spec
+        return section_spec
+
     # pylint: disable-msg=too-many-arguments
     def validate_config(self, config_spec, source, section_name=None,
                         base_spec=None, add_missing_keys=True, prefix=None):
@@ -132,9 +165,9 @@ class ConfigValidator(object):
         else:
             validation_failure_info = (config_spec, section_name)
 
-        this_spec = self._build_spec(config_spec, base_spec)
+        this_spec, allow_others, spec_items = self._get_section_spec(config_spec, base_spec)
 
-        if '__allow_others__' not in this_spec:
+        if not allow_others:
             self.check_for_invalid_sections(this_spec, source,
                                             validation_failure_info)
 
@@ -145,13 +178,10 @@ class ConfigValidator(object):
                 source.__class__
             ))
 
-        for k in list(this_spec.keys()):
-            if this_spec[k] == 'ignore' or k[0] == '_':
-                continue
-
-            elif k in source:  # validate the entry that exists
+        for k, spec in spec_items:
+            if k in source:  # validate the entry that exists
 
-                if isinstance(this_spec[k], dict):
+                if isinstance(spec, dict):
                     # This means we're looking for a list of dicts
 
                     final_list = list()
@@ -165,17 +195,17 @@ class ConfigValidator(object):
 
                 else:
                     processed_config[k] = self.validate_config_item(
-                        this_spec[k], item=source[k],
+                        spec, item=source[k],
                         validation_failure_info=(validation_failure_info, k))
 
             elif add_missing_keys:  # create the default entry
 
-                if isinstance(this_spec[k], dict):
+                if isinstance(spec, dict):
                     processed_config[k] = list()
 
                 else:
                     processed_config[k] = self.validate_config_item(
-                        this_spec[k],
+                        spec,
                         validation_failure_info=(
                             validation_failure_info, k))
 
@@ -184,6 +214,15 @@ class ConfigValidator(object):
     def validate_config_item(self, spec, validation_failure_info,
                              item='item not in config!@#', ):
         """Validate a config item."""
+        try:
+            validator = self._item_validators[spec]
+        except (KeyError, TypeError):
+            validator = self._compile_item_validator(spec, validation_failure_info)
+
+        return validator(item, validation_failure_info)
+
+    def _compile_item_validator(self, spec, validation_failure_info):
+        """Parse an item spec like "single|str|None" once and return a validator for it."""
         try:
             item_type, validation, default = spec.split('|')
         except (ValueError, AttributeError):
@@ -195,53 +234,43 @@ class ConfigValidator(object):
         elif not default:
             default = 'default required!@#'
 
-        if item == 'item not in config!@#':
-            if default == 'default required!@#':
-                raise ValueError('Required setting missing from config file. '
-                                 'Run with verbose logging and look for the last '
-                                 'ConfigProcessor entry above this line to see where the '
-                                 'problem is. {} {}'.format(spec,
-                                                            validation_failure_info))
-            else:
-                item = default
-
-        if item_type == 'single':
-            return self.validate_item(item, validation,
-                                      validation_failure_info)
-
-        elif item_type == 'list':
-            item_list = Util.string_to_list(item)
-
-            new_list = list()
-
-            for i in item_list:
-                new_list.append(self.validate_item(i, validation, validation_failure_info))
-
-            return new_list
+        if item_type not in ('single', 'list', 'set', 'dict'):
+            raise ConfigFileError("Invalid Type '{}' in config spec {}:{}".format(item_type,
+                                  validation_failure_info[0][0],
+                                  validation_failure_info[1]))
 
-        elif item_type == 'set':
-            item_set = set(Util.string_to_list(item))
+        validate_item = self._get_item_validator(validation, validation_failure_info)
 
-            new_set = set()
+        def validate(item, validation_failure_info):
+            if item == 'item not in config!@#':
+                if default == 'default required!@#':
+                    raise ValueError('Required setting missing from config file. '
+                                     'Run with verbose logging and look for the last '
+                                     'ConfigProcessor entry above this line to see where the '
+                                     'problem is. {} {}'.format(spec,
+                                                                validation_failure_info))
+                else:
+                    item = default
 
-            for i in item_set:
-                new_set.add(self.validate_item(i, validation, validation_failure_info))
+            if item_type == 'single':
+                return validate_item(item, validation_failure_info)
 
-            return new_set
+            elif item_type == 'list':
+                return [validate_item(i, validation_failure_info) for i in Util.string_to_list(item)]
 
-        elif item_type == 'dict':
-            item_dict = self.validate_item(item, validation,
-                                           validation_failure_info)
+            elif item_type == 'set':
+                return {validate_item(i, validation_failure_info) for i in set(Util.string_to_list(item))}
 
-            if not item_dict:
-                return dict()
             else:
-                return item_dict
+                item_dict = validate_item(item, validation_failure_info)
 
-        else:
-            raise ConfigFileError("Invalid Type '{}' in config spec {}:{}".format(item_type,
-                                  validation_failure_info[0][0],
-                                  validation_failure_info[1]))
+                if not item_dict:
+                    return dict()
+                else:
+                    return item_dict
+
+        self._item_validators[spec] = validate
+        return validate
 
     def check_for_invalid_sections(self, spec, config,
                                    validation_failure_info):
@@ -550,35 +579,47 @@ class ConfigValidator(object):
 
     def validate_item(self, item, validator, validation_failure_info):
         """Validate an item using a validator."""
+        return self._get_item_validator(validator, validation_failure_info)(item, validation_failure_info)
+
+    def _get_item_validator(self, validator, validation_failure_info):
+        """Return a function which validates an item for a validator string. Parsed once per validator string."""
         try:
-            if item.lower() == 'none':
-                item = None
-        except AttributeError:
+            return self._validators[validator]
+        except KeyError:
             pass
 
         if ':' in validator:
-            validator = validator.split(':')
+            validator_parts = validator.split(':')
             # item could be str, list, or list of dicts
-            item = Util.event_config_to_dict(item)
+            validate_key = self._get_item_validator(validator_parts[0], validation_failure_info)
+            validate_value = self._get_item_validator(validator_parts[1], validation_failure_info)
+
+            def validate(item, validation_failure_info):
+                item = Util.event_config_to_dict(self._convert_none_string(item))
 
-            return_dict = dict()
+                return_dict = dict()
 
-            for k, v in item.items():
-                return_dict[self.validate_item(k, validator[0],
-                                               validation_failure_info)] = (
-                    self.validate_item(v, validator[1],
-                                       validation_failure_info)
-                )
+                for k, v in item.items():
+                    return_dict[validate_key(k, validation_failure_info)] = (
+                        validate_value(v, validation_failure_info)
+                    )
 
-            return return_dict
+                return return_dict
 
-        elif '(' in validator and ')' in validator[-1:] == ')':
+        elif '(' in validator and validator[-1:] == ')':
             validator_parts = validator.split('(')
-            validator = validator_parts[0]
+            validator_func = self.validator_list[validator_parts[0]]
             param = validator_parts[1][:-1]
-            return self.validator_list[validator](item, validation_failure_info=validation_failure_info, param=param)
+
+            def validate(item, validation_failure_info):
+                return validator_func(self._convert_none_string(item), validation_failure_info=validation_failure_info,
+                                      param=param)
+
         elif validator in self.validator_list:
-            return self.validator_list[validator](item, validation_failure_info=validation_failure_info)
+            validator_func = self.validator_list[validator]
+
+            def validate(item, validation_failure_info):
+                return validator_func(self._convert_none_string(item), validation_failure_info=validation_failure_info)
 
         else:
             raise ConfigFileError("Invalid Validator '{}' in config spec {}:{}".format(
@@ -586,6 +627,20 @@ class ConfigValidator(object):
                                   validation_failure_info[0][0],
                                   validation_failure_info[1]))
 
+        self._validators[validator] = validate
+        return validate
+
+    @staticmethod
+    def _convert_none_string(item):
+        """Convert the string "none" to None."""
+        try:
+            if item.lower() == 'none':
+                return None
+        except AttributeError:
+            pass
+
+        return item
+
     @classmethod
     def validation_error(cls, item, validation_failure_info, msg=""):
         """Raise a validation error with all relevant infos."""
@@ -1,8 +1,12 @@
 """Contains the DataManager base class."""
 
+import ast
 import copy
+import math
 import os
 import errno
+import hashlib
+import time
 import _thread
 import threading
 
@@ -43,6 +47,30 @@ class DataManager(MpfController):
         self.data = dict()
         self._dirty = threading.Event()
 
+        # wait this long after the first change to write all changes at once
+        self._coalesce_secs = self.machine.config['mpf']['data_write_coalesce_ms'] / 1000
+
+        # stats which are sent to data_manager monitors
+        self.save_requests = 0
+        self.writes = 0
+        self.bytes_written = 0
+        self.total_write_latency = 0.0
+        self.last_write_latency = 0.0
+        self.max_write_latency = 0.0
+
+        # journal mode appends changes to <filename>.journal and only rewrites the file when compacting
+        self._journal = self.machine.config['mpf']['use_data_journal']
+        self._journal_max_records = self.machine.config['mpf']['data_journal_compact_records']
+        self._journal_records = 0
+        self._compact_needed = False
+        self._written_data = None
+        # keys changed by save_key and remove_key since the last write. None if the whole data has to be compared
+        self._changed_keys = set()
+        self._changed_keys_lock = threading.Lock()
+        # hash of the snapshot which the journal applies to. written as first record of the journal
+        self._snapshot_hash = None
+        self._journal_started = False
+
         if self.filename:
             self._setup_file()
 
@@ -61,15 +89,151 @@ class DataManager(MpfController):
             if exception.errno != errno.EEXIST:
                 raise
 
+    @property
+    def journal_file(self):
+        """Return the name of the journal file."""
+        return self.filename + ".journal"
+
+    def _find_file_in_other_format(self):
+        """Return a file with the same name but another extension (e.g. audits.yaml for audits.json) or None."""
+        try:
+            return FileManager.locate_file(os.path.splitext(self.filename)[0])
+        except FileNotFoundError:
+            return None
+
     def _load(self):
         self.debug_log("Loading %s from %s", self.name, self.filename)
-        if os.path.isfile(self.filename):
-            self.data = FileManager.load(self.filename, halt_on_error=False)
+        filename = self.filename
+        if not os.path.isfile(filename):
+            # the format might have been changed in mpf:paths. migrate the data from the old file
+            filename = self._find_file_in_other_format()
+
+        if filename:
+            self.data = FileManager.load(filename, halt_on_error=False)
 
         else:
             self.debug_log("Didn't find the %s file. No prob. We'll create "
                            "it when we save.", self.name)
 
+        if self._journal:
+            self._snapshot_hash = self._get_file_hash(filename)
+            self._replay_journal(filename + ".journal" if filename else self.journal_file)
+            self._written_data = copy.deepcopy(self.data)
+
+        if filename and filename != self.filename:
+            self.info_log("Migrating %s from %s to %s. The old file will not be used anymore.", self.name, filename,
+                          self.filename)
+            self._compact_needed = True
+            self._dirty.set()
+
+    def _replay_journal(self, journal_file):
+        """Apply all complete records from the journal to the data of the last snapshot.
+
+        The first record of the journal is the hash of the snapshot it was written for. If it does not match the
+        snapshot a crash or power loss happened while compacting and the snapshot already contains all records.
+        A record which is incomplete or cannot be parsed (e.g. because of a power loss while appending) ends the
+        replay. The next write will compact the journal to get rid of it.
+        """
+        try:
+            with open(journal_file, encoding='utf8') as f:
+                lines = f.readlines()
+        except FileNotFoundError:
+            return
+
+        if not lines:
+            return
+
+        try:
+            header = ast.literal_eval(lines[0]) if lines[0].endswith("\n") else None
+        except (ValueError, SyntaxError):
+            header = None
+
+        if isinstance(header, tuple) and len(header) == 2 and header[0] == "g":
+            if header[1] != self._snapshot_hash:
+                self.debug_log("Journal %s belongs to an older snapshot. Ignoring it.", journal_file)
+                self._compact_needed = True
+                return
+            self._journal_started = True
+            lines = lines[1:]
+        else:
+            # journal written without snapshot hash. replay it and start a new one
+            self._compact_needed = True
+
+        if not isinstance(self.data, dict):
+            self.data = dict()
+
+        for num, line in enumerate(lines):
+            try:
+                if not line.endswith("\n"):
+                    raise ValueError("Incomplete record")
+                self._apply_record(self.data, ast.literal_eval(line))
+            except (ValueError, SyntaxError, TypeError, IndexError) as e:
+                self.warning_log("Ignoring invalid record %s and all following records in %s: %s", num + 1,
+                                 journal_file, e)
+                self._compact_needed = True
+                break
+
+            self._journal_records += 1
+
+        self.debug_log("Replayed %s records from %s", self._journal_records, journal_file)
+
+    @staticmethod
+    def _apply_record(data: dict, record):
+        """Apply a set ('s', path, value) or delete ('d', path) record to data."""
+        operation, path = record[0], record[1]
+        if operation not in ("s", "d"):
+            raise ValueError("Unknown operation {}".format(operation))
+
+        parent = data
+        for key in path[:-1]:
+            if not isinstance(parent.get(key), dict):
+                if operation == "d":
+                    # nothing to delete
+                    return
+                parent[key] = dict()
+            parent = parent[key]
+
+        if operation == "s":
+            parent[path[-1]] = record[2]
+        else:
+            parent.pop(path[-1], None)
+
+    @classmethod
+    def _get_changes(cls, old: dict, new: dict, path: tuple, records: list):
+        """Add records for all differences between old and new to records."""
+        for key, value in new.items():
+            if key not in old:
+                records.append(("s", path + (key, ), value))
+            elif isinstance(value, dict) and isinstance(old[key], dict):
+                cls._get_changes(old[key], value, path + (key, ), records)
+            elif not cls._is_same_value(value, old[key]):
+                records.append(("s", path + (key, ), value))
+
+        for key in old:
+            if key not in new:
+                records.append(("d", path + (key, )))
+
+    @staticmethod
+    def _is_same_value(value, old_value) -> bool:
+        """Return true if value equals old_value and has the same type."""
+        # compare the exact type because True == 1 and 1.0 == 1 but they are written differently
+        # pylint: disable-msg=unidiomatic-typecheck
+        return type(value) is type(old_value) and value == old_value
+
+    @classmethod
+    def _is_literal(cls, value) -> bool:
+        """Return true if repr(value) can be read back with ast.literal_eval."""
+        if isinstance(value, (str, bytes, bool, int)) or value is None:
+            return True
+        if isinstance(value, float):
+            return math.isfinite(value)
+        if isinstance(value, (list, tuple)):
+            return all(cls._is_literal(item) for item in value)
+        if isinstance(value, dict):
+            return all(cls._is_literal(k) and cls._is_literal(v) for k, v in value.items())
+
+        return False
+
     def get_data(self, section=None):
         """Return the value of this DataManager's data.
 
@@ -104,11 +268,20 @@ class DataManager(MpfController):
                 occur when MPF is busy, so you can delay them by a few seconds
                 so they don't slow down MPF. Default is 0.
         """
+        if data:
+            self.data = data
+
+        # the changes are not known. compare the whole data
+        with self._changed_keys_lock:
+            self._changed_keys = None
+        self._save(delay_secs)
+
+    def _save(self, delay_secs):
+        """Write changes to disk after delay_secs."""
         self.debug_log("Will write %s to disk in %s sec(s)", self.name,
                        delay_secs)
 
-        if data:
-            self.data = data
+        self.save_requests += 1
 
         if delay_secs:
             self.machine.delay.add(callback=self._delayed_save_callback,
@@ -135,24 +308,176 @@ class DataManager(MpfController):
             # todo should we reload from disk here?
             self.data = dict()
             self.data[key] = value
+            with self._changed_keys_lock:
+                self._changed_keys = None
 
-        self.save_all(delay_secs=delay_secs)
+        self._add_changed_key(key)
+        self._save(delay_secs)
 
     def remove_key(self, key):
         """Remove key by name."""
         try:
             del self.data[key]
-            self.save_all()
         except KeyError:
-            pass
+            return
+
+        self._add_changed_key(key)
+        self._save(0)
+
+    def _add_changed_key(self, key):
+        with self._changed_keys_lock:
+            if self._changed_keys is not None:
+                self._changed_keys.add(key)
 
     def _writing_thread(self):  # pragma: no cover
         while not self.machine.thread_stopper.is_set():
             if not self._dirty.wait(1):
                 continue
-            self._dirty.clear()
 
-            data = copy.deepcopy(self.data)
+            # coalesce all changes in the window into one write. returns early on shutdown
+            if self._coalesce_secs:
+                self.machine.thread_stopper.wait(self._coalesce_secs)
+
+            self._write_pending()
+
+        # do not lose changes which came in during shutdown
+        if self._dirty.is_set():
+            self._write_pending()
+
+    def _write_pending(self):
+        """Write the current data and update stats."""
+        self._dirty.clear()
+        with self._changed_keys_lock:
+            changed_keys = self._changed_keys
+            self._changed_keys = set()
+
+        start = time.perf_counter()
+        if (self._journal and changed_keys is not None and not self._compact_needed and
+                isinstance(self.data, dict) and isinstance(self._written_data, dict)):
+            bytes_written = self._write_changed_keys(changed_keys)
+        else:
+            bytes_written = self._write_to_disk(copy.deepcopy(self.data))
+        latency = time.perf_counter() - start
+
+        self.writes += 1
+        self.bytes_written += bytes_written
+        self.total_write_latency += latency
+        self.last_write_latency = latency
+        self.max_write_latency = max(self.max_write_latency, latency)
+
+        if self.machine.monitors.get('data_manager'):
+            # monitors run in the main thread
+            self.machine.clock.loop.call_soon_threadsafe(self._notify_monitors)
+
+    def get_stats(self) -> dict:
+        """Return write stats of this DataManager."""
+        return {
+            "save_requests": self.save_requests,
+            "writes": self.writes,
+            "bytes_written": self.bytes_written,
+            "total_write_latency": self.total_write_latency,
+            "last_write_latency": self.last_write_latency,
+            "max_write_latency": self.max_write_latency,
+        }
+
+    def _notify_monitors(self):
+        for callback in self.machine.monitors.get('data_manager', []):
+            callback(name=self.name, **self.get_stats())
+
+    @staticmethod
+    def _get_file_size(filename) -> int:
+        try:
+            return os.path.getsize(filename)
+        except OSError:
+            return 0
+
+    @staticmethod
+    def _get_file_hash(filename):
+        try:
+            with open(filename, 'rb') as f:
+                return hashlib.sha1(f.read()).hexdigest()
+        except (OSError, TypeError):
+            return None
+
+    def _write_to_disk(self, data) -> int:
+        """Write data either to the journal or as a full file and return the number of bytes written."""
+        if not self._journal:
             self.debug_log("Writing %s to: %s", self.name, self.filename)
             # save data
-            FileManager.save(self.filename, data)
+            FileManager.save(self.filename, data, sync=True)
+            return self._get_file_size(self.filename)
+
+        records = []
+        if isinstance(data, dict) and isinstance(self._written_data, dict):
+            self._get_changes(self._written_data, data, (), records)
+        else:
+            self._compact_needed = True
+
+        if (self._compact_needed or self._journal_records + len(records) > self._journal_max_records or
+                not all(self._is_literal(record) for record in records)):
+            return self._compact_journal(data)
+
+        bytes_written = self._append_records(records)
+        self._written_data = data
+        return bytes_written
+
+    def _write_changed_keys(self, keys) -> int:
+        """Append records for keys changed by save_key and remove_key without comparing the whole data."""
+        records = []
+        for key in keys:
+            if key in self.data:
+                if key not in self._written_data or not self._is_same_value(self.data[key], self._written_data[key]):
+                    records.append(("s", (key, ), copy.deepcopy(self.data[key])))
+            elif key in self._written_data:
+                records.append(("d", (key, )))
+
+        if (self._journal_records + len(records) > self._journal_max_records or
+                not all(self._is_literal(record) for record in records)):
+            return self._compact_journal(copy.deepcopy(self.data))
+
+        bytes_written = self._append_records(records)
+        for record in records:
+            self._apply_record(self._written_data, record)
+        return bytes_written
+
+    def _append_records(self, records) -> int:
+        """Append records to the journal and return the number of bytes written."""
+        if not records:
+            return 0
+
+        self.debug_log("Appending %s records to: %s", len(records), self.journal_file)
+        journal_data = "".join(repr(record) + "\n" for record in records).encode()
+        if not self._journal_started:
+            journal_data = (repr(("g", self._snapshot_hash)) + "\n").encode() + journal_data
+        with open(self.journal_file, 'ab') as f:
+            f.write(journal_data)
+            f.flush()
+            os.fsync(f.fileno())
+        self._journal_records += len(records)
+        self._journal_started = True
+        return len(journal_data)
+
+    def _compact_journal(self, data):
+        """Write a full snapshot and truncate the journal.
+
+        After a crash between the two steps the journal still starts with the hash of the old snapshot and will be
+        ignored when loading.
+        """
+        self.debug_log("Compacting %s records into: %s", self._journal_records, self.filename)
+        FileManager.save(self.filename, data, sync=True)
+        self._snapshot_hash = self._get_file_hash(self.filename)
+        self._truncate_journal()
+
+        self._journal_records = 0
+        self._journal_started = False
+        self._compact_needed = False
+        self._written_data = data
+        return self._get_file_size(self.filename)
+
+    def _truncate_journal(self):
+        """Truncate the journal and flush it to disk."""
+        with open(self.journal_file, 'w', encoding='utf8') as f:
+            f.flush()
+            os.fsync(f.fileno())
+
+        FileManager.sync_directory(os.path.dirname(self.journal_file))
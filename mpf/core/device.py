@@ -3,6 +3,7 @@ import abc
 
 from typing import List, Any, TYPE_CHECKING
 
+from mpf.core.device_manager import DeviceCollection
 from mpf.core.machine import MachineController
 from mpf.core.logging import LogMixin
 
@@ -124,6 +125,11 @@ class Device(LogMixin, metaclass=abc.ABCMeta):
         self.tags = self.config['tags']
         self.label = self.config['label']
 
+        # tags and number may have changed
+        collection = getattr(self.machine, self.collection, None)
+        if isinstance(collection, DeviceCollection):
+            collection.invalidate_indexes()
+
     def __repr__(self):
         """Return string representation."""
         return '<{self.class_label}.{self.name}>'.format(self=self)
@@ -352,6 +352,11 @@ class DeviceCollection(CaseInsensitiveDict):
         self.name = collection
         self.config_section = config_section
 
+        # tag -> list of devices and number -> device. built on first use and
+        # invalidated when devices are added, removed or (re)configured
+        self._devices_by_tag = None
+        self._devices_by_number = None
+
     def __getattr__(self, attr):
         """Return device by lowercase key."""
         # We use this to allow the programmer to access a hardware item like
@@ -371,6 +376,48 @@ class DeviceCollection(CaseInsensitiveDict):
         """Return device by lowercase key."""
         return super().__getitem__(self.__class__.lower(key))
 
+    def __setitem__(self, key, value):
+        """Add device and invalidate indexes."""
+        super().__setitem__(key, value)
+        self.invalidate_indexes()
+
+    def __delitem__(self, key):
+        """Remove device and invalidate indexes."""
+        super().__delitem__(key)
+        self.invalidate_indexes()
+
+    def pop(self, key, *args, **kwargs):
+        """Remove device and invalidate indexes."""
+        self.invalidate_indexes()
+        return super().pop(key, *args, **kwargs)
+
+    def invalidate_indexes(self):
+        """Invalidate tag and number index.
+
+        Called when devices are added or removed and when a device loads its config.
+        """
+        self._devices_by_tag = None
+        self._devices_by_number = None
+
+    def _get_devices_by_tag(self):
+        if self._devices_by_tag is None:
+            self._devices_by_tag = dict()
+            for item in self:
+                for tag in set(item.tags):
+                    self._devices_by_tag.setdefault(tag, []).append(item)
+
+        return self._devices_by_tag
+
+    def _get_devices_by_number(self):
+        if self._devices_by_number is None:
+            self._devices_by_number = dict()
+            for item in self:
+                number = item.config.get('number')
+                if number is not None:
+                    self._devices_by_number.setdefault(number, item)
+
+        return self._devices_by_number
+
     def items_tagged(self, tag):
         """Return of list of device objects which have a certain tag.
 
@@ -381,11 +428,7 @@ class DeviceCollection(CaseInsensitiveDict):
             A list of device objects. If no devices are found with that tag, it
             will return an empty list.
         """
-        output = []
-        for item in self:
-            if tag in item.tags:
-                output.append(item)
-        return output
+        return list(self._get_devices_by_tag().get(tag, []))
 
     def sitems_tagged(self, tag):
         """Return of list of device names (strings) which have a certain tag.
@@ -397,11 +440,7 @@ class DeviceCollection(CaseInsensitiveDict):
             A list of string names of devices. If no devices are found with
             that tag, it will return an empty list.
         """
-        output = []
-        for item in self:
-            if tag in item.tags:
-                output.append(item.name)
-        return output
+        return [item.name for item in self._get_devices_by_tag().get(tag, [])]
 
     def items_not_tagged(self, tag):
         """Return of list of device objects which do not have a certain tag.
@@ -414,11 +453,8 @@ class DeviceCollection(CaseInsensitiveDict):
             A list of device objects. If no devices are found with that tag, it
             will return an empty list.
         """
-        output = []
-        for item in self:
-            if tag not in item.tags:
-                output.append(item)
-        return output
+        tagged = set(self._get_devices_by_tag().get(tag, []))
+        return [item for item in self if item not in tagged]
 
     def is_valid(self, name):
         """Check to see if the name passed is a valid device.
@@ -433,9 +469,7 @@ class DeviceCollection(CaseInsensitiveDict):
 
     def number(self, number):
         """Return a device object based on its number."""
-        for name, obj in self.items():
-            if obj.config['number'] == number:
-                return self[name]
+        return self._get_devices_by_number().get(number)
 
     def multilist_to_names(self, multilist):
         """Convert list of devices to string list.
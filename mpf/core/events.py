@@ -1,13 +1,14 @@
 """Classes for the EventManager and QueuedEvents."""
 import inspect
 from collections import deque, namedtuple
+from contextlib import contextmanager
 import uuid
 
 import asyncio
 from functools import partial
 from unittest.mock import MagicMock
 
-from typing import Dict, Any, TYPE_CHECKING, Tuple, Optional, Generator, Callable, List
+from typing import Dict, Any, TYPE_CHECKING, Tuple, Optional, Generator, Callable, List, Set, Iterable
 
 from mpf.core.mpf_controller import MpfController
 
@@ -30,6 +31,13 @@ class EventManager(MpfController):
         super().__init__(machine)
 
         self.registered_handlers = {}       # type: Dict[str, List[RegisteredHandler]]
+        self._handler_snapshots = {}        # type: Dict[str, Tuple[RegisteredHandler, ...]]
+        self._transaction_depth = 0
+        self._unsorted_events = set()       # type: Set[str]
+        self._pending_removals = {}         # type: Dict[str, Set[uuid.UUID]]
+        self._handlers_by_key = {}          # type: Dict[uuid.UUID, RegisteredHandler]
+        self._keys_by_callback = {}         # type: Dict[Any, Set[EventHandlerKey]]
+        self._unhashable_callback_keys = set()  # type: Set[EventHandlerKey]
         self.event_queue = deque([])        # type: Deque[PostedEvent]
         self.callback_queue = deque([])     # type: Deque[Tuple[Any, dict]]
         self.monitor_events = False
@@ -127,7 +135,9 @@ class EventManager(MpfController):
         if hasattr(handler, "relative_priority") and not isinstance(handler, MagicMock):
             priority += handler.relative_priority
 
-        self.registered_handlers[event].append(RegisteredHandler(handler, priority, kwargs, key, condition))
+        registered_handler = RegisteredHandler(handler, priority, kwargs, key, condition)
+        self.registered_handlers[event].append(registered_handler)
+        self._add_to_index(event, registered_handler)
 
         try:
             self.debug_log("Registered %s as a handler for '%s', priority: %s, "
@@ -136,15 +146,74 @@ class EventManager(MpfController):
         except IndexError:
             pass
 
-        # Sort the handlers for this event based on priority. We do it now
-        # so the list is pre-sorted so we don't have to do that with each
-        # event post.
-        self.registered_handlers[event].sort(key=lambda x: x.priority, reverse=True)
+        self._handler_snapshots.pop(event, None)
 
-        self._verify_handlers(event, self.registered_handlers[event])
+        if self._transaction_depth:
+            # sort once when the transaction ends
+            self._unsorted_events.add(event)
+        else:
+            # Sort the handlers for this event based on priority. We do it now
+            # so the list is pre-sorted so we don't have to do that with each
+            # event post.
+            self.registered_handlers[event].sort(key=lambda x: x.priority, reverse=True)
+
+            self._verify_handlers(event, self.registered_handlers[event])
 
         return EventHandlerKey(key, event)
 
+    @contextmanager
+    def handler_transaction(self):
+        """Batch multiple handler registrations and removals.
+
+        Inside the transaction ``add_handler`` does not sort the handlers of
+        the event and ``remove_handler_by_key`` does not touch the handler
+        list. Both are done once per affected event when the outermost
+        transaction ends. Use this when adding or removing lots of handlers
+        at once (e.g. when a mode starts or stops).
+
+        Events processed during the transaction will still see the correct
+        handlers.
+
+        For example:
+
+        .. code::
+
+            with self.machine.events.handler_transaction():
+                for event in events:
+                    keys.append(self.machine.events.add_handler(event, self.test))
+
+        """
+        self._transaction_depth += 1
+        try:
+            yield
+        finally:
+            self._transaction_depth -= 1
+            if not self._transaction_depth:
+                for event in self._unsorted_events | set(self._pending_removals.keys()):
+                    self._commit_handler_changes(event)
+
+    def _commit_handler_changes(self, event: str) -> None:
+        """Apply pending removals and sort the handlers of an event."""
+        removed_keys = self._pending_removals.pop(event, None)
+        unsorted = event in self._unsorted_events
+        self._unsorted_events.discard(event)
+
+        if event not in self.registered_handlers:
+            return
+
+        self._handler_snapshots.pop(event, None)
+
+        if removed_keys:
+            self.registered_handlers[event][:] = [handler for handler in self.registered_handlers[event]
+                                                  if handler.key not in removed_keys]
+            self.debug_log("Removed %s handlers from event %s", len(removed_keys), event)
+
+        if unsorted:
+            self.registered_handlers[event].sort(key=lambda x: x.priority, reverse=True)
+            self._verify_handlers(event, self.registered_handlers[event])
+
+        self._remove_event_if_empty(event)
+
     def _verify_handlers(self, event, sorted_handlers):
         """Verify that no races can happen."""
         if not sorted_handlers:
@@ -205,36 +274,56 @@ class EventManager(MpfController):
         # remove it.
         event = event.lower()
 
-        if event in self.registered_handlers:
-            if kwargs:
-                # slice the full list [:] to make a copy so we can delete from the
-                # original while iterating
-                for rh in self.registered_handlers[event][:]:
-                    if rh[0] == handler and rh[2] == kwargs:
-                        self.registered_handlers[event].remove(rh)
-            else:
-                for rh in self.registered_handlers[event][:]:
-                    if rh[0] == handler:
-                        self.registered_handlers[event].remove(rh)
+        for key in self._get_keys_for_callback(handler):
+            if key.event == event and (not kwargs or self._handlers_by_key[key.key].kwargs == kwargs):
+                self.remove_handler_by_key(key)
 
         return self.add_handler(event, handler, priority, **kwargs)
 
+    def _add_to_index(self, event: str, handler: RegisteredHandler) -> None:
+        """Add a handler to the key and callback indexes used for removal."""
+        self._handlers_by_key[handler.key] = handler
+        key = EventHandlerKey(handler.key, event)
+        try:
+            self._keys_by_callback.setdefault(handler.callback, set()).add(key)
+        except TypeError:
+            # callback cannot be hashed (e.g. method of an object with __eq__ but without __hash__)
+            self._unhashable_callback_keys.add(key)
+
+    def _remove_from_index(self, event: str, handler: RegisteredHandler) -> None:
+        """Remove a handler from the key and callback indexes."""
+        del self._handlers_by_key[handler.key]
+        key = EventHandlerKey(handler.key, event)
+        try:
+            keys = self._keys_by_callback.get(handler.callback)
+        except TypeError:
+            self._unhashable_callback_keys.discard(key)
+            return
+
+        keys.discard(key)
+        if not keys:
+            del self._keys_by_callback[handler.callback]
+
+    def _get_keys_for_callback(self, callback: Any) -> List[EventHandlerKey]:
+        """Return the keys of all registrations of a callback."""
+        try:
+            keys = list(self._keys_by_callback.get(callback, []))
+        except TypeError:
+            keys = []
+
+        if self._unhashable_callback_keys:
+            keys.extend(key for key in self._unhashable_callback_keys
+                        if self._handlers_by_key[key.key].callback == callback)
+        return keys
+
     def remove_handler(self, method: Any) -> None:
         """Remove an event handler from all events a method is registered to handle.
 
         Args:
             method : The method whose handlers you want to remove.
         """
-        events_to_delete_if_empty = []
-        for event, handler_list in self.registered_handlers.items():
-            for handler_tup in handler_list[:]:  # copy via slice
-                if handler_tup[0] == method:
-                    handler_list.remove(handler_tup)
-                    self.debug_log("Removing method %s from event %s", (str(method).split(' '))[2], event)
-                    events_to_delete_if_empty.append(event)
-
-        for event in events_to_delete_if_empty:
-            self._remove_event_if_empty(event)
+        for key in self._get_keys_for_callback(method):
+            self.remove_handler_by_key(key)
 
     def remove_handler_by_event(self, event: str, handler: Any) -> None:
         """Remove the handler you pass from the event you pass.
@@ -252,16 +341,9 @@ class EventManager(MpfController):
         """
         event = event.lower()
 
-        events_to_delete_if_empty = []
-        if event in self.registered_handlers:
-            for handler_tup in self.registered_handlers[event][:]:
-                if handler_tup[0] == handler:
-                    self.registered_handlers[event].remove(handler_tup)
-                    self.debug_log("Removing method %s from event %s", (str(handler).split(' '))[2], event)
-                    events_to_delete_if_empty.append(event)
-
-        for event in events_to_delete_if_empty:
-            self._remove_event_if_empty(event)
+        for key in self._get_keys_for_callback(handler):
+            if key.event == event:
+                self.remove_handler_by_key(key)
 
     def remove_handler_by_key(self, key: EventHandlerKey) -> None:
         """Remove a registered event handler by key.
@@ -269,25 +351,32 @@ class EventManager(MpfController):
         Args:
             key: The key of the handler you want to remove
         """
-        if key.event not in self.registered_handlers:
+        handler = self._handlers_by_key.get(key.key)
+        if not handler:
+            # already removed
+            return
+
+        self._remove_from_index(key.event, handler)
+        self._handler_snapshots.pop(key.event, None)
+
+        if self._transaction_depth:
+            # remove from the handler list when the transaction ends
+            self._pending_removals.setdefault(key.event, set()).add(key.key)
             return
-        events_to_delete_if_empty = []
-        for handler_tup in self.registered_handlers[key.event][:]:  # copy via slice
-            if handler_tup.key == key.key:
-                self.registered_handlers[key.event].remove(handler_tup)
-                self.debug_log("Removing method %s from event %s", (str(handler_tup[0]).split(' '))[2], key.event)
-                events_to_delete_if_empty.append(key.event)
-        for event in events_to_delete_if_empty:
-            self._remove_event_if_empty(event)
-
-    def remove_handlers_by_keys(self, key_list: List[EventHandlerKey]) -> None:
+
+        self.registered_handlers[key.event].remove(handler)
+        self.debug_log("Removing method %s from event %s", handler.callback, key.event)
+        self._remove_event_if_empty(key.event)
+
+    def remove_handlers_by_keys(self, key_list: Iterable[EventHandlerKey]) -> None:
         """Remove multiple event handlers based on a passed list of keys.
 
         Args:
             key_list: A list of keys of the handlers you want to remove
         """
-        for key in key_list:
-            self.remove_handler_by_key(key)
+        with self.handler_transaction():
+            for key in key_list:
+                self.remove_handler_by_key(key)
 
     def _remove_event_if_empty(self, event: str) -> None:
         # Checks to see if the event doesn't have any more registered handlers,
@@ -298,6 +387,7 @@ class EventManager(MpfController):
 
         if not self.registered_handlers[event]:  # if value is empty list
             del self.registered_handlers[event]
+            self._handler_snapshots.pop(event, None)
             self.debug_log("Removing event %s since there are no more"
                            " handlers registered for it", event)
 
@@ -334,7 +424,40 @@ class EventManager(MpfController):
         Returns:
             True or False
         """
-        return event_name.lower() in self.registered_handlers
+        event_name = event_name.lower()
+        if event_name in self._pending_removals:
+            self._commit_handler_changes(event_name)
+        return event_name in self.registered_handlers
+
+    def _get_handlers(self, event: str) -> Tuple[RegisteredHandler, ...]:
+        """Return an immutable snapshot of the sorted handlers for an event.
+
+        The snapshot is cached until the handlers of the event change. Since
+        it cannot change, handlers added or removed while an event is
+        processed will not affect the running dispatch.
+        """
+        try:
+            return self._handler_snapshots[event]
+        except KeyError:
+            if event in self._unsorted_events or event in self._pending_removals:
+                # events may be processed during a transaction
+                self._commit_handler_changes(event)
+            snapshot = tuple(self.registered_handlers.get(event, []))
+            self._handler_snapshots[event] = snapshot
+            return snapshot
+
+    @staticmethod
+    def _merge_kwargs(kwargs: dict, handler: RegisteredHandler) -> dict:
+        """Merge the post's kwargs with the registered handler's kwargs.
+
+        In case of conflict, handler kwargs will win. If the handler has no
+        kwargs the post's kwargs are returned as they are (without copying).
+        """
+        if not handler.kwargs:
+            return kwargs
+        merged_kwargs = kwargs.copy()
+        merged_kwargs.update(handler.kwargs)
+        return merged_kwargs
 
     @staticmethod
     def _set_result(_future, **kwargs):
@@ -534,13 +657,13 @@ class EventManager(MpfController):
             return
 
         # Now let's call the handlers one-by-one, including any kwargs
-        for handler in self.registered_handlers[event][:]:
-            # use slice above so we don't process new handlers that came
-            # in while we were processing previous handlers
+        for handler in self._get_handlers(event):
+            # the snapshot will not change so we don't process new handlers
+            # that came in while we were processing previous handlers
 
             # merge the post's kwargs with the registered handler's kwargs
             # in case of conflict, handlers kwargs will win
-            merged_kwargs = dict(list(kwargs.items()) + list(handler.kwargs.items()))
+            merged_kwargs = self._merge_kwargs(kwargs, handler)
 
             # if condition exists and is not true skip
             if handler.condition is not None and not handler.condition.evaluate(merged_kwargs):
@@ -557,9 +680,11 @@ class EventManager(MpfController):
 
             # call the handler and save the results
 
-            try:
+            if 'queue' in merged_kwargs:
+                # do not modify the kwargs of the post
+                merged_kwargs = merged_kwargs.copy()
                 queue = merged_kwargs.pop('queue')
-            except KeyError:
+            else:
                 queue = QueuedEvent(self.debug_log)
 
             handler.callback(queue=queue, **merged_kwargs)
@@ -577,13 +702,13 @@ class EventManager(MpfController):
     def _run_handlers(self, event: str, ev_type: Optional[str], kwargs: dict) -> Any:
         """Run all handlers for an event."""
         result = None
-        for handler in self.registered_handlers[event][:]:
-            # use slice above so we don't process new handlers that came
-            # in while we were processing previous handlers
+        for handler in self._get_handlers(event):
+            # the snapshot will not change so we don't process new handlers
+            # that came in while we were processing previous handlers
 
             # merge the post's kwargs with the registered handler's kwargs
             # in case of conflict, handler kwargs will win
-            merged_kwargs = dict(list(kwargs.items()) + list(handler.kwargs.items()))
+            merged_kwargs = self._merge_kwargs(kwargs, handler)
 
             # if condition exists and is not true skip
             if handler.condition is not None and not handler.condition.evaluate(merged_kwargs):
@@ -171,8 +171,12 @@ class FileManager(object):
         return config
 
     @staticmethod
-    def save(filename, data):
-        """Save data to file."""
+    def save(filename, data, sync=False):
+        """Save data to file.
+
+        The data is written to a temp file which replaces the file afterwards. If sync is True the temp file and the
+        directory are flushed to disk so the new file survives a power loss once this returns.
+        """
         ext = os.path.splitext(filename)[1]
 
         # save to temp file and move afterwards. prevents broken files
@@ -183,5 +187,32 @@ class FileManager(object):
         except KeyError:
             raise AssertionError("No config file processor available for file type {}".format(ext))
 
+        if sync:
+            FileManager._sync(temp_file, os.O_RDONLY)
+
         # move temp file
         os.replace(temp_file, filename)
+
+        if sync:
+            # persist the rename
+            FileManager.sync_directory(os.path.dirname(filename))
+
+    @staticmethod
+    def sync_directory(path):
+        """Flush a directory to disk (not supported on Windows)."""
+        if hasattr(os, "O_DIRECTORY"):
+            FileManager._sync(path or ".", os.O_RDONLY | os.O_DIRECTORY)
+
+    @staticmethod
+    def _sync(path, flags):
+        """Flush a file or directory to disk."""
+        try:
+            fd = os.open(path, flags)
+        except OSError as e:
+            FileManager.log.warning("Could not open %s to sync it: %s", path, e)
+            return
+
+        try:
+            os.fsync(fd)
+        finally:
+            os.close(fd)
@@ -1,6 +1,6 @@
 """Handles all light updates."""
 import asyncio
-from typing import Dict
+from typing import Dict, Callable, Tuple, TYPE_CHECKING
 
 from mpf.core.machine import MachineController
 from mpf.core.settings_controller import SettingEntry
@@ -9,6 +9,11 @@ from mpf.core.rgb_color import RGBColorCorrectionProfile, RGBColor
 
 from mpf.core.mpf_controller import MpfController
 
+if TYPE_CHECKING:   # pragma: no cover
+    from mpf.core.clock import PeriodicTask
+    from mpf.devices.light import Light
+    from mpf.platforms.interfaces.light_platform_interface import LightPlatformInterface
+
 
 class LightController(MpfController):
 
@@ -26,6 +31,12 @@ class LightController(MpfController):
 
         self._monitor_update_task = None                    # type: asyncio.Task
 
+        # lights with fades which the hardware cannot complete in one step.
+        # maps light -> channel -> (next update time, color_and_fade_callback)
+        self._fading_lights = dict()    # type: Dict[Light, Dict[LightPlatformInterface, Tuple[float, Callable]]]
+        self._fade_task = None          # type: PeriodicTask
+        self._fade_interval = 1 / self.machine.config['mpf']['default_light_hw_update_hz']
+
         if 'named_colors' in self.machine.config:
             self._load_named_colors()
 
@@ -70,6 +81,54 @@ class LightController(MpfController):
         self.machine.settings.add_setting(SettingEntry("brightness", "Brightness", 100, "brightness", 1.0,
                                                        {0.25: "25%", 0.5: "50%", 0.75: "75%", 1.0: "100% (default)"}))
 
+    def schedule_fades(self, light: "Light", channels: Dict["LightPlatformInterface", Callable]):
+        """Continue the fades of a light in the shared fade loop.
+
+        Args:
+            light: The light which is fading.
+            channels: Dict of channel -> color_and_fade_callback for all channels which could not complete their fade
+                in one step. Replaces all fades which are in progress for this light. Pass an empty dict to stop
+                fading.
+        """
+        if not channels:
+            self._fading_lights.pop(light, None)
+            return
+
+        now = self.machine.clock.get_time()
+        self._fading_lights[light] = {channel: (now + channel.get_fade_interval_ms() / 1000, callback)
+                                      for channel, callback in channels.items()}
+
+        if not self._fade_task:
+            self._fade_task = self.machine.clock.schedule_interval(self._update_fades, self._fade_interval)
+
+    def _update_fades(self):
+        """Update all fading channels which would be late on the next tick and sync their platforms once."""
+        now = self.machine.clock.get_time()
+        due_time = now + self._fade_interval
+        platforms = set()
+        for light, channels in list(self._fading_lights.items()):
+            updated = False
+            for channel, (next_update, callback) in list(channels.items()):
+                if next_update >= due_time:
+                    continue
+                updated = True
+                if channel.set_fade(callback):
+                    channels[channel] = (now + channel.get_fade_interval_ms() / 1000, callback)
+                else:
+                    del channels[channel]
+
+            if updated:
+                platforms.update(light.platforms)
+            if not channels:
+                del self._fading_lights[light]
+
+        for platform in platforms:
+            platform.light_sync()
+
+        if not self._fading_lights:
+            self._fade_task.cancel()
+            self._fade_task = None
+
     def monitor_lights(self):
         """Update the color of lights for the monitor."""
         if not self._monitor_update_task:
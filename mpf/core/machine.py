@@ -15,11 +15,12 @@ import copy
 import asyncio
 
 from pkg_resources import iter_entry_points
-from typing import Any, TYPE_CHECKING, Callable, Dict, List, Set, Generator
+from typing import Any, TYPE_CHECKING, Callable, Dict, List, Set, Generator, Optional
 
 from mpf._version import __version__, version as mpf_version, extended_version as mpf_extended_version
 from mpf.core.case_insensitive_dict import CaseInsensitiveDict
 from mpf.core.clock import ClockBase
+from mpf.core.config_cache import ConfigFileCache
 from mpf.core.config_processor import ConfigProcessor
 from mpf.core.config_validator import ConfigValidator
 from mpf.core.data_manager import DataManager
@@ -143,6 +144,10 @@ class MachineController(LogMixin):
 
         self.config_validator = ConfigValidator(self)
 
+        self.config_file_cache = None   # type: ConfigFileCache
+        if not self.options['no_load_cache']:
+            self.config_file_cache = ConfigFileCache(self._get_mpfcache_file_name() + "-files")
+
         self._load_config()
         self.machine_config = self.config       # type: Any
         self.configure_logging(
@@ -382,21 +387,30 @@ class MachineController(LogMixin):
         result = os.path.join(cache_dir, path_hash)
         return result
 
+    def _get_mpfcache_manifest_file_name(self):
+        return self._get_mpfcache_file_name() + "-manifest"
+
     def _load_config(self) -> None:     # pragma: no cover
         if self.options['no_load_cache']:
             load_from_cache = False
         else:
             try:
-                if self._get_latest_config_mod_time() > os.path.getmtime(self._get_mpfcache_file_name()):
-                    load_from_cache = False  # config is newer
-                else:
-                    load_from_cache = True  # cache is newer
-
+                cache_time = os.path.getmtime(self._get_mpfcache_file_name())
             except OSError as exception:
                 if exception.errno != errno.ENOENT:
                     raise  # some unknown error?
                 else:
-                    load_from_cache = False  # cache file doesn't exist
+                    cache_time = None  # cache file doesn't exist
+
+            if cache_time is None:
+                load_from_cache = False
+            else:
+                manifest = self._load_config_cache_manifest()
+                if manifest is not None:
+                    # only check the files which were used to build the cache
+                    load_from_cache = ConfigFileCache.check_manifest(manifest)
+                else:
+                    load_from_cache = self._get_latest_config_mod_time() <= cache_time
 
         config_loaded = False
         if load_from_cache:
@@ -423,7 +437,8 @@ class MachineController(LogMixin):
             self.config = Util.dict_merge(self.config,
                                           ConfigProcessor.load_config_file(
                                               config_file,
-                                              config_type='machine'))
+                                              config_type='machine',
+                                              file_cache=self.config_file_cache))
 
         if self.options['create_config_cache']:
             self._cache_config()
@@ -431,7 +446,8 @@ class MachineController(LogMixin):
     def _get_mpf_config(self) -> dict:
         """Return mpf config dict."""
         return ConfigProcessor.load_config_file(self.options['mpfconfigfile'],
-                                                config_type='machine')
+                                                config_type='machine',
+                                                file_cache=self.config_file_cache)
 
     def _load_config_from_cache(self) -> bool:
         """Return true if config was loaded from cache."""
@@ -455,6 +471,23 @@ class MachineController(LogMixin):
 
             return True
 
+    def _load_config_cache_manifest(self) -> Optional[dict]:
+        """Return the manifest of the config files in the cache or None if there is no valid manifest."""
+        try:
+            with open(self._get_mpfcache_manifest_file_name(), 'rb') as f:
+                version, manifest = pickle.load(f)
+        except FileNotFoundError:
+            return None
+        # pylint: disable-msg=broad-except
+        except Exception:   # pragma: no cover
+            self.log.warning("Could not load config cache manifest")
+            return None
+
+        if version != __version__ or not manifest:
+            return None
+
+        return manifest
+
     def _get_latest_config_mod_time(self) -> float:
         """Return last modification time of the config file."""
         latest_time = os.path.getmtime(self.options['mpfconfigfile'])
@@ -479,6 +512,20 @@ class MachineController(LogMixin):
             pickle.dump(self.config, f, protocol=4)
             self.log.info('Config file cache created: %s', self._get_mpfcache_file_name())
 
+        # remember which files were used to build the cache (and only those). without a file cache we do not know
+        # them and remove an old manifest to fall back to a scan of the config folder
+        manifest_file = self._get_mpfcache_manifest_file_name()
+        if self.config_file_cache:
+            with open(manifest_file, 'wb') as f:
+                pickle.dump((__version__, self.config_file_cache.get_manifest()), f, protocol=4)
+        elif os.path.isfile(manifest_file):
+            os.remove(manifest_file)
+
+    def _save_config_file_cache(self) -> None:
+        """Write parsed config and show files to the file cache."""
+        if self.config_file_cache and self.options['create_config_cache']:
+            self.config_file_cache.save()
+
     def verify_system_info(self):
         """Dump information about the Python installation to the log.
 
@@ -715,6 +762,7 @@ class MachineController(LogMixin):
         self.thread_stopper.set()
         self.device_manager.stop_devices()
         self._platform_stop()
+        self._save_config_file_cache()
 
         self.clock.loop.stop()
 
@@ -934,4 +982,5 @@ class MachineController(LogMixin):
         '''
 
         ConfigValidator.unload_config_spec()
+        self._save_config_file_cache()
         yield from self.reset()
@@ -183,34 +183,36 @@ class Mode(LogMixin):
 
         self.start_event_kwargs = kwargs
 
-        self._add_mode_devices()
+        # register all handlers in one batch
+        with self.machine.events.handler_transaction():
+            self._add_mode_devices()
 
-        self.debug_log("Registering mode_stop handlers")
+            self.debug_log("Registering mode_stop handlers")
 
-        # register mode stop events
-        if 'stop_events' in self.config['mode']:
+            # register mode stop events
+            if 'stop_events' in self.config['mode']:
 
-            for event in self.config['mode']['stop_events']:
-                # stop priority is +1 so if two modes of the same priority
-                # start and stop on the same event, the one will stop before
-                # the other starts
-                self.add_mode_event_handler(event=event, handler=self.stop,
-                                            priority=self.config['mode']['stop_priority'] + 1)
+                for event in self.config['mode']['stop_events']:
+                    # stop priority is +1 so if two modes of the same priority
+                    # start and stop on the same event, the one will stop before
+                    # the other starts
+                    self.add_mode_event_handler(event=event, handler=self.stop,
+                                                priority=self.config['mode']['stop_priority'] + 1)
 
-        self.start_callback = callback
+            self.start_callback = callback
 
-        self.debug_log("Calling mode_start handlers")
+            self.debug_log("Calling mode_start handlers")
 
-        for item in self.machine.mode_controller.start_methods:
-            if item.config_section in self.config or not item.config_section:
-                self.stop_methods.append(
-                    item.method(config=self.config.get(item.config_section,
-                                                       self.config),
-                                priority=self.priority,
-                                mode=self,
-                                **item.kwargs))
+            for item in self.machine.mode_controller.start_methods:
+                if item.config_section in self.config or not item.config_section:
+                    self.stop_methods.append(
+                        item.method(config=self.config.get(item.config_section,
+                                                           self.config),
+                                    priority=self.priority,
+                                    mode=self,
+                                    **item.kwargs))
 
-        self._setup_device_control_events()
+            self._setup_device_control_events()
 
         self.machine.events.post_queue(event='mode_' + self.name + '_starting',
                                        callback=self._started)
@@ -315,12 +317,14 @@ class Mode(LogMixin):
         self.active = False
         self.stopping = False
 
-        for callback in self.machine.mode_controller.stop_methods:
-            callback[0](self)
+        # remove all handlers of the players in one batch
+        with self.machine.events.handler_transaction():
+            for callback in self.machine.mode_controller.stop_methods:
+                callback[0](self)
 
-        for item in self.stop_methods:
-            if item:
-                item[0](item[1])
+            for item in self.stop_methods:
+                if item:
+                    item[0](item[1])
 
         self.stop_methods = list()
 
@@ -538,8 +542,7 @@ class Mode(LogMixin):
         return key
 
     def _remove_mode_event_handlers(self) -> None:
-        for key in self.event_handlers:
-            self.machine.events.remove_handler_by_key(key)
+        self.machine.events.remove_handlers_by_keys(self.event_handlers)
         self.event_handlers = set()
 
     def _remove_mode_switch_handlers(self) -> None:
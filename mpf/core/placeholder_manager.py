@@ -3,12 +3,14 @@ import ast
 import operator as op
 import abc
 import re
-from typing import TYPE_CHECKING
+from typing import TYPE_CHECKING, Dict, List, Set
 
 from mpf.core.mpf_controller import MpfController
 
 if TYPE_CHECKING:   # pragma: no cover
     from mpf.core.machine import MachineController
+    from mpf.core.events import EventHandlerKey
+    import asyncio
 
 # supported operators
 operators = {ast.Add: op.add, ast.Sub: op.sub, ast.Mult: op.mul,
@@ -29,6 +31,7 @@ class BaseTemplate(metaclass=abc.ABCMeta):
         self.template = template
         self.placeholder_manager = placeholder_manger
         self.default_value = default_value
+        self._compiled_template = placeholder_manger.compile_template(template)
 
     @abc.abstractmethod
     def evaluate(self, parameters, fail_on_missing_params=False):
@@ -43,7 +46,7 @@ class BoolTemplate(BaseTemplate):
     def evaluate(self, parameters, fail_on_missing_params=False):
         """Evaluate template to bool."""
         try:
-            result = self.placeholder_manager.evaluate_template(self.template, parameters)
+            result = self._compiled_template(parameters)
         except ValueError:
             if fail_on_missing_params:
                 raise
@@ -58,7 +61,7 @@ class FloatTemplate(BaseTemplate):
     def evaluate(self, parameters, fail_on_missing_params=False):
         """Evaluate template to float."""
         try:
-            result = self.placeholder_manager.evaluate_template(self.template, parameters)
+            result = self._compiled_template(parameters)
         except ValueError:
             if fail_on_missing_params:
                 raise
@@ -73,7 +76,7 @@ class IntTemplate(BaseTemplate):
     def evaluate(self, parameters, fail_on_missing_params=False):
         """Evaluate template to float."""
         try:
-            result = self.placeholder_manager.evaluate_template(self.template, parameters)
+            result = self._compiled_template(parameters)
         except ValueError:
             if fail_on_missing_params:
                 raise
@@ -98,101 +101,126 @@ class NativeTypeTemplate:
 
 class TextTemplate:
 
+    """Text with placeholders for player and machine variables.
+
+    The text is split into literal and variable segments once. While changes
+    are monitored, only segments whose variables changed are evaluated again
+    and the change callback is called at most once per loop iteration.
+    """
+
     var_finder = re.compile("(?<=\()[a-zA-Z_0-9|]+(?=\))")
     string_finder = re.compile("(?<=\$)[a-zA-Z_0-9]+")
+    segment_splitter = re.compile(r"\(([a-zA-Z_0-9|]+)\)")
 
     def __init__(self, machine: "MachineController", text: str) -> None:
         self.machine = machine
         self.text = text
         self.vars = self.var_finder.findall(text)
         self._change_callback = None
+        self._change_handle = None      # type: asyncio.Handle
+        self._handler_keys = []         # type: List[EventHandlerKey]
+        # literal text at even and variable names at odd indices
+        self._segments = self.segment_splitter.split(text)
+        self._values = list(self._segments)
+        self._variable_segments = set(range(1, len(self._segments), 2))
+        self._dirty_segments = set(self._variable_segments)
 
     def evaluate(self) -> str:
         """Evaluate placeholder to string."""
-        return self._evaluate_text()
+        if self._change_callback:
+            # only segments which changed since the last evaluation
+            dirty_segments = self._dirty_segments
+        else:
+            dirty_segments = self._variable_segments
+
+        for index in dirty_segments:
+            self._values[index] = self._evaluate_variable(self._segments[index])
+        self._dirty_segments = set()
+
+        return "".join(self._values)
 
     def monitor_changes(self, callback):
         """Monitor variables for changes and call callback on changes."""
         self._change_callback = callback
+        self._dirty_segments = set(self._variable_segments)
         self._setup_variable_monitors()
 
     def stop_monitor(self):
         """Stop monitoring for changes."""
         self._change_callback = None
-        self.machine.events.remove_handler(self._var_changes)
-
-    def _add_player_var_handler(self, name: str) -> None:
-        self.machine.events.add_handler('player_{}'.format(name), self._var_changes)
-
-    def _add_current_player_handler(self) -> None:
-        self.machine.events.add_handler('player_turn_started', self._var_changes)
+        if self._change_handle:
+            self._change_handle.cancel()
+            self._change_handle = None
+        self.machine.events.remove_handlers_by_keys(self._handler_keys)
+        self._handler_keys = []
 
-    def _add_machine_var_handler(self, name: str) -> None:
-        self.machine.events.add_handler('machine_var_{}'.format(name), self._var_changes)
-
-    def _var_changes(self, **kwargs) -> None:
+    def _var_changes(self, _segments, **kwargs) -> None:
         del kwargs
+        self._dirty_segments.update(_segments)
+        # coalesce multiple changes into one callback
+        if self._change_callback and not self._change_handle:
+            self._change_handle = self.machine.clock.loop.call_soon(self._notify_change)
+
+    def _notify_change(self) -> None:
+        self._change_handle = None
         if self._change_callback:
             self._change_callback()
 
-    def _setup_variable_monitors(self) -> None:
-        for var_string in self.vars:
-            if '|' not in var_string:
-                self._add_player_var_handler(name=var_string)
-                self._add_current_player_handler()
-            else:
-                source, variable_name = var_string.split('|')
-                if source.lower().startswith('player'):
-
-                    if source.lstrip('player'):  # we have player num
-                        self._add_player_var_handler(name=variable_name)
-                    else:  # no player num
-                        self._add_player_var_handler(name=var_string)
-                        self._add_current_player_handler()
-                elif source.lower() == 'machine':
-                    self._add_machine_var_handler(name=variable_name)
-
-    def _evaluate_text(self) -> str:
-        """Evaluate placeholder to string."""
-        text = self.text
-        for var_string in self.vars:
-            if var_string.startswith('machine|'):
-                _, var_name = var_string.split('|')
-                if self.machine.is_machine_var(var_name):
-                    replacement = str(self.machine.get_machine_var(var_name))
-                else:
-                    replacement = ''
-
-                text = text.replace('(' + var_string + ')', replacement)
-
-            elif self.machine.game and self.machine.game.player:
-                if var_string.startswith('player|'):
-                    text = text.replace('(' + var_string + ')',
-                                        str(self.machine.game.player[var_string.split('|')[1]]))
-                elif var_string.startswith('player') and '|' in var_string:
-                    player_num, var_name = var_string.lstrip('player').split(
-                            '|')
-                    try:
-                        value = self.machine.game.player_list[int(player_num) - 1][var_name]
-
-                        if value is not None:
-                            text = text.replace('(' + var_string + ')', str(value))
-                        else:
-                            text = text.replace('(' + var_string + ')', '')
-                    except IndexError:
-                        text = text.replace('(' + var_string + ')', '')
-                elif self.machine.game.player.is_player_var(var_string):
-                    value = self.machine.game.player[var_string]
-                    if value is not None:
-                        text = text.replace('(' + var_string + ')', str(value))
-                    else:
-                        text = text.replace('(' + var_string + ')', '')
-            else:
-                # set var to empty otherwise
-                if var_string.startswith('player') or var_string.startswith('player') and '|' in var_string:
-                    text = text.replace('(' + var_string + ')', '')
+    @staticmethod
+    def _get_variable_events(var_string: str) -> List[str]:
+        """Return the events which are posted when a variable changes."""
+        if '|' not in var_string:
+            return ['player_{}'.format(var_string), 'player_turn_started']
+
+        source, variable_name = var_string.split('|')
+        if source.lower().startswith('player'):
+            if source.lstrip('player'):  # we have player num
+                return ['player_{}'.format(variable_name)]
+            else:  # no player num
+                return ['player_{}'.format(variable_name), 'player_turn_started']
+        elif source.lower() == 'machine':
+            return ['machine_var_{}'.format(variable_name)]
+
+        return []
 
-        return text
+    def _setup_variable_monitors(self) -> None:
+        segments_by_event = {}      # type: Dict[str, Set[int]]
+        for index in self._variable_segments:
+            for event in self._get_variable_events(self._segments[index]):
+                segments_by_event.setdefault(event, set()).add(index)
+
+        with self.machine.events.handler_transaction():
+            for event, segments in segments_by_event.items():
+                self._handler_keys.append(
+                    self.machine.events.add_handler(event, self._var_changes, _segments=frozenset(segments)))
+
+    def _evaluate_variable(self, var_string: str) -> str:
+        """Evaluate one variable to string. Unknown variables are kept as they are."""
+        if var_string.startswith('machine|'):
+            _, var_name = var_string.split('|')
+            if self.machine.is_machine_var(var_name):
+                return str(self.machine.get_machine_var(var_name))
+            return ''
+
+        elif self.machine.game and self.machine.game.player:
+            if var_string.startswith('player|'):
+                return str(self.machine.game.player[var_string.split('|')[1]])
+            elif var_string.startswith('player') and '|' in var_string:
+                player_num, var_name = var_string.lstrip('player').split('|')
+                try:
+                    value = self.machine.game.player_list[int(player_num) - 1][var_name]
+                except IndexError:
+                    return ''
+                return str(value) if value is not None else ''
+            elif self.machine.game.player.is_player_var(var_string):
+                value = self.machine.game.player[var_string]
+                return str(value) if value is not None else ''
+
+        elif var_string.startswith('player'):
+            # set var to empty otherwise
+            return ''
+
+        return '(' + var_string + ')'
 
 
 class DeviceClassPlaceholder:
@@ -315,6 +343,19 @@ class BasePlaceholderManager(MpfController):
             ast.Name: self._eval_name,
             ast.IfExp: self._eval_if
         }
+        self._compile_methods = {
+            ast.Num: self._compile_num,
+            ast.Str: self._compile_str,
+            ast.NameConstant: self._compile_name_constant,
+            ast.BinOp: self._compile_bin_op,
+            ast.UnaryOp: self._compile_unary_op,
+            ast.Compare: self._compile_compare,
+            ast.BoolOp: self._compile_bool_op,
+            ast.Attribute: self._compile_attribute,
+            ast.Subscript: self._compile_subscript,
+            ast.Name: self._compile_name,
+            ast.IfExp: self._compile_if
+        }
 
     @staticmethod
     def _parse_template(template_str):
@@ -397,6 +438,128 @@ class BasePlaceholderManager(MpfController):
         else:
             raise TypeError(type(node))
 
+    @staticmethod
+    def _compile_value(value):
+        return lambda variables: value
+
+    @staticmethod
+    def _compile_error(exception_class, *args):
+        """Return a function which raises an error when the template is evaluated (same as _eval)."""
+        def evaluate(variables):
+            del variables
+            raise exception_class(*args)
+        return evaluate
+
+    def _compile_num(self, node):
+        return self._compile_value(node.n)
+
+    def _compile_str(self, node):
+        return self._compile_value(node.s)
+
+    def _compile_name_constant(self, node):
+        return self._compile_value(node.value)
+
+    def _compile_if(self, node):
+        test = self._compile(node.test)
+        body = self._compile(node.body)
+        orelse = self._compile(node.orelse)
+        return lambda variables: body(variables) if test(variables) else orelse(variables)
+
+    def _compile_bin_op(self, node):
+        if type(node.op) not in operators:  # pylint: disable-msg=unidiomatic-typecheck
+            return self._compile_error(KeyError, type(node.op))
+        operator = operators[type(node.op)]
+        left = self._compile(node.left)
+        right = self._compile(node.right)
+        return lambda variables: operator(left(variables), right(variables))
+
+    def _compile_unary_op(self, node):
+        if type(node.op) not in operators:  # pylint: disable-msg=unidiomatic-typecheck
+            return self._compile_error(KeyError, type(node.op))
+        operator = operators[type(node.op)]
+        operand = self._compile(node.operand)
+        return lambda variables: operator(operand(variables))
+
+    def _compile_compare(self, node):
+        if len(node.ops) > 1:
+            return self._compile_error(AssertionError, "Only single comparisons are supported.")
+        if type(node.ops[0]) not in comparisons:  # pylint: disable-msg=unidiomatic-typecheck
+            return self._compile_error(KeyError, type(node.ops[0]))
+        comparison = comparisons[type(node.ops[0])]
+        left = self._compile(node.left)
+        right = self._compile(node.comparators[0])
+
+        def evaluate(variables):
+            try:
+                return comparison(left(variables), right(variables))
+            except TypeError as e:
+                raise ValueError("Comparison failed: {}".format(e))
+        return evaluate
+
+    def _compile_bool_op(self, node):
+        bool_operator = bool_operators[type(node.op)]
+        first = self._compile(node.values[0])
+        values = [self._compile(value) for value in node.values[1:]]
+
+        def evaluate(variables):
+            # all values are evaluated (no short-circuit) exactly like in _eval
+            result = first(variables)
+            for value in values:
+                result = bool_operator(result, value(variables))
+            return result
+        return evaluate
+
+    def _compile_attribute(self, node):
+        value = self._compile(node.value)
+        attr = node.attr
+        return lambda variables: getattr(value(variables), attr)
+
+    def _compile_subscript(self, node):
+        value = self._compile(node.value)
+        if isinstance(node.slice, ast.Index):
+            index = self._compile(node.slice.value)
+            return lambda variables: value(variables)[index(variables)]
+        elif isinstance(node.slice, ast.Slice):
+            lower = self._compile(node.slice.lower)
+            upper = self._compile(node.slice.upper)
+            step = self._compile(node.slice.step)
+            return lambda variables: value(variables)[lower(variables):upper(variables):step(variables)]
+        else:
+            return self._compile_error(TypeError, type(node))
+
+    def _compile_name(self, node):
+        name = node.id
+        get_global_parameters = self.get_global_parameters
+
+        def evaluate(variables):
+            var = get_global_parameters(name)
+            if var:
+                return var
+            elif name in variables:
+                return variables[name]
+            else:
+                raise ValueError("Missing variable {}".format(name))
+        return evaluate
+
+    def _compile(self, node):
+        if node is None:
+            return self._compile_value(None)
+
+        elif type(node) in self._compile_methods:  # pylint: disable-msg=unidiomatic-typecheck
+            return self._compile_methods[type(node)](node)
+        else:
+            return self._compile_error(TypeError, type(node))
+
+    def compile_template(self, template):
+        """Compile a parsed template into a function.
+
+        The function takes the parameters and returns the same result as
+        evaluate_template but does not walk the syntax tree on every call.
+        Only the nodes supported by evaluate_template are compiled. Unsupported
+        nodes will raise when the template is evaluated.
+        """
+        return self._compile(template)
+
     def build_float_template(self, template_str, default_value=0.0):
         """Build a float template from a string."""
         if isinstance(template_str, (float, int)):
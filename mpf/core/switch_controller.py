@@ -7,8 +7,9 @@ states and posting events to the framework.
 import logging
 from collections import defaultdict, namedtuple
 import asyncio
+import heapq
 from functools import partial
-from typing import Any, Callable, Dict, List
+from typing import Any, Callable, Dict, List, Tuple
 
 from mpf.core.case_insensitive_dict import CaseInsensitiveDict
 from mpf.core.machine import MachineController
@@ -36,18 +37,31 @@ class SwitchController(MpfController):
         # callbacks.
 
         self._timed_switch_handler_delay = None                 # type: Any
+        self._timed_switch_handler_delay_time = None            # type: float
 
-        self.active_timed_switches = defaultdict(list)          # type: Dict[float, List[TimedSwitchHandler]]
-        # Dictionary of switches that are currently in a state counting ms
-        # waiting to notify their handlers. In other words, this is the dict
-        # that tracks current switches for things like "do foo() if switch bar
-        # is active for 100ms."
+        self._timed_switch_handlers = []                        # type: List[List[Any]]
+        # Heap of [time, sequence, TimedSwitchHandler] entries for switches
+        # that are currently in a state counting ms waiting to notify their
+        # handlers. In other words, this tracks current switches for things
+        # like "do foo() if switch bar is active for 100ms." Cancelled entries
+        # have their handler set to None and are dropped lazily.
+
+        self._timed_switch_handlers_by_switch = defaultdict(dict)   # type: Dict[Tuple[str, int], Dict[int, List[Any]]]
+        # Index of pending heap entries by (switch_name, state) and sequence
+        # so they can be cancelled without searching the heap.
+
+        self._timed_switch_handler_sequence = 0
+        self._timed_switch_handlers_cancelled = 0
 
         self.switches = CaseInsensitiveDict()                   # type: Dict[str, SwitchState]
         # Dictionary which holds the master list of switches as well as their
         # current states. State here does factor in whether a switch is NO or
         # NC so 1 = active and 0 = inactive.
 
+        self._switches_by_number = dict()                       # type: Dict[Tuple[Any, Any], Switch]
+        # Index of switch objects by (platform, hw number). Used to dispatch
+        # hardware switch changes without scanning all switches.
+
         # register for events
         self.machine.events.add_handler('init_phase_2', self._initialize_switches, 1000)
         # priority 1000 so this fires first
@@ -67,13 +81,25 @@ class SwitchController(MpfController):
 
         self.set_state(name, 0, reset_time=True)
 
+    def register_hw_switch(self, switch: Switch):
+        """Add a switch to the (platform, number) index used by process_switch_by_num.
+
+        Args:
+            switch: Switch object with an initialised hw_switch.
+        """
+        # keep the first switch in case of duplicate numbers. Switch will
+        # complain about those later
+        self._switches_by_number.setdefault((switch.platform, switch.hw_switch.number), switch)
+
     def _initialize_switches(self, **kwargs):
         del kwargs
         self.update_switches_from_hw()
 
+        self._switches_by_number = dict()
         for switch in self.machine.switches:
             # Populate self.switches
             self.set_state(switch.name, switch.state, reset_time=True)
+            self.register_hw_switch(switch)
 
     def update_switches_from_hw(self):
         """Update the states of all the switches be re-reading the states from the hardware platform.
@@ -244,10 +270,10 @@ class SwitchController(MpfController):
                 logical states that are inverted from each other.
 
         """
-        for switch in self.machine.switches:
-            if switch.hw_switch.number == num and switch.platform == platform:
-                self.process_switch_obj(obj=switch, state=state, logical=logical)
-                return
+        switch = self._switches_by_number.get((platform, num))
+        if switch:
+            self.process_switch_obj(obj=switch, state=state, logical=logical)
+            return
 
         self.debug_log("Unknown switch %s change to state %s on platform %s", num, state, platform)
         # if the switch is not configured still trigger the monitor
@@ -441,23 +467,48 @@ class SwitchController(MpfController):
     def _cancel_timed_handlers(self, name, state):
         # now check if the opposite state is in the active timed switches list
         # if so, remove it
-        for k, v, in list(self.active_timed_switches.items()):
-            # using items() instead of iteritems() since we might want to
-            # delete while iterating
-            for k2, item in enumerate(v):
-                if item.switch_name == str(name) and item.state == state ^ 1:
-                    # ^1 in above line invertes the state
-                    if self.active_timed_switches[k] and self.active_timed_switches[k][k2]:
-                        del self.active_timed_switches[k][k2]
+        entries = self._timed_switch_handlers_by_switch.pop((str(name), state ^ 1), None)
+        if not entries:
+            return
+
+        for entry in entries.values():
+            self._cancel_timed_switch_entry(entry)
+
+        self._compact_timed_switch_handlers()
+
+    def _cancel_timed_switch_entry(self, entry):
+        """Mark a heap entry as cancelled. It will be discarded when it reaches the top of the heap."""
+        entry[2] = None
+        self._timed_switch_handlers_cancelled += 1
+
+    def _compact_timed_switch_handlers(self):
+        """Rebuild the heap when most of it consists of cancelled entries."""
+        if self._timed_switch_handlers_cancelled < 100 or \
+                self._timed_switch_handlers_cancelled * 2 < len(self._timed_switch_handlers):
+            return
+
+        self._timed_switch_handlers = [entry for entry in self._timed_switch_handlers if entry[2]]
+        heapq.heapify(self._timed_switch_handlers)
+        self._timed_switch_handlers_cancelled = 0
 
     def _add_timed_switch_handler(self, time: float, timed_switch_handler: TimedSwitchHandler):
-        self.active_timed_switches[time].append(timed_switch_handler)
+        self._timed_switch_handler_sequence += 1
+        entry = [time, self._timed_switch_handler_sequence, timed_switch_handler]
+        heapq.heappush(self._timed_switch_handlers, entry)
+        self._timed_switch_handlers_by_switch[(str(timed_switch_handler.switch_name), timed_switch_handler.state)][
+            self._timed_switch_handler_sequence] = entry
+
+        # only touch the clock if this handler fires before the scheduled one
+        if self._timed_switch_handler_delay_time is None or time < self._timed_switch_handler_delay_time:
+            self._schedule_timed_switch_handler(time)
 
+    def _schedule_timed_switch_handler(self, time):
         if self._timed_switch_handler_delay:
             self.machine.clock.unschedule(self._timed_switch_handler_delay)
+        self._timed_switch_handler_delay_time = time
         self._timed_switch_handler_delay = self.machine.clock.schedule_once(
             self._process_active_timed_switches,
-            self.get_next_timed_switch_event() - self.machine.clock.get_time())
+            time - self.machine.clock.get_time())
 
     def _call_handlers(self, name, state):
         # Combine name & state so we can look it up
@@ -588,12 +639,14 @@ class SwitchController(MpfController):
                 if settings.ms == ms and settings.callback == callback:
                     self.registered_switches[entry_key].remove(settings)
 
-        for k in list(self.active_timed_switches.keys()):
-            timed_entry = self.active_timed_switches[k]
-            for dummy_key, entry in enumerate(timed_entry):
-                if (entry.switch_name == switch_name and entry.state == state and entry.ms == ms and
-                        entry.callback == callback):
-                    del self.active_timed_switches[k][dummy_key]
+        entries = self._timed_switch_handlers_by_switch.get((str(switch_name), state))
+        if entries:
+            for sequence, entry in list(entries.items()):
+                if entry[2].ms == ms and entry[2].callback == callback:
+                    del entries[sequence]
+                    self._cancel_timed_switch_entry(entry)
+            if not entries:
+                del self._timed_switch_handlers_by_switch[(str(switch_name), state)]
 
     def log_active_switches(self, **kwargs):
         """Write out entries to the INFO log file of all switches that are currently active."""
@@ -621,38 +674,49 @@ class SwitchController(MpfController):
 
     def get_next_timed_switch_event(self):
         """Return time of the next timed switch event."""
-        if not self.active_timed_switches:
+        self._discard_cancelled_timed_switch_handlers()
+        if not self._timed_switch_handlers:
             raise AssertionError("No active timed switches")
-        return min(self.active_timed_switches.keys())
+        return self._timed_switch_handlers[0][0]
+
+    def _discard_cancelled_timed_switch_handlers(self):
+        while self._timed_switch_handlers and not self._timed_switch_handlers[0][2]:
+            heapq.heappop(self._timed_switch_handlers)
+            self._timed_switch_handlers_cancelled -= 1
 
     def _process_active_timed_switches(self):
         """Process active times switches.
 
-        Checks the current list of active timed switches to see if it's
-        time to take action on any of them. If so, does the callback and then
-        removes that entry from the list.
+        Pops all due entries from the timed switch heap and calls their
+        callbacks. Afterwards, schedules the clock for the next pending entry.
         """
-        next_event_time = False
-        for k in list(self.active_timed_switches.keys()):
-            if k <= self.machine.clock.get_time():  # change to generator?
-                for entry in list(self.active_timed_switches[k]):
-                    # check if removed by previous entry
-                    if entry not in self.active_timed_switches[k]:
-                        continue
-                    self.debug_log(
-                        "Processing timed switch handler. Switch: %s "
-                        " State: %s, ms: %s", entry.switch_name,
-                        entry.state, entry.ms)
-                    entry.callback()
-                del self.active_timed_switches[k]
-            else:
-                if not next_event_time or next_event_time > k:
-                    next_event_time = k
+        self._timed_switch_handler_delay = None
+        self._timed_switch_handler_delay_time = None
+
+        while self._timed_switch_handlers and self._timed_switch_handlers[0][0] <= self.machine.clock.get_time():
+            _, sequence, entry = heapq.heappop(self._timed_switch_handlers)
+            # check if removed in the meantime
+            if not entry:
+                self._timed_switch_handlers_cancelled -= 1
+                continue
+
+            key = (str(entry.switch_name), entry.state)
+            del self._timed_switch_handlers_by_switch[key][sequence]
+            if not self._timed_switch_handlers_by_switch[key]:
+                del self._timed_switch_handlers_by_switch[key]
+
+            self.debug_log(
+                "Processing timed switch handler. Switch: %s "
+                " State: %s, ms: %s", entry.switch_name,
+                entry.state, entry.ms)
+            entry.callback()
 
         self.machine.events.process_event_queue()
-        if next_event_time:
-            if self._timed_switch_handler_delay:
-                self.machine.clock.unschedule(self._timed_switch_handler_delay)
-            self._timed_switch_handler_delay = self.machine.clock.schedule_once(
-                self._process_active_timed_switches,
-                next_event_time - self.machine.clock.get_time())
+
+        self._discard_cancelled_timed_switch_handlers()
+        if not self._timed_switch_handlers:
+            return
+
+        next_event_time = self._timed_switch_handlers[0][0]
+        if self._timed_switch_handler_delay_time != next_event_time:
+            self._schedule_timed_switch_handler(next_event_time)
@@ -1,8 +1,73 @@
 """Support for physical DMDs."""
+from typing import Optional, Tuple
+
 from mpf.core.machine import MachineController
 from mpf.core.platform import DmdPlatform
 
 from mpf.core.system_wide_device import SystemWideDevice
+from mpf.platforms.interfaces.dmd_platform import DmdPlatformInterface
+
+# numpy is not a requirement for MPF but it makes diffing frames a lot faster
+try:
+    import numpy
+except ImportError:     # pragma: no cover
+    numpy = None
+
+# compare frames in blocks of this size before looking at single bytes
+_DIFF_BLOCK_SIZE = 64
+
+# send the full frame if more than this share of the frame changed
+MAX_PARTIAL_UPDATE_RATIO = .5
+
+
+def get_changed_region(old_frame: bytes, new_frame: bytes) -> Optional[Tuple[int, int]]:
+    """Return start and end offset of the bytes which differ between two frames of the same length.
+
+    Returns None if both frames are equal.
+    """
+    if numpy:
+        changed = numpy.flatnonzero(numpy.frombuffer(old_frame, numpy.uint8) !=
+                                    numpy.frombuffer(new_frame, numpy.uint8))
+        if not len(changed):
+            return None
+        return int(changed[0]), int(changed[-1]) + 1
+
+    if old_frame == new_frame:
+        return None
+
+    start = 0
+    while old_frame[start:start + _DIFF_BLOCK_SIZE] == new_frame[start:start + _DIFF_BLOCK_SIZE]:
+        start += _DIFF_BLOCK_SIZE
+    while old_frame[start] == new_frame[start]:
+        start += 1
+
+    end = len(new_frame)
+    while old_frame[max(end - _DIFF_BLOCK_SIZE, start):end] == new_frame[max(end - _DIFF_BLOCK_SIZE, start):end]:
+        end -= _DIFF_BLOCK_SIZE
+    while old_frame[end - 1] == new_frame[end - 1]:
+        end -= 1
+
+    return start, end
+
+
+def send_frame(hw_device: DmdPlatformInterface, last_frame: Optional[bytes], frame: bytes):
+    """Send only the changed part of frame to hw_device if it changed less than MAX_PARTIAL_UPDATE_RATIO.
+
+    Frames which did not change at all are not sent.
+    """
+    if last_frame is None or len(last_frame) != len(frame):
+        hw_device.update(frame)
+        return
+
+    region = get_changed_region(last_frame, frame)
+    if region is None:
+        return
+
+    start, end = region
+    if end - start > len(frame) * MAX_PARTIAL_UPDATE_RATIO:
+        hw_device.update(frame)
+    else:
+        hw_device.update_partial(frame, start, end)
 
 
 class Dmd(SystemWideDevice):
@@ -28,11 +93,14 @@ class Dmd(SystemWideDevice):
         """Initialise DMD."""
         self.hw_device = None
         self.platform = None        # type: DmdPlatform
+        self._partial_updates = False
+        self._last_frame = None
         super().__init__(machine, name)
 
     def _initialize(self):
         self.platform = self.machine.get_platform_sections("dmd", self.config['platform'])
         self.hw_device = self.platform.configure_dmd()
+        self._partial_updates = self.config['partial_updates'] and self.hw_device.supports_partial_updates
 
     @classmethod
     def _bcp_receive_dmd_frame(cls, client, name, rawbytes, **kwargs):
@@ -51,4 +119,10 @@ class Dmd(SystemWideDevice):
         Args:
             data: bytes to send
         """
-        self.hw_device.update(data)
+        if not self._partial_updates:
+            self.hw_device.update(data)
+            return
+
+        data = bytes(data)
+        send_frame(self.hw_device, self._last_frame, data)
+        self._last_frame = data
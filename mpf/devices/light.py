@@ -1,9 +1,9 @@
 """Contains the Light class."""
 import asyncio
+from bisect import bisect_left, bisect_right
 from functools import partial
-from operator import itemgetter
 
-from typing import Set
+from typing import Any, Dict, List, Set
 from typing import Tuple
 
 from mpf.core.platform import LightsPlatform
@@ -31,7 +31,37 @@ class DriverLight(LightPlatformSoftwareFade):
             self.driver.enable(hold_power=brightness)
 
 
-@DeviceMonitor(_color="color")
+class LightStackEntry:
+
+    """A color command in the stack of a light.
+
+    Supports item access (entry['priority']) like the dicts which were used for the stack before.
+    """
+
+    __slots__ = ["priority", "start_time", "start_color", "dest_time", "dest_color", "color", "key"]
+
+    # pylint: disable-msg=too-many-arguments
+    def __init__(self, priority: int, start_time: float, start_color: RGBColor, dest_time: float,
+                 dest_color: RGBColor, color: RGBColor, key: Any) -> None:
+        """Initialise stack entry."""
+        self.priority = priority
+        self.start_time = start_time
+        self.start_color = start_color
+        self.dest_time = dest_time
+        self.dest_color = dest_color
+        self.color = color
+        self.key = key
+
+    def __getitem__(self, item):
+        """Return attribute by name."""
+        return getattr(self, item)
+
+    def __repr__(self):
+        """Return string representation."""
+        return "<LightStackEntry key={} priority={} dest_color={}>".format(self.key, self.priority, self.dest_color)
+
+
+@DeviceMonitor(_color="color", _stack_stats="stack_stats")
 class Light(SystemWideDevice):
 
     """A light in a pinball machine."""
@@ -51,10 +81,16 @@ class Light(SystemWideDevice):
 
         self._color_correction_profile = None
 
-        self.stack = list()
-        """A list of dicts which represents different commands that have come
-        in to set this light to a certain color (and/or fade). Each entry in the
-        list contains the following key/value pairs:
+        # ((max_fade_ms, brightness), (corrected_color, fade_ms), channels) of
+        # the last calculation. shared by all channels of this light. during a
+        # fade every channel reads it once before it is calculated again
+        self._corrected_color_cache = None
+
+        self.stack = list()     # type: List[LightStackEntry]
+        """A list of LightStackEntry which represents different commands that
+        have come in to set this light to a certain color (and/or fade). The
+        list is kept sorted by priority and start_time (highest first). Each
+        entry contains the following attributes:
 
         priority:
             The relative priority of this color command. Higher numbers
@@ -89,6 +125,13 @@ class Light(SystemWideDevice):
             remove their commands from the light).
         """
 
+        # sort keys (-priority, -start_time) of the entries in stack. used to
+        # insert new entries with bisect
+        self._stack_order = list()          # type: List[Tuple[int, float]]
+        self._stack_entries_by_key = dict()     # type: Dict[Any, LightStackEntry]
+        self._stack_updates = 0
+        self._stack_max_size = 0
+
     def _map_channels_to_colors(self, channel_list) -> dict:
         if self.config['type']:
             color_channels = self.config['type']
@@ -212,6 +255,7 @@ class Light(SystemWideDevice):
 
         """
         self._color_correction_profile = profile
+        self._corrected_color_cache = None
 
     def color(self, color, fade_ms=None, priority=0, key=None):
         """Add or update a color entry in this light's stack, which is how you tell this light what color you want it to be.
@@ -292,15 +336,24 @@ class Light(SystemWideDevice):
             new_color = color
             dest_time = 0
 
-        self.stack.append(dict(priority=priority,
-                               start_time=self.machine.clock.get_time(),
-                               start_color=curr_color,
-                               dest_time=dest_time,
-                               dest_color=color,
-                               color=new_color,
-                               key=key))
-
-        self.stack.sort(key=itemgetter('priority', 'start_time'), reverse=True)
+        start_time = self.machine.clock.get_time()
+        entry = LightStackEntry(priority=priority,
+                                start_time=start_time,
+                                start_color=curr_color,
+                                dest_time=dest_time,
+                                dest_color=color,
+                                color=new_color,
+                                key=key)
+
+        # newer entries go behind older entries with the same priority and start_time
+        sort_key = (-priority, -start_time)
+        index = bisect_right(self._stack_order, sort_key)
+        self._stack_order.insert(index, sort_key)
+        self.stack.insert(index, entry)
+        self._stack_entries_by_key[key] = entry
+        self._stack_updates += 1
+        self._stack_max_size = max(self._stack_max_size, len(self.stack))
+        self._corrected_color_cache = None
 
         self.debug_log("+-------------- Adding to stack ----------------+")
         self.debug_log("priority: %s", priority)
@@ -329,18 +382,38 @@ class Light(SystemWideDevice):
 
     def _remove_from_stack_by_key(self, key):
         self.debug_log("Removing key '%s' from stack", key)
-        self.stack[:] = [x for x in self.stack if x['key'] != key]
+        entry = self._stack_entries_by_key.pop(key, None)
+        if not entry:
+            return
+
+        index = bisect_left(self._stack_order, (-entry.priority, -entry.start_time))
+        while self.stack[index] is not entry:
+            index += 1
+        del self.stack[index]
+        del self._stack_order[index]
+        self._stack_updates += 1
+        self._corrected_color_cache = None
 
     def _schedule_update(self):
+        self._corrected_color_cache = None
+        fading_channels = {}
         for color, hw_driver in self.hw_drivers.items():
-            hw_driver.set_fade(partial(self._get_brightness_and_fade, color=color))
+            callback = partial(self._get_brightness_and_fade, color=color)
+            if hw_driver.set_fade(callback):
+                fading_channels[hw_driver] = callback
 
         for platform in self.platforms:
             platform.light_sync()
 
+        self.machine.light_controller.schedule_fades(self, fading_channels)
+
     def clear_stack(self):
         """Remove all entries from the stack and resets this light to 'off'."""
         self.stack[:] = []
+        self._stack_order[:] = []
+        self._stack_entries_by_key = dict()
+        self._stack_updates += 1
+        self._corrected_color_cache = None
 
         self.debug_log("Clearing Stack")
 
@@ -348,8 +421,8 @@ class Light(SystemWideDevice):
 
     def _get_priority_from_key(self, key):
         try:
-            return [x for x in self.stack if x['key'] == key][0]['priority']
-        except IndexError:
+            return self._stack_entries_by_key[key].priority
+        except KeyError:
             return 0
 
     def gamma_correct(self, color):
@@ -399,33 +472,53 @@ class Light(SystemWideDevice):
             return RGBColor('off'), -1
 
         # no fade
-        if not color_settings['dest_time']:
-            return color_settings['dest_color'], -1
+        if not color_settings.dest_time:
+            return color_settings.dest_color, -1
 
         current_time = self.machine.clock.get_time()
 
         # fade is done
-        if current_time >= color_settings['dest_time']:
-            return color_settings['dest_color'], -1
+        if current_time >= color_settings.dest_time:
+            return color_settings.dest_color, -1
 
         target_time = current_time + (max_fade_ms / 1000.0)
         # check if fade will be done before max_fade_ms
-        if target_time > color_settings['dest_time']:
-            return color_settings['dest_time'], int((color_settings['dest_time'] - current_time) / 1000)
+        if target_time > color_settings.dest_time:
+            return color_settings.dest_color, int((color_settings.dest_time - current_time) * 1000)
 
         # figure out the ratio of how far along we are
         try:
-            ratio = ((target_time - color_settings['start_time']) /
-                     (color_settings['dest_time'] - color_settings['start_time']))
+            ratio = ((target_time - color_settings.start_time) /
+                     (color_settings.dest_time - color_settings.start_time))
         except ZeroDivisionError:
             ratio = 1.0
 
-        return RGBColor.blend(color_settings['start_color'], color_settings['dest_color'], ratio), max_fade_ms
+        return RGBColor.blend(color_settings.start_color, color_settings.dest_color, ratio), max_fade_ms
+
+    def _get_corrected_color_and_fade(self, max_fade_ms: int, channel: str) -> Tuple[RGBColor, int]:
+        """Return the corrected color and fade. Calculated only once per update for all channels.
+
+        Without a fade in progress the result stays valid until the stack changes. During a fade the result is
+        calculated again when a channel reads it for the second time (i.e. in the next fade step).
+        """
+        cache_key = (max_fade_ms, self.machine.get_machine_var("brightness"))
+        if self._corrected_color_cache and self._corrected_color_cache[0] == cache_key:
+            result, channels = self._corrected_color_cache[1:]
+            if channels is None:
+                return result
+            if channel not in channels:
+                channels.add(channel)
+                return result
 
-    def _get_brightness_and_fade(self, max_fade_ms: int, color: str) -> Tuple[float, int]:
         uncorrected_color, fade_ms = self._get_color_and_fade(max_fade_ms)
         corrected_color = self.gamma_correct(uncorrected_color)
         corrected_color = self.color_correct(corrected_color)
+        # fade_ms is -1 if there is no fade in progress
+        self._corrected_color_cache = (cache_key, (corrected_color, fade_ms), {channel} if fade_ms >= 0 else None)
+        return corrected_color, fade_ms
+
+    def _get_brightness_and_fade(self, max_fade_ms: int, color: str) -> Tuple[float, int]:
+        corrected_color, fade_ms = self._get_corrected_color_and_fade(max_fade_ms, color)
 
         if color in ["red", "blue", "green"]:
             brightness = getattr(corrected_color, color) / 255.0
@@ -440,6 +533,13 @@ class Light(SystemWideDevice):
         """Getter for color."""
         return self.get_color()
 
+    @property
+    def _stack_stats(self):
+        """Return size and number of updates of the stack."""
+        return {"size": len(self.stack),
+                "max_size": self._stack_max_size,
+                "updates": self._stack_updates}
+
     def get_color(self):
         """Return an RGBColor() instance of the 'color' setting of the highest color setting in the stack.
 
@@ -453,4 +553,4 @@ class Light(SystemWideDevice):
     @property
     def fade_in_progress(self) -> bool:
         """Return true if a fade is in progress."""
-        return bool(self.stack and self.stack[0]['dest_time'] > self.machine.clock.get_time())
+        return bool(self.stack and self.stack[0].dest_time > self.machine.clock.get_time())
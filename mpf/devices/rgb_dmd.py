@@ -3,6 +3,7 @@ from mpf.core.machine import MachineController
 from mpf.core.platform import RgbDmdPlatform
 
 from mpf.core.system_wide_device import SystemWideDevice
+from mpf.devices.dmd import send_frame
 
 
 class RgbDmd(SystemWideDevice):
@@ -28,11 +29,14 @@ class RgbDmd(SystemWideDevice):
         """Initialise DMD."""
         self.hw_device = None
         self.platform = None        # type: RgbDmdPlatform
+        self._partial_updates = False
+        self._last_frame = None
         super().__init__(machine, name)
 
     def _initialize(self):
         self.platform = self.machine.get_platform_sections("rgb_dmd", self.config['platform'])
         self.hw_device = self.platform.configure_rgb_dmd(self.name)
+        self._partial_updates = self.config['partial_updates'] and self.hw_device.supports_partial_updates
 
     @classmethod
     def _bcp_receive_dmd_frame(cls, client, name, rawbytes, **kwargs):
@@ -51,4 +55,10 @@ class RgbDmd(SystemWideDevice):
         Args:
             data: bytes to send
         """
-        self.hw_device.update(data)
+        if not self._partial_updates:
+            self.hw_device.update(data)
+            return
+
+        data = bytes(data)
+        send_frame(self.hw_device, self._last_frame, data)
+        self._last_frame = data
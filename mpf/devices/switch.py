@@ -103,6 +103,7 @@ class Switch(SystemWideDevice):
                               debounce=self.config['debounce'])
         self.hw_switch = self.platform.configure_switch(
             self.config['number'], config, self.config['platform_settings'])
+        self.machine.switch_controller.register_hw_switch(self)
 
         if self.machine.config['mpf']['auto_create_switch_events']:
             self._create_activation_event(
@@ -1,5 +1,5 @@
 """Contains config file interfaces."""
 __all__ = ('yaml_interface',
-           # 'json_interface',  will uncomment when ready
+           'json_interface',
            # 'xml_interface',
            )
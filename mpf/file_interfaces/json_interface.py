@@ -0,0 +1,61 @@
+"""Contains the JsonInterface class for reading & writing JSON files."""
+import json
+
+from mpf.core.file_manager import FileInterface
+
+
+class JsonInterface(FileInterface):
+
+    """File interface for json files.
+
+    JSON is a lot faster to read and write than YAML. It is meant for data files which are written by MPF (e.g.
+    audits or machine vars). Select it by using a .json file in mpf:paths. JSON files cannot be used as config
+    files because they cannot contain a config_version.
+
+    The round trip is lossy for some types: tuples are read back as lists and non-str keys (e.g. ints) are read back
+    as strings. Keep that in mind when switching a data file from YAML to JSON.
+    """
+
+    file_types = ['.json']
+
+    @staticmethod
+    def get_config_file_version(filename: str) -> int:
+        """Return config file version which is always 0 because JSON has no comments."""
+        del filename
+        return 0
+
+    def load(self, filename, verify_version=True, halt_on_error=True) -> dict:
+        """Load a JSON file from disk.
+
+        Args:
+            filename: The file to load.
+            verify_version: Has to be False because JSON files do not have a config version.
+            halt_on_error: Boolean which controls what happens if the file
+                can't be loaded. If True, MPF will raise an error and exit. If
+                False, an empty dictionary will be returned.
+
+        Returns:
+            A dictionary of the data in this JSON file.
+        """
+        if verify_version:
+            raise ValueError("Config file version mismatch: {}. JSON files cannot be used as config files.".format(
+                filename))
+
+        try:
+            self.log.debug("Loading file: %s", filename)
+            with open(filename, encoding='utf8') as f:
+                return json.load(f)
+        except (OSError, ValueError) as e:
+            self.log.debug("Couldn't load from file %s: %s", filename, e)
+            if halt_on_error:
+                raise ValueError("Error found in file {}: {}".format(filename, e))
+
+        return dict()
+
+    def save(self, filename: str, data: dict) -> None:
+        """Save data to json file."""
+        with open(filename, 'w', encoding='utf8') as output_file:
+            json.dump(data, output_file, separators=(',', ':'))
+
+
+file_interface_class = JsonInterface
@@ -3,8 +3,8 @@
 Fixes for octal and boolean values are from here:
 http://stackoverflow.com/questions/32965846/cant-parse-yaml-correctly/
 """
-import copy
 import logging
+import pickle
 import re
 
 import collections
@@ -15,7 +15,11 @@ from ruamel.yaml.scanner import Scanner
 from ruamel.yaml.parser_ import Parser
 from ruamel.yaml.composer import Composer
 from ruamel.yaml.constructor import Constructor, ConstructorError
-from typing import Any, Iterable
+try:
+    from ruamel.yaml.cyaml import CParser
+except ImportError:     # pragma: no cover
+    CParser = None
+from typing import Iterable
 from typing import Dict
 
 from mpf.core.file_manager import FileInterface, FileManager
@@ -158,6 +162,24 @@ class MpfLoader(Reader, Scanner, Parser, Composer, MpfConstructor, MpfResolver):
         MpfResolver.__init__(self)
 
 
+if CParser:
+    class MpfCLoader(CParser, MpfConstructor, MpfResolver):
+
+        """Config loader which uses the libyaml parser.
+
+        Only reading, scanning, parsing and composing is done in C. Resolving and constructing uses the same MPF
+        classes as the MpfLoader so both return the same data.
+        """
+
+        def __init__(self, stream):
+            """Initialise loader."""
+            CParser.__init__(self, stream)
+            MpfConstructor.__init__(self)
+            MpfResolver.__init__(self)
+else:   # pragma: no cover
+    MpfCLoader = None
+
+
 for ch in list(u'yYnNoO'):
     del Resolver.yaml_implicit_resolvers[ch]
 
@@ -168,7 +190,8 @@ class YamlInterface(FileInterface):
 
     file_types = ['.yaml', '.yml']
     cache = False
-    file_cache = dict()     # type: Dict[str, Any]
+    file_cache = dict()     # type: Dict[str, bytes]
+    use_c_loader = True
 
     @staticmethod
     def get_config_file_version(filename: str) -> int:
@@ -249,7 +272,7 @@ class YamlInterface(FileInterface):
             A dictionary of the settings from this YAML file.
         """
         if self.cache and filename in self.file_cache:
-            return copy.deepcopy(self.file_cache[filename])
+            return pickle.loads(self.file_cache[filename])
 
         if verify_version and not self.check_config_file_version(filename):
             raise ValueError("Config file version mismatch: {}".format(filename))
@@ -282,14 +305,22 @@ class YamlInterface(FileInterface):
                 raise ValueError("Error found in file %s" % filename)
 
         if self.cache and config:
-            self.file_cache[filename] = copy.deepcopy(config)
+            self.file_cache[filename] = pickle.dumps(config, protocol=4)
 
         return config
 
+    @staticmethod
+    def get_loader():
+        """Return the libyaml based loader if it is available and enabled. Otherwise, return the python loader."""
+        if MpfCLoader and YamlInterface.use_c_loader:
+            return MpfCLoader
+
+        return MpfLoader
+
     @staticmethod
     def process(data_string: Iterable[str]) -> dict:
         """Parse yaml from a string."""
-        return Util.keys_to_lower(yaml.load(data_string, Loader=MpfLoader))
+        return Util.keys_to_lower(yaml.load(data_string, Loader=YamlInterface.get_loader()))
 
     def save(self, filename: str, data: dict) -> None:   # pragma: no cover
         """Save config to yaml file."""
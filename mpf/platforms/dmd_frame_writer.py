@@ -0,0 +1,150 @@
+"""Writes DMD frames to a stream without queueing them up."""
+import asyncio
+import logging
+
+
+class DmdFrameWriter(object):
+
+    """Latest-frame-wins writer for DMD and RGB DMD frames.
+
+    Only one frame is pending at any time. A frame which has not been written when the next one arrives is replaced
+    and counted as dropped. Frames are written as memoryview without copying them and the writer waits for the
+    stream to drain before it writes the next frame. This way a media controller which renders faster than the link
+    can transfer only drops frames instead of adding latency.
+
+    Partial updates only send a region of the frame. A pending partial update which is replaced is merged into the
+    region of the next update so no change gets lost.
+
+    Frames must not be modified after they have been passed to update().
+    """
+
+    def __init__(self, machine, name: str, writer: asyncio.StreamWriter, header: bytes = b'',
+                 partial_header=None, debug=False) -> None:
+        """Initialise frame writer.
+
+        Args:
+            machine: The machine controller
+            name: Name of the display for logging and monitors
+            writer: Stream to write the frames to
+            header: Bytes to write before every frame
+            partial_header: Function which returns the bytes to write before a partial update. Will be called with
+                start and end of the region.
+            debug: Log every frame which is written
+        """
+        self.machine = machine
+        self.name = name
+        self.writer = writer
+        self.header = header
+        self.partial_header = partial_header
+        self.debug = debug
+        self.log = logging.getLogger('DmdFrameWriter.{}'.format(name))
+
+        self._pending_frame = None
+        self._pending_region = None
+        self._write_task = None
+
+        self.frames_sent = 0
+        self.frames_dropped = 0
+        self.sent_fps = 0.0
+        self.dropped_fps = 0.0
+        self._window_start = self.machine.clock.get_time()
+        self._window_sent = 0
+        self._window_dropped = 0
+
+    def update(self, data, start=None, end=None):
+        """Write a frame as soon as the stream drained.
+
+        Args:
+            data: The complete frame
+            start: Offset of the first changed byte for partial updates
+            end: Offset after the last changed byte for partial updates
+        """
+        if not isinstance(data, (bytes, bytearray, memoryview)):
+            data = bytes(data)
+
+        region = (start, end) if start is not None else None
+
+        if self._pending_frame is not None:
+            self.frames_dropped += 1
+            self._window_dropped += 1
+            if region and self._pending_region:
+                region = (min(start, self._pending_region[0]), max(end, self._pending_region[1]))
+            else:
+                region = None
+
+        self._pending_frame = memoryview(data)
+        self._pending_region = region
+
+        if not self._write_task:
+            self._write_task = self.machine.clock.loop.create_task(self._write_frames())
+            self._write_task.add_done_callback(self._done)
+
+    @staticmethod
+    def _done(future):
+        try:
+            future.result()
+        except asyncio.CancelledError:
+            pass
+
+    @asyncio.coroutine
+    def _write_frames(self):
+        try:
+            while self._pending_frame is not None:
+                frame = self._pending_frame
+                region = self._pending_region
+                self._pending_frame = None
+                self._pending_region = None
+
+                if region:
+                    self.writer.write(self.partial_header(*region))
+                    self.writer.write(frame[region[0]:region[1]])
+                else:
+                    if self.header:
+                        self.writer.write(self.header)
+                    self.writer.write(frame)
+                if self.debug:
+                    self.log.debug("Send: %s", "".join(" 0x%02x" % b for b in frame))
+                self.frames_sent += 1
+                self._window_sent += 1
+                self._update_fps()
+
+                yield from self.writer.drain()
+        except (ConnectionError, OSError) as e:
+            self.log.warning("Failed to write frame: %s", e)
+            self._pending_frame = None
+        finally:
+            self._write_task = None
+
+    def _update_fps(self):
+        """Calculate FPS about once per second and notify monitors."""
+        now = self.machine.clock.get_time()
+        duration = now - self._window_start
+        if duration < 1.0:
+            return
+
+        self.sent_fps = self._window_sent / duration
+        self.dropped_fps = self._window_dropped / duration
+        self._window_start = now
+        self._window_sent = 0
+        self._window_dropped = 0
+
+        self.log.debug("Sent %.1f FPS. Dropped %.1f FPS.", self.sent_fps, self.dropped_fps)
+        for callback in self.machine.monitors.get('dmd', []):
+            callback(name=self.name, **self.get_stats())
+
+    def get_stats(self) -> dict:
+        """Return frame stats."""
+        return {
+            "frames_sent": self.frames_sent,
+            "frames_dropped": self.frames_dropped,
+            "sent_fps": self.sent_fps,
+            "dropped_fps": self.dropped_fps,
+        }
+
+    def stop(self):
+        """Stop writing frames."""
+        self._pending_frame = None
+        self._pending_region = None
+        if self._write_task:
+            self._write_task.cancel()
+            self._write_task = None
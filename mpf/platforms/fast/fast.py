@@ -48,6 +48,7 @@ class FastHardwarePlatform(ServoPlatform, LightsPlatform, DmdPlatform,
         self.features['tickless'] = True
 
         self.dmd_connection = None
+        self.dmd = None     # type: FASTDMD
         self.net_connection = None
         self.rgb_connection = None
         self.serial_connections = set()         # type: Set[FastSerialCommunicator]
@@ -103,6 +104,10 @@ class FastHardwarePlatform(ServoPlatform, LightsPlatform, DmdPlatform,
 
     def stop(self):
         """Stop platform and close connections."""
+        if self.dmd:
+            self.dmd.stop()
+            self.dmd = None
+
         for connection in self.serial_connections:
             connection.writer.write(b'BL:AA55\r')   # reset CPU using bootloader
             connection.stop()
@@ -562,7 +567,8 @@ class FastHardwarePlatform(ServoPlatform, LightsPlatform, DmdPlatform,
                                  "but no connection to a DMD processor is "
                                  "available.")
 
-        return FASTDMD(self.machine, self.dmd_connection.send)
+        self.dmd = FASTDMD(self.machine, self.dmd_connection.writer, self.config['debug'])
+        return self.dmd
 
     @classmethod
     def get_coil_config_section(cls):
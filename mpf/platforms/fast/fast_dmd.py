@@ -1,4 +1,5 @@
 """Fast DMD support."""
+from mpf.platforms.dmd_frame_writer import DmdFrameWriter
 from mpf.platforms.interfaces.dmd_platform import DmdPlatformInterface
 
 
@@ -6,10 +7,10 @@ class FASTDMD(DmdPlatformInterface):
 
     """Object for a FAST DMD."""
 
-    def __init__(self, machine, sender):
+    def __init__(self, machine, writer, debug=False):
         """Initialise DMD."""
         self.machine = machine
-        self.send = sender
+        self.frame_writer = DmdFrameWriter(machine, "fast_dmd", writer, b'BM:', debug=debug)
 
         # Clear the DMD
         # todo
@@ -17,7 +18,13 @@ class FASTDMD(DmdPlatformInterface):
     def update(self, data: bytes):
         """Update data on the DMD.
 
+        Frames which arrive faster than the serial link can send them are dropped.
+
         Args:
             data: bytes to send to DMD
         """
-        self.send(data)
+        self.frame_writer.update(data)
+
+    def stop(self):
+        """Stop writing frames."""
+        self.frame_writer.stop()
@@ -237,26 +237,19 @@ class FastSerialCommunicator(BaseSerialCommunicator):
         self.send_queue.put_nowait(msg)
 
     def _send(self, msg):
-        debug = self.platform.config['debug']
-        if self.dmd:
-            self.writer.write(b'BM:' + msg)
-            if debug:
-                self.platform.log.debug("Send: %s", "".join(" 0x%02x" % b for b in msg))
-
-        else:
-            self.messages_in_flight += 1
-            if self.messages_in_flight > self.max_messages_in_flight:
-                self.send_ready.clear()
-
-                self.log.debug("Enabling Flow Control for %s connection. "
-                               "Messages in flight: %s, Max setting: %s",
-                               self.remote_processor,
-                               self.messages_in_flight,
-                               self.max_messages_in_flight)
-
-            self.writer.write(msg.encode() + b'\r')
-            if debug and msg[0:2] != "WD":
-                self.platform.log.debug("Send: %s", msg)
+        self.messages_in_flight += 1
+        if self.messages_in_flight > self.max_messages_in_flight:
+            self.send_ready.clear()
+
+            self.log.debug("Enabling Flow Control for %s connection. "
+                           "Messages in flight: %s, Max setting: %s",
+                           self.remote_processor,
+                           self.messages_in_flight,
+                           self.max_messages_in_flight)
+
+        self.writer.write(msg.encode() + b'\r')
+        if self.platform.config['debug'] and msg[0:2] != "WD":
+            self.platform.log.debug("Send: %s", msg)
 
     @asyncio.coroutine
     def _socket_writer(self):
@@ -6,6 +6,9 @@ class DmdPlatformInterface(metaclass=abc.ABCMeta):
 
     """Interface for monochrome DMDs in hardware platforms."""
 
+    # platforms which can update parts of a frame set this and implement update_partial()
+    supports_partial_updates = False
+
     @abc.abstractmethod
     def update(self, data: bytes):
         """Update data on the DMD.
@@ -14,3 +17,13 @@ class DmdPlatformInterface(metaclass=abc.ABCMeta):
             data: bytes to send to DMD
         """
         raise NotImplementedError('implement')
+
+    def update_partial(self, data: bytes, start: int, end: int):
+        """Update the part of the DMD which changed since the last update.
+
+        Args:
+            data: the complete new frame
+            start: offset of the first byte which changed
+            end: offset after the last byte which changed
+        """
+        raise NotImplementedError('implement')
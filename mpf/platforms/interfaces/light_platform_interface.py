@@ -1,6 +1,5 @@
 """Interface for a light hardware devices."""
 import abc
-import asyncio
 from asyncio import AbstractEventLoop
 
 from typing import Callable, Tuple
@@ -17,6 +16,9 @@ class LightPlatformInterface(metaclass=abc.ABCMeta):
         Pass a callback which has the max_fade_time as parameter and returns the desired fade time and the brightness.
         This is a callback because the platform may send the brightness later on and we do not want to introduce latency
         between setting and sending the color.
+
+        Platforms which cannot complete the fade on their own return True. The LightController will then call set_fade
+        again with the same callback after get_fade_interval_ms until it returns False.
         """
         pass
 
@@ -28,7 +30,6 @@ class LightPlatformDirectFade(LightPlatformInterface, metaclass=abc.ABCMeta):
     def __init__(self, loop: AbstractEventLoop) -> None:
         """Initialise light."""
         self.loop = loop
-        self.task = None    # type: asyncio.Task
 
     @abc.abstractmethod
     def get_max_fade_ms(self) -> int:
@@ -39,27 +40,16 @@ class LightPlatformDirectFade(LightPlatformInterface, metaclass=abc.ABCMeta):
         """Return max fade time."""
         return self.get_max_fade_ms()
 
-    def set_fade(self, color_and_fade_callback: Callable[[int], Tuple[float, int]]):
-        """Perform a fade with either a asyncio task or with a single command."""
+    def set_fade(self, color_and_fade_callback: Callable[[int], Tuple[float, int]]) -> bool:
+        """Perform a fade with a single command.
+
+        Return True if the fade is longer than max_fade_ms and has to be continued by the LightController.
+        """
         max_fade_ms = self.get_max_fade_ms()
 
         brightness, fade_ms = color_and_fade_callback(max_fade_ms)
         self.set_brightness_and_fade(brightness, max(fade_ms, 0))
-        if fade_ms >= max_fade_ms:
-            # we have to continue the fade later
-            if self.task:
-                self.task.cancel()
-            self.task = self.loop.create_task(self._fade(color_and_fade_callback))
-
-    @asyncio.coroutine
-    def _fade(self, color_and_fade_callback):
-        while True:
-            yield from asyncio.sleep(self.get_fade_interval_ms() / 1000, loop=self.loop)
-            max_fade_ms = self.get_max_fade_ms()
-            brightness, fade_ms = color_and_fade_callback(max_fade_ms)
-            self.set_brightness_and_fade(brightness, max(fade_ms, 0))
-            if fade_ms < max_fade_ms:
-                return
+        return fade_ms >= max_fade_ms
 
     @abc.abstractmethod
     def set_brightness_and_fade(self, brightness: float, fade_ms: int):
@@ -1,10 +1,12 @@
 """Contains code for SmartMatrix RGB DMD."""
 
 import logging
+import struct
 
 import asyncio
 from typing import Dict
 
+from mpf.platforms.dmd_frame_writer import DmdFrameWriter
 from mpf.platforms.interfaces.dmd_platform import DmdPlatformInterface
 
 from mpf.exceptions.ConfigFileError import ConfigFileError
@@ -33,7 +35,9 @@ class SmartMatrixHardwarePlatform(RgbDmdPlatform):
             config = self.machine.config_validator.validate_config(
                 config_spec='smartmatrix',
                 source=config)
-            self.devices[name] = SmartMatrixDevice(config, machine)
+            if config['partial_updates'] and not config['old_cookie']:
+                raise ConfigFileError("Smartmatrix {} needs old_cookie for partial_updates.".format(name))
+            self.devices[name] = SmartMatrixDevice(config, machine, name)
 
     @asyncio.coroutine
     def initialize(self):
@@ -67,11 +71,13 @@ class SmartMatrixDevice(DmdPlatformInterface):
 
     """A smartmatrix device."""
 
-    def __init__(self, config, machine):
+    def __init__(self, config, machine, name="smartmatrix"):
         """Initialise smart matrix device."""
         self.config = config
+        self.name = name
         self.reader = None
         self.writer = None
+        self.frame_writer = None    # type: DmdFrameWriter
         self.machine = machine
         self.log = logging.getLogger('SmartMatrixDevice')
 
@@ -83,18 +89,45 @@ class SmartMatrixDevice(DmdPlatformInterface):
             url=self.config['port'], baudrate=self.config['baud'], limit=0)
         self.reader, self.writer = yield from connector
 
+        if self.config['old_cookie']:
+            header = bytes([0x01])
+        else:
+            header = bytes([0xBA, 0x11, 0x00, 0x03, 0x04, 0x00, 0x00, 0x00])
+        self.frame_writer = DmdFrameWriter(self.machine, self.name, self.writer, header, self._get_partial_header)
+
+    @property
+    def supports_partial_updates(self):
+        """Return true if the firmware supports partial updates.
+
+        This is the case for the firmware in tools/smart_matrix_dmd_teensy_code.
+        """
+        return self.config['partial_updates']
+
+    @staticmethod
+    def _get_partial_header(start, end):
+        """Return command 0x02 followed by offset and length of the region."""
+        return struct.pack(">BHH", 0x02, start, end - start)
+
     def stop(self):
         """Stop device."""
+        if self.frame_writer:
+            self.frame_writer.stop()
+            self.frame_writer = None
+
         if self.writer:
             self.log.info("Disconnecting from SmartMatrix RGB DMD hardware.")
             self.writer.close()
             self.writer = None
 
     def update(self, data):
-        """Update DMD data."""
-        if self.writer:
-            if self.config['old_cookie']:
-                self.writer.write(bytearray([0x01]))
-            else:
-                self.writer.write(bytearray([0xBA, 0x11, 0x00, 0x03, 0x04, 0x00, 0x00, 0x00]))
-            self.writer.write(bytearray(data))
+        """Update DMD data.
+
+        Frames which arrive faster than the serial link can send them are dropped.
+        """
+        if self.frame_writer:
+            self.frame_writer.update(data)
+
+    def update_partial(self, data, start, end):
+        """Update only the changed region of the DMD."""
+        if self.frame_writer:
+            self.frame_writer.update(data, start, end)
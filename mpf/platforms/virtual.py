@@ -258,9 +258,12 @@ class VirtualDmd(DmdPlatformInterface):
 
     """Virtual DMD."""
 
+    supports_partial_updates = True
+
     def __init__(self):
         """Initialise virtual DMD."""
         self.data = None
+        self.partial_updates = []
 
     def update(self, data: bytes):
         """Update data on the DMD.
@@ -270,6 +273,11 @@ class VirtualDmd(DmdPlatformInterface):
         """
         self.data = data
 
+    def update_partial(self, data: bytes, start: int, end: int):
+        """Update part of the DMD."""
+        self.partial_updates.append((start, end))
+        self.data = data
+
 
 class VirtualSwitch(SwitchPlatformInterface):
 
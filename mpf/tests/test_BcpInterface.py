@@ -190,6 +190,49 @@ class TestBcpInterface(MpfBcpTestCase):
         self.hit_switch_and_run("s_test", .1)
         self.assertFalse(self._bcp_client.send_queue)
 
+    def test_monitor_batching(self):
+        self._bcp_client.send_queue.clear()
+
+        for category in ("events", "switches", "devices"):
+            self._bcp_client.receive_queue.put_nowait(('monitor_start', {'category': category, 'batch': 'true'}))
+        self._bcp_client.receive_queue.put_nowait(('monitor_start', {'category': 'modes', 'batch': 'true'}))
+        self.advance_time_and_run()
+
+        self.assertIn(("monitor_batching", {"category": "events", "enabled": True}), self._bcp_client.send_queue)
+        self.assertIn(("monitor_batching", {"category": "modes", "enabled": False}), self._bcp_client.send_queue)
+        self._bcp_client.send_queue.clear()
+
+        # all changes of one loop iteration end up in one message per category
+        self.hit_and_release_switch("s_test")
+        self.hit_switch_and_run("s_test2", .1)
+        self.machine.events.post("test1")
+        self.machine.events.post("test2")
+        self.advance_time_and_run()
+
+        self.assertNotIn("switch", [command for command, _ in self._bcp_client.send_queue])
+        self.assertNotIn("device", [command for command, _ in self._bcp_client.send_queue])
+        self.assertNotIn("monitored_event", [command for command, _ in self._bcp_client.send_queue])
+
+        batches = [kwargs for command, kwargs in self._bcp_client.send_queue if command == "monitor_batch"]
+        switches = [batch["items"] for batch in batches if batch["category"] == "switches"]
+        self.assertEqual([[{"name": "s_test", "state": 1}, {"name": "s_test", "state": 0}],
+                          [{"name": "s_test2", "state": 1}]], switches)
+
+        devices = [batch["items"] for batch in batches if batch["category"] == "devices"]
+        self.assertEqual({"type": "switch", "name": "s_test", "changes": {"state": [0, 0]},
+                          "state": {'state': 0, 'recycle_jitter_count': 0}}, devices[0][0])
+
+        events = [item["event_name"] for batch in batches if batch["category"] == "events" for item in batch["items"]]
+        self.assertLess(events.index("test1"), events.index("test2"))
+
+        # stop batching
+        self._bcp_client.receive_queue.put_nowait(('monitor_stop', {'category': 'switches'}))
+        self.advance_time_and_run()
+        self._bcp_client.send_queue.clear()
+        self.hit_switch_and_run("s_test", .1)
+        self.assertNotIn("switches", [kwargs.get("category") for command, kwargs in self._bcp_client.send_queue])
+        self.assertNotIn("switch", [command for command, _ in self._bcp_client.send_queue])
+
     def test_mode_monitor(self):
         self.assertIn('mode1', self.machine.modes)
         self.assertIn('mode2', self.machine.modes)
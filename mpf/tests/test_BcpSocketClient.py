@@ -1,7 +1,9 @@
 import unittest
-from unittest.mock import MagicMock
+from unittest.mock import MagicMock, patch
 
-from mpf.core.bcp.bcp_socket_client import decode_command_string, encode_command_string
+from mpf.core.bcp import bcp_socket_client
+from mpf.core.bcp.bcp_socket_client import decode_command_string, encode_command_string, encode_binary_frame, \
+    decode_binary_frame, BINARY_FRAME_HEADER
 from mpf.tests.MpfTestCase import MpfTestCase
 from mpf.tests.loop import MockQueueSocket
 
@@ -97,6 +99,22 @@ class TestBcpSocketClientEncoding(unittest.TestCase):
         self.assertEqual(decoded_dict['dict2'][1],
                          dict(key3='value5', key4='value6'))
 
+    def test_binary_frame(self):
+        frame = encode_binary_frame('Play', some_int=7, some_float=2.0, some_none=None, some_bool=True,
+                                    some_str="a&b=c\n", some_list=[1, {"a": "b"}], rawbytes=b'\x00\n' * 10)
+        payload_length, bytes_length = BINARY_FRAME_HEADER.unpack(frame[:BINARY_FRAME_HEADER.size])
+        self.assertEqual(20, bytes_length)
+        self.assertEqual(BINARY_FRAME_HEADER.size + payload_length + bytes_length, len(frame))
+
+        payload = frame[BINARY_FRAME_HEADER.size:BINARY_FRAME_HEADER.size + payload_length]
+        self.assertEqual(('play', dict(some_int=7, some_float=2.0, some_none=None, some_bool=True,
+                                       some_str="a&b=c\n", some_list=[1, {"a": "b"}], rawbytes=b'\x00\n' * 10)),
+                         decode_binary_frame(payload, frame[-bytes_length:]))
+
+        # no rawbytes
+        frame = encode_binary_frame('trigger', name="test")
+        self.assertEqual(('trigger', dict(name="test")), decode_binary_frame(frame[BINARY_FRAME_HEADER.size:]))
+
 
 class MockBcpQueueSocket(MockQueueSocket):
 
@@ -109,6 +127,30 @@ class MockBcpQueueSocket(MockQueueSocket):
         return super().send(data)
 
 
+class MockBlockingBcpQueueSocket(MockBcpQueueSocket):
+
+    """Mock Queue Socket for BCP which can stop accepting data."""
+
+    def __init__(self, loop):
+        super().__init__(loop)
+        self.blocked = False
+
+    def write_ready(self):
+        return not self.blocked
+
+    def send(self, data):
+        if self.blocked:
+            raise BlockingIOError()
+        # the transport reuses its buffer
+        return super().send(bytes(data))
+
+    def get_sent_data(self):
+        data = b''
+        while not self.send_queue.empty():
+            data += self.send_queue.get_nowait()
+        return data
+
+
 class TestBcpSocketClient(MpfTestCase):
 
     def __init__(self, methodName='runTest'):
@@ -163,6 +205,43 @@ class TestBcpSocketClient(MpfTestCase):
         self.client_socket.recv_queue.append(b'invalid_method?param1=1&param2=2\n')
         self.advance_time_and_run()
 
+    def _get_sent_data(self):
+        data = b''
+        while not self.client_socket.send_queue.empty():
+            data += self.client_socket.send_queue.get_nowait()
+        return data
+
+    def testBinaryFraming(self):
+        self.advance_time_and_run()
+        self._get_sent_data()
+
+        # binary framing is off by default
+        self.client_socket.recv_queue.append(b'hello?version=1.1&binary_framing=bool:True\n')
+        self.advance_time_and_run()
+        self.machine.bcp.transport.send_to_client(self._bcp_client, "trigger", name="test")
+        self.advance_time_and_run()
+        self.assertEqual(b'trigger?name=test\n', self._get_sent_data())
+
+        # both sides offer binary framing
+        self._bcp_client.binary_framing = True
+        self.client_socket.recv_queue.append(b'hello?version=1.1&binary_framing=bool:True\n')
+        self.advance_time_and_run()
+        self.machine.bcp.transport.send_to_client(self._bcp_client, "trigger", name="test", value=7)
+        self.advance_time_and_run()
+        self.assertEqual(b'framing?mode=binary\n' + encode_binary_frame("trigger", name="test", value=7),
+                         self._get_sent_data())
+
+        # the host switches too
+        receiver = MagicMock()
+        self.machine.bcp.interface.register_command_callback("receive_bytes", receiver)
+        self.client_socket.recv_queue.append(b'framing?mode=binary\n')
+        data = encode_binary_frame("receive_bytes", name="default", rawbytes=b'0' * 4096)
+        # frame split across two packets
+        self.client_socket.recv_queue.append(data[:5])
+        self.client_socket.recv_queue.append(data[5:])
+        self.advance_time_and_run()
+        receiver.assert_called_once_with(name="default", client=self._bcp_client, rawbytes=b'0' * 4096)
+
 
 class TestBcpSocketMultipleClients(MpfTestCase):
 
@@ -182,9 +261,9 @@ class TestBcpSocketMultipleClients(MpfTestCase):
         self._bcp_client_2 = self.machine.bcp.transport.get_named_client("another_display")
 
     def _mock_loop(self):
-        self.client_socket_1 = MockBcpQueueSocket(self.loop)
+        self.client_socket_1 = MockBlockingBcpQueueSocket(self.loop)
         self.clock.mock_socket("localhost", 5050, self.client_socket_1)
-        self.client_socket_2 = MockBcpQueueSocket(self.loop)
+        self.client_socket_2 = MockBlockingBcpQueueSocket(self.loop)
         self.clock.mock_socket("localhost", 9001, self.client_socket_2)
 
     def getConfigFile(self):
@@ -206,3 +285,60 @@ class TestBcpSocketMultipleClients(MpfTestCase):
         self.client_socket_2.recv_queue.append(b'receive_msg?param1=1&param2=2\n')
         self.advance_time_and_run()
         receiver.assert_called_once_with(param1="1", param2="2", client=self._bcp_client_2)
+
+    def testEncodeOnce(self):
+        self.advance_time_and_run()
+        self.client_socket_1.get_sent_data()
+        self.client_socket_2.get_sent_data()
+
+        with patch.object(bcp_socket_client, "encode_command_string", wraps=encode_command_string) as encode:
+            self.machine.bcp.transport.send_to_all_clients("trigger", name="test")
+        encode.assert_called_once_with("trigger", name="test")
+
+        self.advance_time_and_run()
+        self.assertEqual(b'trigger?name=test\n', self.client_socket_1.get_sent_data())
+        self.assertEqual(b'trigger?name=test\n', self.client_socket_2.get_sent_data())
+
+    def testBackpressure(self):
+        self.advance_time_and_run()
+        self.client_socket_1.get_sent_data()
+        self.client_socket_2.get_sent_data()
+
+        self._bcp_client_1.max_send_queue = 3
+        self._bcp_client_1._sender.transport.set_write_buffer_limits(high=50)
+        self.machine.bcp.transport.add_handler_to_transport("_switches", self._bcp_client_1)
+
+        # the first message fills the transport buffer
+        self.client_socket_1.blocked = True
+        self.machine.bcp.transport.send_to_all_clients("trigger", name="a" * 100)
+        for i in range(5):
+            self.machine.bcp.transport.send_to_clients_with_handler("_switches", "switch", name="s{}".format(i))
+        # other messages are never dropped
+        self.machine.bcp.transport.send_to_all_clients("trigger", name="b")
+        self.advance_time_and_run()
+
+        # the slow client does not block the other one
+        self.assertEqual(b'trigger?name=' + b'a' * 100 + b'\ntrigger?name=b\n',
+                         self.client_socket_2.get_sent_data())
+        self.assertEqual(b'', self.client_socket_1.get_sent_data())
+        self.assertEqual(2, self._bcp_client_1.dropped_messages)
+
+        self.client_socket_1.blocked = False
+        self.advance_time_and_run()
+        self.assertEqual(b'trigger?name=' + b'a' * 100 + b'\nswitch?name=s2\nswitch?name=s3\nswitch?name=s4\n'
+                         b'trigger?name=b\n', self.client_socket_1.get_sent_data())
+        self.assertFalse(self._bcp_client_1._send_queue)
+
+        # drop the newest messages instead
+        self._bcp_client_1.monitor_drop_policy = "drop_newest"
+        self.client_socket_1.blocked = True
+        self.machine.bcp.transport.send_to_all_clients("trigger", name="a" * 100)
+        for i in range(5):
+            self.machine.bcp.transport.send_to_clients_with_handler("_switches", "switch", name="s{}".format(i))
+        self.advance_time_and_run()
+        self.assertEqual(4, self._bcp_client_1.dropped_messages)
+
+        self.client_socket_1.blocked = False
+        self.advance_time_and_run()
+        self.assertEqual(b'trigger?name=' + b'a' * 100 + b'\nswitch?name=s0\nswitch?name=s1\nswitch?name=s2\n',
+                         self.client_socket_1.get_sent_data())
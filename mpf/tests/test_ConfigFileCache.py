@@ -0,0 +1,87 @@
+"""Test the file cache for parsed config and show files."""
+import os
+import shutil
+import tempfile
+import unittest
+
+from mpf.core.config_cache import ConfigFileCache
+from mpf.file_interfaces.yaml_interface import YamlInterface
+
+
+class TestConfigFileCache(unittest.TestCase):
+
+    def setUp(self):
+        # do not use the in-memory cache of the YamlInterface
+        YamlInterface.cache = False
+        self.path = tempfile.mkdtemp()
+        self.cache_file = os.path.join(self.path, "cache")
+        self.config_file = os.path.join(self.path, "config.yaml")
+        self._write_config("#config_version=5\nswitches:\n  s_test:\n    number: 1\n")
+
+    def tearDown(self):
+        YamlInterface.cache = True
+        shutil.rmtree(self.path)
+
+    def _write_config(self, content):
+        with open(self.config_file, "w") as f:
+            f.write(content)
+
+    def test_load(self):
+        cache = ConfigFileCache(self.cache_file)
+        config = cache.load(self.config_file)
+        self.assertEqual({"switches": {"s_test": {"number": 1}}}, config)
+        self.assertEqual(0, cache.hits)
+        self.assertEqual(1, cache.misses)
+
+        # every hit returns a new copy
+        config["switches"]["s_test"]["number"] = 2
+        self.assertEqual({"switches": {"s_test": {"number": 1}}}, cache.load(self.config_file))
+        self.assertEqual(1, cache.hits)
+
+        # entries survive a restart
+        cache.save()
+        cache = ConfigFileCache(self.cache_file)
+        self.assertEqual({"switches": {"s_test": {"number": 1}}}, cache.load(self.config_file))
+        self.assertEqual(1, cache.hits)
+        self.assertEqual(0, cache.misses)
+
+        # a changed file is parsed again
+        self._write_config("#config_version=5\nswitches:\n  s_test:\n    number: 3\n")
+        self.assertEqual({"switches": {"s_test": {"number": 3}}}, cache.load(self.config_file))
+        self.assertEqual(1, cache.misses)
+
+    def test_verify_version(self):
+        cache = ConfigFileCache(self.cache_file)
+        cache.load(self.config_file)
+
+        # an entry which was loaded without version check does not skip the check
+        self._write_config("#config_version=3\nswitches:\n  s_test:\n    number: 1\n")
+        cache.load(self.config_file)
+        with self.assertRaises(ValueError):
+            cache.load(self.config_file, verify_version=True)
+
+    def test_missing_file(self):
+        cache = ConfigFileCache(self.cache_file)
+        self.assertEqual({}, cache.load(os.path.join(self.path, "missing.yaml"), halt_on_error=False))
+        with self.assertRaises(IOError):
+            cache.load(os.path.join(self.path, "missing.yaml"))
+
+    def test_manifest(self):
+        cache = ConfigFileCache(self.cache_file)
+        cache.load(self.config_file)
+        manifest = cache.get_manifest()
+        self.assertEqual([os.path.abspath(self.config_file)], list(manifest.keys()))
+        self.assertTrue(ConfigFileCache.check_manifest(manifest))
+
+        # a new mtime with the same content is fine
+        stat = os.stat(self.config_file)
+        os.utime(self.config_file, (stat.st_atime, stat.st_mtime + 10))
+        self.assertTrue(ConfigFileCache.check_manifest(manifest))
+
+        # same size but different content
+        self._write_config("#config_version=5\nswitches:\n  s_test:\n    number: 2\n")
+        os.utime(self.config_file, (stat.st_atime, stat.st_mtime + 20))
+        self.assertFalse(ConfigFileCache.check_manifest(manifest))
+
+        os.remove(self.config_file)
+        self.assertFalse(ConfigFileCache.check_manifest(manifest))
@@ -0,0 +1,62 @@
+"""Test config validator."""
+import unittest
+from unittest.mock import MagicMock
+
+from mpf.core.config_validator import ConfigValidator
+from mpf.exceptions.ConfigFileError import ConfigFileError
+
+
+class TestConfigValidator(unittest.TestCase):
+
+    def setUp(self):
+        self.machine = MagicMock()
+        self.machine.machine_config = {'mpf': {'allow_invalid_config_sections': False}}
+        self.validator = ConfigValidator(self.machine)
+
+    def test_validate_config(self):
+        config = self.validator.validate_config("switches", {"number": "1", "type": "nc", "ignore_window_ms": "1s"})
+        self.assertEqual("1", config['number'])
+        self.assertEqual("nc", config['type'])
+        self.assertEqual(1000, config['ignore_window_ms'])
+        self.assertEqual([], config['events_when_activated'])
+        self.assertIsNone(config['platform_settings'])
+
+        # validating again uses the cached spec and returns fresh values
+        config2 = self.validator.validate_config("switches", {"number": "2"})
+        self.assertEqual("2", config2['number'])
+        self.assertEqual("no", config2['type'])
+        self.assertIsNot(config['events_when_activated'], config2['events_when_activated'])
+
+        with self.assertRaises(ConfigFileError):
+            self.validator.validate_config("switches", {"number": "1", "invalid": True})
+
+        with self.assertRaises(ValueError):
+            self.validator.validate_config("switches", {})
+
+    def test_base_spec(self):
+        config = self.validator.validate_config("switches", {"number": "1", "priority": "3"},
+                                                base_spec="config_player_common")
+        self.assertEqual(3, config['priority'])
+        self.assertEqual("1", config['number'])
+
+        # priority is not part of the switches spec without base_spec
+        with self.assertRaises(ConfigFileError):
+            self.validator.validate_config("switches", {"number": "1", "priority": "3"})
+
+    def test_validate_item(self):
+        self.assertEqual({"a": 100, "b": None}, self.validator.validate_item({"a": "100ms", "b": "None"}, "str:ms",
+                                                                             "test"))
+        self.assertEqual(0.5, self.validator.validate_config_item("single|float(0,1)|0.5", ("test", "test")))
+        self.assertEqual({1, 2}, self.validator.validate_config_item("set|int|", ("test", "test"), "1, 2, 2"))
+
+        with self.assertRaises(ConfigFileError):
+            self.validator.validate_config_item("single|float(0,1)|", ("test", "test"), 2)
+
+        with self.assertRaises(ConfigFileError):
+            self.validator.validate_config_item("single|invalid|", ("test", "test"), 2)
+
+    def test_spec_changes(self):
+        self.validator.validate_config("switches", {"number": "1"})
+        ConfigValidator.load_device_config_spec("test_device", "value: single|int|7\n")
+        self.assertEqual({"value": 7}, self.validator.validate_config("test_device", {}))
+        del ConfigValidator.config_spec["test_device"]
@@ -1,5 +1,8 @@
 """Test the bonus mode."""
+import copy
 import os
+import shutil
+import tempfile
 import time
 from unittest.mock import mock_open, patch
 
@@ -103,3 +106,167 @@ class TestDataManager(MpfTestCase):
 
         self.assertEqual({}, manager.get_data("hallo"))
         self.assertEqual({}, manager.get_data("invalid"))
+
+    def test_journal(self):
+        path = tempfile.mkdtemp()
+        self.addCleanup(shutil.rmtree, path)
+        self.machine.config['mpf']['paths']['journal_test'] = os.path.join(path, "test.yaml")
+        self.machine.config['mpf']['use_data_journal'] = True
+        self.machine.config['mpf']['data_journal_compact_records'] = 4
+
+        manager = DataManager(self.machine, "journal_test")
+        manager.data = {"a": 1, "b": {"c": 2, "d": 3}}
+        manager._write_to_disk(copy.deepcopy(manager.data))
+        self.assertEqual(2, manager._journal_records)
+        self.assertFalse(os.path.isfile(manager.filename))
+
+        # only changes are appended
+        manager.data["b"]["c"] = 4
+        del manager.data["b"]["d"]
+        manager._write_to_disk(copy.deepcopy(manager.data))
+        self.assertEqual(4, manager._journal_records)
+        with open(manager.journal_file) as f:
+            self.assertEqual("('s', ('b', 'c'), 4)\n('d', ('b', 'd'))\n", "".join(f.readlines()[3:]))
+
+        manager2 = DataManager(self.machine, "journal_test")
+        self.assertEqual({"a": 1, "b": {"c": 4}}, manager2.data)
+
+        # too many records. compact into a snapshot
+        manager.data["a"] = 5
+        manager._write_to_disk(copy.deepcopy(manager.data))
+        self.assertEqual(0, manager._journal_records)
+        self.assertEqual(0, os.path.getsize(manager.journal_file))
+        manager2 = DataManager(self.machine, "journal_test")
+        self.assertEqual({"a": 5, "b": {"c": 4}}, manager2.data)
+
+        # an incomplete last record (e.g. after a power loss) is ignored
+        manager.data["e"] = "test"
+        manager._write_to_disk(copy.deepcopy(manager.data))
+        with open(manager.journal_file, 'a') as f:
+            f.write("('s', ('a',), 7")
+        manager2 = DataManager(self.machine, "journal_test")
+        self.assertEqual({"a": 5, "b": {"c": 4}, "e": "test"}, manager2.data)
+        self.assertTrue(manager2._compact_needed)
+
+    def test_journal_crash_while_compacting(self):
+        path = tempfile.mkdtemp()
+        self.addCleanup(shutil.rmtree, path)
+        self.machine.config['mpf']['paths']['journal_test'] = os.path.join(path, "test.yaml")
+        self.machine.config['mpf']['use_data_journal'] = True
+        self.machine.config['mpf']['data_journal_compact_records'] = 3
+
+        manager = DataManager(self.machine, "journal_test")
+        manager.data = {"a": 1, "b": 2}
+        manager._write_to_disk(copy.deepcopy(manager.data))
+        del manager.data["b"]
+        manager._write_to_disk(copy.deepcopy(manager.data))
+        self.assertEqual(3, manager._journal_records)
+
+        # crash after writing the snapshot but before truncating the journal
+        manager.data["a"] = 5
+        manager.data["b"] = 6
+        with patch.object(manager, "_truncate_journal", side_effect=OSError("crash")):
+            with self.assertRaises(OSError):
+                manager._write_to_disk(copy.deepcopy(manager.data))
+        self.assertTrue(os.path.getsize(manager.journal_file))
+
+        # the old journal is not replayed on top of the newer snapshot
+        manager2 = DataManager(self.machine, "journal_test")
+        self.assertEqual({"a": 5, "b": 6}, manager2.data)
+        self.assertEqual(0, manager2._journal_records)
+        self.assertTrue(manager2._compact_needed)
+
+        # the next write starts a new journal for the new snapshot
+        manager2.data["a"] = 7
+        manager2._write_to_disk(copy.deepcopy(manager2.data))
+        self.assertEqual({"a": 7, "b": 6}, DataManager(self.machine, "journal_test").data)
+
+    def test_journal_changed_keys(self):
+        path = tempfile.mkdtemp()
+        self.addCleanup(shutil.rmtree, path)
+        self.machine.config['mpf']['paths']['journal_test'] = os.path.join(path, "test.yaml")
+        self.machine.config['mpf']['use_data_journal'] = True
+
+        with patch('mpf.core.data_manager._thread.start_new_thread'):
+            manager = DataManager(self.machine, "journal_test")
+
+        # save_key and remove_key only write records for their keys without comparing all data
+        with patch.object(manager, "_get_changes") as get_changes:
+            manager.save_key("a", 1)
+            manager.save_key("b", {"c": 2})
+            manager._write_pending()
+            with open(manager.journal_file) as f:
+                self.assertEqual(["('s', ('a',), 1)\n", "('s', ('b',), {'c': 2})\n"], sorted(f.readlines()[1:]))
+
+            # unchanged values are skipped
+            manager.remove_key("a")
+            manager.save_key("b", {"c": 2})
+            manager._write_pending()
+            with open(manager.journal_file) as f:
+                self.assertEqual("('d', ('a',))\n", f.readlines()[-1])
+            self.assertEqual(3, manager._journal_records)
+            self.assertFalse(get_changes.called)
+
+        self.assertEqual({"b": {"c": 2}}, DataManager(self.machine, "journal_test").data)
+
+        # save_all compares the whole data
+        manager.data["b"]["c"] = 3
+        manager.save_all()
+        manager._write_pending()
+        with open(manager.journal_file) as f:
+            self.assertEqual("('s', ('b', 'c'), 3)\n", f.readlines()[-1])
+        self.assertEqual({"b": {"c": 3}}, DataManager(self.machine, "journal_test").data)
+
+    def test_coalesced_writes_and_stats(self):
+        path = tempfile.mkdtemp()
+        self.addCleanup(shutil.rmtree, path)
+        self.machine.config['mpf']['paths']['stats_test'] = os.path.join(path, "test.yaml")
+        stats = []
+        self.machine.register_monitor("data_manager", lambda **kwargs: stats.append(kwargs))
+
+        # write from the test instead of the writing thread
+        with patch('mpf.core.data_manager._thread.start_new_thread'):
+            manager = DataManager(self.machine, "stats_test")
+        manager.save_key("a", 1)
+        manager.save_key("b", 2)
+        manager.save_key("a", 3)
+        self.assertEqual(0, manager.writes)
+        self.assertTrue(manager._dirty.is_set())
+
+        # all three changes end up in one write
+        manager._write_pending()
+        self.assertFalse(manager._dirty.is_set())
+        self.assertEqual(1, manager.writes)
+        self.assertEqual(3, manager.save_requests)
+        self.assertEqual(os.path.getsize(manager.filename), manager.bytes_written)
+        self.assertGreater(manager.last_write_latency, 0)
+        self.assertEqual({"a": 3, "b": 2}, DataManager(self.machine, "stats_test").data)
+        self.assertFalse(os.path.isfile(os.path.join(path, "_test.yaml")))
+
+        # monitors are notified in the main thread
+        self.assertEqual([], stats)
+        self.advance_time_and_run(.1)
+        self.assertEqual(1, len(stats))
+        self.assertEqual("stats_test", stats[0]["name"])
+        self.assertEqual(1, stats[0]["writes"])
+
+    def test_migrate_to_json(self):
+        path = tempfile.mkdtemp()
+        self.addCleanup(shutil.rmtree, path)
+        with open(os.path.join(path, "test.yaml"), "w") as f:
+            f.write("switches:\n  s_test: 5\n")
+        self.machine.config['mpf']['paths']['json_test'] = os.path.join(path, "test.json")
+
+        with patch('mpf.core.data_manager._thread.start_new_thread'):
+            manager = DataManager(self.machine, "json_test")
+        self.assertEqual({"switches": {"s_test": 5}}, manager.data)
+
+        # the data is written in the new format right away
+        self.assertTrue(manager._dirty.is_set())
+        manager._write_pending()
+        with open(os.path.join(path, "test.json")) as f:
+            self.assertEqual('{"switches":{"s_test":5}}', f.read())
+
+        manager.save_key("switches", {"s_test": 6})
+        manager._write_pending()
+        self.assertEqual({"switches": {"s_test": 6}}, DataManager(self.machine, "json_test").data)
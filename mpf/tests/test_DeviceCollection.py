@@ -84,3 +84,23 @@ class TestDeviceCollection(MpfTestCase):
             'led1, led2'))
         self.assertIn(led1, self.machine.lights.multilist_to_objects(
             'tag1, led3'))
+
+    def test_index_invalidation(self):
+        led1 = self.machine.lights['led1']
+        self.assertEqual(led1, self.machine.lights.number('1'))
+        self.assertIn(led1, self.machine.lights.items_tagged('tag1'))
+
+        # reloading the config updates tags and numbers
+        config = dict(led1.config)
+        config['tags'] = ['new_tag']
+        config['number'] = '100'
+        led1.load_config(config)
+        self.assertEqual([led1], self.machine.lights.items_tagged('new_tag'))
+        self.assertNotIn(led1, self.machine.lights.items_tagged('tag1'))
+        self.assertEqual(led1, self.machine.lights.number('100'))
+        self.assertIsNone(self.machine.lights.number('1'))
+
+        # removed devices are no longer returned
+        del self.machine.lights['led1']
+        self.assertEqual([], self.machine.lights.items_tagged('new_tag'))
+        self.assertIsNone(self.machine.lights.number('100'))
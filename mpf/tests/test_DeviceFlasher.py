@@ -29,3 +29,30 @@ class TestDeviceDriver(MpfTestCase):
         self.assertFalse(self.machine.coils.flasher_01.hw_driver.disable.called)
         self.advance_time_and_run(.1)
         self.assertTrue(self.machine.coils.flasher_01.hw_driver.disable.called)
+
+    def testSoftwareFade(self):
+        self.machine.coils.flasher_01.enable = MagicMock()
+        self.machine.coils.flasher_01.disable = MagicMock()
+
+        # fade is continued by the light controller until it is done
+        self.machine.lights.flasher_01.color("white", fade_ms=200)
+        self.advance_time_and_run(.1)
+        hold_power = self.machine.coils.flasher_01.enable.call_args[1]['hold_power']
+        self.assertAlmostEqual(.5, hold_power, delta=.1)
+        self.assertIn(self.machine.lights.flasher_01, self.machine.light_controller._fading_lights)
+
+        self.advance_time_and_run(.2)
+        self.machine.coils.flasher_01.enable.assert_called_with(hold_power=1.0)
+        self.assertFalse(self.machine.light_controller._fading_lights)
+        self.assertIsNone(self.machine.light_controller._fade_task)
+
+        # a new color without fade stops the running fade
+        self.machine.lights.flasher_01.color("white", fade_ms=200)
+        self.advance_time_and_run(.05)
+        self.machine.lights.flasher_01.off(fade_ms=0)
+        self.advance_time_and_run(.2)
+        self.assertTrue(self.machine.coils.flasher_01.disable.called)
+        self.machine.coils.flasher_01.enable.reset_mock()
+        self.advance_time_and_run(.2)
+        self.assertFalse(self.machine.coils.flasher_01.enable.called)
+        self.assertFalse(self.machine.light_controller._fading_lights)
@@ -1,4 +1,6 @@
 """Test the LED device."""
+from unittest.mock import MagicMock
+
 from mpf.core.rgb_color import RGBColor
 from mpf.tests.MpfTestCase import MpfTestCase
 
@@ -314,3 +316,68 @@ class TestLed(MpfTestCase):
         self.assertEqual(80 / 255.0, led.hw_drivers["red"].current_brightness)
         self.assertEqual(80 / 255.0, led.hw_drivers["green"].current_brightness)
         self.assertEqual(80 / 255.0, led.hw_drivers["blue"].current_brightness)
+
+    def test_color_calculated_once_per_light(self):
+        led = self.machine.lights.led1
+        led.color_correct = MagicMock(side_effect=lambda color: color)
+
+        led.color(RGBColor((100, 50, 20)))
+        self.advance_time_and_run(1)
+        led.color_correct.reset_mock()
+        self.assertEqual(100 / 255.0, led.hw_drivers["red"].current_brightness)
+        self.assertEqual(50 / 255.0, led.hw_drivers["green"].current_brightness)
+        self.assertEqual(20 / 255.0, led.hw_drivers["blue"].current_brightness)
+        self.assertEqual(1, led.color_correct.call_count)
+
+        # a new color at the same time is not served from the cache
+        led.color(RGBColor((10, 20, 30)))
+        self.assertEqual(10 / 255.0, led.hw_drivers["red"].current_brightness)
+        self.assertEqual(30 / 255.0, led.hw_drivers["blue"].current_brightness)
+
+    def test_stack_index_and_stats(self):
+        led = self.machine.lights.led1
+        for i in range(10):
+            led.color('red', priority=i % 3, key=i)
+        self.assertEqual([2, 2, 2, 1, 1, 1, 0, 0, 0, 0], [entry.priority for entry in led.stack])
+        # same priority and start time. older entries stay on top
+        self.assertEqual([2, 5, 8], [entry.key for entry in led.stack[0:3]])
+
+        led.remove_from_stack_by_key(5)
+        led.remove_from_stack_by_key(0)
+        led.remove_from_stack_by_key("unknown")
+        self.assertEqual([2, 8, 1, 4, 7, 3, 6, 9], [entry.key for entry in led.stack])
+        self.assertEqual(1, led._get_priority_from_key(7))
+
+        self.assertEqual({"size": 8, "max_size": 10, "updates": 12},
+                         led.get_monitorable_state()["stack_stats"])
+
+        led.clear_stack()
+        self.assertEqual(0, led.get_monitorable_state()["stack_stats"]["size"])
+
+    def test_color_calculated_once_per_fade_step(self):
+        led = self.machine.lights.led1
+        led.color_correct = MagicMock(side_effect=lambda color: color)
+
+        led.color(RGBColor((100, 100, 100)), fade_ms=1000)
+        self.advance_time_and_run(.5)
+        led.color_correct.reset_mock()
+
+        # channels read at different times share one calculation
+        red = led.hw_drivers["red"].current_brightness
+        self.advance_time_and_run(.1)
+        self.assertEqual(red, led.hw_drivers["green"].current_brightness)
+        self.advance_time_and_run(.1)
+        self.assertEqual(red, led.hw_drivers["blue"].current_brightness)
+        self.assertEqual(1, led.color_correct.call_count)
+
+        # the next read of a channel continues the fade
+        self.assertLess(red, led.hw_drivers["red"].current_brightness)
+        self.assertEqual(2, led.color_correct.call_count)
+
+        # after the fade the color stays cached
+        self.advance_time_and_run(1)
+        led.color_correct.reset_mock()
+        for _ in range(2):
+            self.assertEqual(100 / 255.0, led.hw_drivers["red"].current_brightness)
+            self.assertEqual(100 / 255.0, led.hw_drivers["green"].current_brightness)
+        self.assertEqual(1, led.color_correct.call_count)
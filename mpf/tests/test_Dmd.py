@@ -1,6 +1,32 @@
+import unittest
+from unittest.mock import patch
+
+from mpf.devices import dmd
+from mpf.devices.dmd import get_changed_region
 from mpf.tests.MpfBcpTestCase import MpfBcpTestCase
 
 
+class TestFrameDiff(unittest.TestCase):
+
+    def _test_changed_region(self):
+        frame = bytes(range(256)) * 48
+        self.assertIsNone(get_changed_region(frame, bytes(frame)))
+
+        for start, end in ((0, 1), (12287, 12288), (0, 12288), (100, 101), (63, 65), (1000, 5000)):
+            new_frame = bytearray(frame)
+            new_frame[start] ^= 0xFF
+            if end - 1 != start:
+                new_frame[end - 1] ^= 0xFF
+            self.assertEqual((start, end), get_changed_region(frame, bytes(new_frame)))
+
+    def test_changed_region(self):
+        self._test_changed_region()
+
+    def test_changed_region_without_numpy(self):
+        with patch.object(dmd, "numpy", None):
+            self._test_changed_region()
+
+
 class TestDmd(MpfBcpTestCase):
 
     def getConfigFile(self):
@@ -26,3 +52,27 @@ class TestDmd(MpfBcpTestCase):
         self.machine_run()
 
         self.assertEqual(b'1337', self.machine.rgb_dmds.test_dmd.hw_device.data)
+
+    def testRgbDmdPartialUpdates(self):
+        hw_device = self.machine.rgb_dmds.test_dmd.hw_device
+        frame = bytearray(100)
+        self.machine.rgb_dmds.test_dmd.update(bytes(frame))
+        self.assertEqual(bytes(frame), hw_device.data)
+        self.assertEqual([], hw_device.partial_updates)
+
+        frame[10] = 1
+        frame[20] = 1
+        self.machine.rgb_dmds.test_dmd.update(bytes(frame))
+        self.assertEqual(bytes(frame), hw_device.data)
+        self.assertEqual([(10, 21)], hw_device.partial_updates)
+
+        # unchanged frames are not sent
+        self.machine.rgb_dmds.test_dmd.update(bytes(frame))
+        self.assertEqual([(10, 21)], hw_device.partial_updates)
+
+        # large changes are sent as full frame
+        frame = bytearray(b'\x01' * 100)
+        hw_device.data = None
+        self.machine.rgb_dmds.test_dmd.update(bytes(frame))
+        self.assertEqual(bytes(frame), hw_device.data)
+        self.assertEqual([(10, 21)], hw_device.partial_updates)
@@ -147,6 +147,35 @@ class TestEventManager(MpfFakeGameTestCase, MpfTestCase):
         self.assertEqual(tuple(), self._handler1_args)
         self.assertEqual({'test1': 'test1'}, self._handler1_kwargs)
 
+    def test_event_with_handler_kwargs(self):
+        # handler kwargs are merged with post kwargs and win on conflict
+        self.machine.events.add_handler('test_event', self.event_handler1, test1='handler', test2='handler')
+        self.machine.events.add_handler('test_event', self.event_handler2)
+        self.advance_time_and_run(1)
+
+        post_kwargs = {'test1': 'post', 'test3': 'post'}
+        self.machine.events.post('test_event', **post_kwargs)
+        self.advance_time_and_run(1)
+
+        self.assertEqual({'test1': 'handler', 'test2': 'handler', 'test3': 'post'}, self._handler1_kwargs)
+        self.assertEqual({'test1': 'post', 'test3': 'post'}, self._handler2_kwargs)
+
+    def _add_handler_during_dispatch(self, **kwargs):
+        del kwargs
+        self.machine.events.add_handler('test_event', self.event_handler2, priority=0)
+
+    def test_handler_added_during_dispatch(self):
+        # handlers added while the event is processed are called on the next post only
+        self.machine.events.add_handler('test_event', self._add_handler_during_dispatch, priority=10)
+        self.advance_time_and_run(1)
+
+        self.post_event('test_event')
+        self.assertEqual(0, self._handler2_called)
+
+        self.machine.events.remove_handler(self._add_handler_during_dispatch)
+        self.post_event('test_event')
+        self.assertEqual(1, self._handler2_called)
+
     def test_event_with_callback(self):
         # test that a callback is called when the event is done
         self.machine.events.add_handler('test_event', self.event_handler1)
@@ -222,6 +251,34 @@ class TestEventManager(MpfFakeGameTestCase, MpfTestCase):
         self.assertEqual(tuple(), self._handler1_args)
         self.assertEqual(dict(), self._handler1_kwargs)
 
+    def test_remove_handler_unhashable(self):
+        # handlers of objects which cannot be hashed can still be removed
+        class Unhashable(object):
+            def __init__(self):
+                self.called = 0
+
+            def __eq__(self, other):
+                return self is other
+
+            def handler(self, **kwargs):
+                del kwargs
+                self.called += 1
+
+        obj = Unhashable()
+        self.machine.events.add_handler('test_event1', obj.handler)
+        self.machine.events.add_handler('test_event2', obj.handler)
+        self.machine.events.add_handler('test_event1', self.event_handler1)
+
+        self.post_event('test_event1')
+        self.assertEqual(1, obj.called)
+
+        self.machine.events.remove_handler(obj.handler)
+        self.post_event('test_event1')
+        self.post_event('test_event2')
+        self.assertEqual(1, obj.called)
+        self.assertEqual(2, self._handler1_called)
+        self.assertFalse(self.machine.events.does_event_exist('test_event2'))
+
     def test_remove_handler_by_event(self):
         # tests that a handler can be removed by a handler/event combo, and
         # that only that handler/event combo is removed
@@ -328,6 +385,33 @@ class TestEventManager(MpfFakeGameTestCase, MpfTestCase):
         self.assertEqual(tuple(), self._handler2_args)
         self.assertEqual(dict(), self._handler2_kwargs)
 
+    def test_handler_transaction(self):
+        # handlers are sorted and removed when the transaction ends
+        with self.machine.events.handler_transaction():
+            key1 = self.machine.events.add_handler('test_event', self.event_handler1, priority=100)
+            self.machine.events.add_handler('test_event', self.event_handler2, priority=200)
+            key3 = self.machine.events.add_handler('test_event2', self.event_handler3)
+
+        self.assertEqual([self.event_handler2, self.event_handler1],
+                         [handler.callback for handler in self.machine.events.registered_handlers['test_event']])
+
+        self.post_event('test_event')
+        self.assertEqual([self.event_handler2, self.event_handler1], self._handlers_called)
+
+        with self.machine.events.handler_transaction():
+            self.machine.events.remove_handler_by_key(key1)
+            self.machine.events.remove_handler_by_key(key3)
+            self.machine.events.add_handler('test_event', self.event_handler3, priority=300)
+
+            # events processed during the transaction see the pending changes
+            self._handlers_called = []
+            self.post_event('test_event')
+            self.assertEqual([self.event_handler3, self.event_handler2], self._handlers_called)
+
+        self.assertFalse(self.machine.events.does_event_exist('test_event2'))
+        self.assertEqual([self.event_handler3, self.event_handler2],
+                         [handler.callback for handler in self.machine.events.registered_handlers['test_event']])
+
     def test_does_event_exist(self):
         self.machine.events.add_handler('test_event', self.event_handler1)
 
@@ -591,7 +591,8 @@ class TestFast(MpfTestCase):
 
         # test draw
         self.dmd_cpu.expected_commands = {
-            b'BM:' + frame: False
+            b'BM:': False,
+            frame: False
         }
         dmd.update(frame)
 
@@ -0,0 +1,39 @@
+import os
+import shutil
+import tempfile
+import unittest
+
+from mpf.file_interfaces.json_interface import JsonInterface
+
+
+class TestJsonInterface(unittest.TestCase):
+
+    def setUp(self):
+        self.path = tempfile.mkdtemp()
+        self.interface = JsonInterface()
+
+    def tearDown(self):
+        shutil.rmtree(self.path)
+
+    def test_save_and_load(self):
+        filename = os.path.join(self.path, "test.json")
+        data = {"switches": {"s_test": 5, "s_test2": 0}, "player": {"score": {"top": [100, 50], "average": 1.5}},
+                "flag": True, "none": None}
+        self.interface.save(filename, data)
+        self.assertEqual(data, self.interface.load(filename, verify_version=False))
+
+        # json cannot be used for config files
+        with self.assertRaises(ValueError):
+            self.interface.load(filename)
+
+    def test_invalid_file(self):
+        filename = os.path.join(self.path, "test.json")
+        with open(filename, "w") as f:
+            f.write('{"switches": {')
+
+        self.assertEqual({}, self.interface.load(filename, verify_version=False, halt_on_error=False))
+        with self.assertRaises(ValueError):
+            self.interface.load(filename, verify_version=False)
+
+        self.assertEqual({}, self.interface.load(os.path.join(self.path, "missing.json"), verify_version=False,
+                                                 halt_on_error=False))
@@ -14,3 +14,31 @@ class TestPlaceholderManager(unittest.TestCase):
         # test mod operator
         template = p.build_int_template("a % 7", None)
         self.assertEqual(3, template.evaluate({"a": 10}))
+
+    def test_compiled_templates(self):
+        mock_machine = MagicMock()
+        mock_machine.game = None
+        p = PlaceholderManager(mock_machine)
+
+        parameters = {"a": 10, "b": 3, "c": "test", "d": [1, 2, 3, 4], "e": True}
+        for template_str in ("a % 7", "a + b * 2", "-a ** 2", "not e", "a > b", "a == 10 and b == 3",
+                             "a < b or e", "c[1:3]", "d[b]", "c if e else a", "a / 4 - 1", "a ^ b",
+                             "'abc' != c", "None"):
+            template = p.compile_template(p._parse_template(template_str))
+            self.assertEqual(p.evaluate_template(p._parse_template(template_str), parameters),
+                             template(parameters), template_str)
+
+        # missing params and failed comparisons return the default
+        template = p.build_bool_template("x > 2", True)
+        self.assertTrue(template.evaluate({}))
+        with self.assertRaises(ValueError):
+            template.evaluate({}, fail_on_missing_params=True)
+        self.assertTrue(template.evaluate({"x": "a"}))
+
+        # unsupported expressions fail on evaluation
+        template = p.build_bool_template("a(2)")
+        with self.assertRaises(TypeError):
+            template.evaluate({"a": 3})
+        template = p.build_bool_template("1 < a < 3")
+        with self.assertRaises(AssertionError):
+            template.evaluate({"a": 2})
@@ -1,3 +1,5 @@
+from unittest.mock import MagicMock
+
 from mpf.tests.MpfFakeGameTestCase import MpfFakeGameTestCase
 
 
@@ -108,3 +110,25 @@ class TestShots(MpfFakeGameTestCase):
         self.advance_time_and_run(.01)
         self.assertEqual("42", display1.hw_display.text)
         self.assertEqual("0", display2.hw_display.text)
+
+    def test_coalesced_updates(self):
+        display1 = self.machine.segment_displays.display1
+        self.post_event("test_score")
+        self.start_game()
+        self.advance_time_and_run()
+        self.assertEqual("1: 0", display1.hw_display.text)
+
+        # multiple changes in one loop iteration result in one update
+        display1.hw_display.set_text = MagicMock(wraps=display1.hw_display.set_text)
+        self.machine.game.player.score += 10
+        self.machine.game.player.score += 20
+        self.machine.game.player.score += 30
+        self.advance_time_and_run(.01)
+        display1.hw_display.set_text.assert_called_once_with("1: 60")
+        self.assertEqual("1: 60", display1.hw_display.text)
+
+        # changes of other variables do not update the display
+        display1.hw_display.set_text.reset_mock()
+        self.machine.game.player.ball_test = 2
+        self.advance_time_and_run(.01)
+        display1.hw_display.set_text.assert_not_called()
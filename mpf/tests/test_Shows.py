@@ -529,6 +529,36 @@ class TestShows(MpfTestCase):
         self.assertEqual(copied_show[3]['lights'][self.machine.lights.led_01],
                          dict(color='midnightblue', fade_ms=500, priority=0))
 
+    def test_show_steps_with_tokens(self):
+        show = self.machine.shows['show_assoc_tokens']
+        original = show.get_show_steps()
+
+        steps = show.get_show_steps_with_tokens(dict(line1num="led_01", line1color="red"))
+        self.assertEqual(["led_01"], list(steps[0]['lights'].keys()))
+        self.assertEqual("red", steps[0]['lights']['led_01']['color'])
+
+        # the show itself is not modified and the same tokens return the cached steps
+        self.assertEqual(original, show.show_steps)
+        self.assertIs(steps, show.get_show_steps_with_tokens(dict(line1num="led_01", line1color="red")))
+        self.assertIsNot(steps, show.get_show_steps_with_tokens(dict(line1num="led_02", line1color="red")))
+
+        # steps without tokens are shared
+        show = self.machine.shows['test_show1']
+        self.assertIs(show.show_steps, show.get_show_steps_with_tokens({}))
+
+    def test_show_plan(self):
+        show = self.machine.shows['leds_name_token']
+        show_steps = show.get_show_steps_with_tokens(dict(leds='tag1'))
+        plan = show.get_show_plan(show_steps)
+        self.assertIs(plan, show.get_show_plan(show_steps))
+
+        # tags are resolved to lights and colors are parsed once
+        item_type, player, settings = plan[0][0]
+        self.assertEqual("lights", item_type)
+        self.assertIs(self.machine.show_controller.show_players['lights'], player)
+        self.assertEqual(set(self.machine.lights.items_tagged('tag1')), set(settings.keys()))
+        self.assertEqual(RGBColor('red'), settings[self.machine.lights.led_01]['color'])
+
     def _stop_shows(self):
         while self.machine.show_controller.running_shows:
             for show in self.machine.show_controller.running_shows:
@@ -1,3 +1,5 @@
+from unittest.mock import MagicMock
+
 from mpf.tests.MpfTestCase import MpfTestCase
 from mpf.tests.loop import MockSerial
 
@@ -52,3 +54,57 @@ class TestSmartMatrix(MpfTestCase):
         self.machine.rgb_dmds.smartmatrix_2.update([0x00, 0x01, 0x02, 0x03])
         self.advance_time_and_run()
         self.assertEqual(b'\x01\x00\x01\x02\x03', self.serial2.receive_data)
+
+    def test_latest_frame_wins(self):
+        self.advance_time_and_run()
+        self.serial1.receive_data = b''
+        frame_writer = self.machine.rgb_dmds.smartmatrix_1.hw_device.frame_writer
+
+        # frames which were not sent yet are replaced by newer frames
+        self.machine.rgb_dmds.smartmatrix_1.update(b'\x01\x01')
+        self.machine.rgb_dmds.smartmatrix_1.update(b'\x02\x02')
+        self.machine.rgb_dmds.smartmatrix_1.update(b'\x03\x03')
+        self.advance_time_and_run(.1)
+        self.assertEqual(b'\xba\x11\x00\x03\x04\x00\x00\x00\x03\x03', self.serial1.receive_data)
+        self.assertEqual(1, frame_writer.frames_sent)
+        self.assertEqual(2, frame_writer.frames_dropped)
+
+        # stats are sent to monitors about once per second
+        monitor = MagicMock()
+        self.machine.register_monitor("dmd", monitor)
+        for _ in range(30):
+            self.machine.rgb_dmds.smartmatrix_1.update(b'\x04\x04')
+            self.advance_time_and_run(.05)
+        self.assertAlmostEqual(20, frame_writer.sent_fps, delta=2)
+        self.assertEqual(0, frame_writer.dropped_fps)
+        self.assertTrue(monitor.called)
+        self.assertEqual("smartmatrix_1", monitor.call_args[1]["name"])
+        self.assertEqual(frame_writer.sent_fps, monitor.call_args[1]["sent_fps"])
+        self.assertEqual(2, monitor.call_args[1]["frames_dropped"])
+
+    def test_partial_updates(self):
+        self.advance_time_and_run()
+        self.serial2.receive_data = b''
+
+        frame = bytearray(100)
+        self.machine.rgb_dmds.smartmatrix_2.update(bytes(frame))
+        self.advance_time_and_run(.1)
+        self.assertEqual(b'\x01' + bytes(frame), self.serial2.receive_data)
+        self.serial2.receive_data = b''
+
+        # only the changed region is sent
+        frame[4] = 4
+        frame[5] = 5
+        self.machine.rgb_dmds.smartmatrix_2.update(bytes(frame))
+        self.advance_time_and_run(.1)
+        self.assertEqual(b'\x02\x00\x04\x00\x02\x04\x05', self.serial2.receive_data)
+        self.serial2.receive_data = b''
+
+        # a dropped partial update is merged into the next one
+        frame[10] = 10
+        self.machine.rgb_dmds.smartmatrix_2.update(bytes(frame))
+        frame[40] = 40
+        self.machine.rgb_dmds.smartmatrix_2.update(bytes(frame))
+        self.advance_time_and_run(.1)
+        self.assertEqual(b'\x02\x00\x0a\x00\x1f' + bytes(frame[10:41]), self.serial2.receive_data)
+        self.assertEqual(1, self.machine.rgb_dmds.smartmatrix_2.hw_device.frame_writer.frames_dropped)
@@ -1,3 +1,4 @@
+from functools import partial
 from unittest.mock import MagicMock
 
 from mpf.core.switch_controller import MonitoredSwitchChange
@@ -50,6 +51,20 @@ class TestSwitchController(MpfTestCase):
         self.hit_switch_and_run("s_test", 1)
         monitor.assert_not_called()
 
+    def test_process_switch_by_num(self):
+        self.machine.switch_controller.process_switch_by_num('1', 1, self.machine.default_platform)
+        self.advance_time_and_run(.1)
+        self.assertSwitchState("s_test", 1)
+
+        self.machine.switch_controller.process_switch_by_num('1', 0, self.machine.default_platform)
+        self.advance_time_and_run(.1)
+        self.assertSwitchState("s_test", 0)
+
+        # NC switch. hardware state is inverted
+        self.machine.switch_controller.process_switch_by_num('4', 1, self.machine.default_platform)
+        self.advance_time_and_run(.1)
+        self.assertSwitchState("s_test_invert", 0)
+
     def test_wait_futures(self):
         self.hit_switch_and_run("s_test", 1)
         future = self.machine.switch_controller.wait_for_switch("s_test")
@@ -130,6 +145,32 @@ class TestSwitchController(MpfTestCase):
         self.advance_time_and_run(.1)
         cb.assert_called_with()
 
+    def test_timed_switch_handler_order_and_cancel(self):
+        calls = []
+        for ms in (500, 100, 300):
+            self.machine.switch_controller.add_switch_handler(
+                switch_name="s_test", callback=partial(calls.append, ms), state=1, ms=ms)
+
+        self.hit_switch_and_run("s_test", .2)
+        self.assertEqual([100], calls)
+        self.assertAlmostEqual(self.machine.clock.get_time() + .1,
+                               self.machine.switch_controller.get_next_timed_switch_event(), delta=.01)
+
+        # releasing the switch cancels the pending handlers
+        self.release_switch_and_run("s_test", 1)
+        self.assertEqual([100], calls)
+        with self.assertRaises(AssertionError):
+            self.machine.switch_controller.get_next_timed_switch_event()
+
+        # rapid toggling does not fire and does not leave handlers behind
+        for _ in range(200):
+            self.hit_switch_and_run("s_test", .05)
+            self.release_switch_and_run("s_test", .05)
+        self.assertEqual([100], calls)
+
+        self.hit_switch_and_run("s_test", 1)
+        self.assertEqual([100, 100, 300, 500], calls)
+
     def test_activation_and_deactivation_events(self):
         self.mock_event("test_active")
         self.mock_event("test_active2")
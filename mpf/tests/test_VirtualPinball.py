@@ -60,7 +60,8 @@ class TestVirtualPinball(MpfTestCase):
         self.assertEqual("device", cmd)
         self.assertEqual("test_light1", args['name'])
         self.assertEqual("light", args['type'])
-        self.assertEqual({'color': [255, 255, 255]}, args['state'])
+        self.assertEqual({'color': [255, 255, 255], 'stack_stats': {'size': 1, 'max_size': 1, 'updates': 1}},
+                         args['state'])
 
         self.machine.coils.c_test.pulse()
         self.advance_time_and_run()
@@ -2,7 +2,7 @@ import unittest
 import ruamel.yaml as yaml
 from mpf.file_interfaces.yaml_roundtrip import YamlRoundtrip
 
-from mpf.file_interfaces.yaml_interface import MpfLoader
+from mpf.file_interfaces.yaml_interface import MpfLoader, MpfCLoader, YamlInterface
 
 
 class TestYamlInterface(unittest.TestCase):
@@ -91,6 +91,34 @@ a: 3
         with self.assertRaises(KeyError):
             yaml.load(yaml_str, Loader=MpfLoader)
 
+        if MpfCLoader:
+            with self.assertRaises(KeyError):
+                yaml.load(yaml_str, Loader=MpfCLoader)
+
+    @unittest.skipIf(not MpfCLoader, "libyaml is not available")
+    def test_c_loader(self):
+        config = """
+str_1: +1
+str_2: 032
+str_3: on
+bool_1: yes
+int_1: 0x10
+float_1: 1.0
+UPPER_Key:
+  - 1
+  - Test: ff0000
+time: 1:20
+"""
+        self.assertEqual(yaml.load(config, Loader=MpfLoader), yaml.load(config, Loader=MpfCLoader))
+
+        YamlInterface.use_c_loader = False
+        self.assertIs(MpfLoader, YamlInterface.get_loader())
+        python_config = YamlInterface.process(config)
+        YamlInterface.use_c_loader = True
+        self.assertIs(MpfCLoader, YamlInterface.get_loader())
+        self.assertEqual(python_config, YamlInterface.process(config))
+        self.assertEqual([1, {'Test': 'ff0000'}], python_config['upper_key'])
+
     def test_yaml_patches(self):
 
         # tests our patches to the yaml processor
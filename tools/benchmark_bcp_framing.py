@@ -0,0 +1,97 @@
+"""Benchmark BCP throughput with text and binary framing.
+
+Connects two BCP socket clients over a local loopback socket and measures how
+fast switch, device and event monitor messages go from one to the other with
+the text protocol and with negotiated binary framing.
+"""
+import argparse
+import asyncio
+import time
+from unittest.mock import MagicMock
+
+from mpf.core.bcp.bcp_socket_client import BCPClientSocket
+
+
+def _create_messages(count):
+    messages = []
+    for i in range(count):
+        if i % 3 == 0:
+            messages.append(("switch", {"name": "s_switch_{}".format(i % 100), "state": i % 2}))
+        elif i % 3 == 1:
+            messages.append(("device", {"type": "light", "name": "l_light_{}".format(i % 100),
+                                        "changes": ["color", [0, 0, 0], [255, 128, i % 256]],
+                                        "state": {"color": [255, 128, i % 256]}}))
+        else:
+            messages.append(("monitored_event", {"event_name": "ball_save_{}_timer_tick".format(i % 10),
+                                                 "event_type": None, "event_callback": None,
+                                                 "event_kwargs": {"ticks": i, "ticks_remaining": 100 - i % 100},
+                                                 "registered_handlers": []}))
+    return messages
+
+
+def _create_client(loop, name, binary_framing):
+    machine = MagicMock()
+    machine.clock.loop = loop
+    client = BCPClientSocket(machine, name, None)
+    client.binary_framing = binary_framing
+    client.max_send_queue = 10 ** 9
+    return client
+
+
+@asyncio.coroutine
+def _run(loop, messages, binary_framing):
+    accepted = asyncio.Future(loop=loop)
+    receiver = _create_client(loop, "receiver", binary_framing)
+
+    def _accept(reader, writer):
+        receiver.accept_connection(reader, writer)
+        accepted.set_result(True)
+
+    server = yield from asyncio.start_server(_accept, "127.0.0.1", 0, loop=loop)
+    port = server.sockets[0].getsockname()[1]
+
+    sender = _create_client(loop, "sender", binary_framing)
+    reader, writer = yield from asyncio.open_connection("127.0.0.1", port, loop=loop)
+    sender.accept_connection(reader, writer)
+    yield from accepted
+
+    # the sender switches to binary framing when it received the hello of the receiver
+    sender_reader = loop.create_task(sender.read_message())
+    while binary_framing and not sender._send_binary:     # pylint: disable-msg=protected-access
+        yield from asyncio.sleep(.001, loop=loop)
+
+    start = time.perf_counter()
+    for command, kwargs in messages:
+        sender.send(command, kwargs)
+    for _ in messages:
+        yield from receiver.read_message()
+    duration = time.perf_counter() - start
+
+    sender_reader.cancel()
+    sender.stop()
+    receiver.stop()
+    server.close()
+    yield from server.wait_closed()
+    return duration
+
+
+def main():
+    """Run benchmark."""
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--messages", type=int, default=100000)
+    args = parser.parse_args()
+
+    loop = asyncio.new_event_loop()
+    messages = _create_messages(args.messages)
+
+    print("{:<8} {:>12} {:>14}".format("framing", "time (ms)", "messages/s"))
+    for binary_framing in (False, True):
+        duration = loop.run_until_complete(_run(loop, messages, binary_framing))
+        print("{:<8} {:>12.1f} {:>14.0f}".format("binary" if binary_framing else "text", duration * 1e3,
+                                                 len(messages) / duration))
+
+    loop.close()
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,54 @@
+"""Benchmark config validation at startup.
+
+Validates a machine worth of switches, coils and show step light_player
+entries with the ConfigValidator. The first pass includes merging and
+compiling the specs. Later passes only run the compiled validators.
+"""
+import argparse
+import timeit
+from unittest.mock import MagicMock
+
+from mpf.core.config_validator import ConfigValidator
+
+
+def _create_validator():
+    machine = MagicMock()
+    machine.machine_config = {'mpf': {'allow_invalid_config_sections': False}}
+    machine.psus = {'default': MagicMock()}
+    return ConfigValidator(machine)
+
+
+def _validate_machine(validator, devices, show_steps):
+    for i in range(devices):
+        validator.validate_config("switches", {"number": str(i), "type": "NC", "ignore_window_ms": "20ms"},
+                                  "s_{}".format(i), "device")
+        validator.validate_config("coils", {"number": str(i), "default_pulse_ms": "30ms",
+                                            "max_hold_power": .5}, "c_{}".format(i), "device")
+
+    for i in range(show_steps):
+        validator.validate_config("light_player", {"color": "ff0000", "fade": "{}ms".format(i)},
+                                  base_spec="config_player_common")
+
+
+def main():
+    """Run benchmark."""
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--devices", type=int, default=500)
+    parser.add_argument("--show-steps", type=int, default=5000)
+    parser.add_argument("--passes", type=int, default=5)
+    args = parser.parse_args()
+
+    validator = _create_validator()
+    items = args.devices * 2 + args.show_steps
+
+    first = timeit.timeit(lambda: _validate_machine(validator, args.devices, args.show_steps), number=1)
+    later = timeit.timeit(lambda: _validate_machine(validator, args.devices, args.show_steps),
+                          number=args.passes) / args.passes
+
+    print("{} configs validated".format(items))
+    print("{:<20} {:>12.1f} ms {:>10.2f} us/config".format("first pass", first * 1e3, first / items * 1e6))
+    print("{:<20} {:>12.1f} ms {:>10.2f} us/config".format("later passes", later * 1e3, later / items * 1e6))
+
+
+if __name__ == '__main__':
+    main()
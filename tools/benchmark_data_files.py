@@ -0,0 +1,46 @@
+"""Benchmark loading and saving of data files in YAML and JSON.
+
+Creates an audits file with a lot of switch and event counts and measures how
+long the FileManager takes to save and load it with each file interface.
+"""
+import argparse
+import os
+import tempfile
+import timeit
+
+from mpf.core.file_manager import FileManager
+
+
+def _create_audits(switches):
+    return {
+        "switches": {"s_switch_{}".format(i): i * 7 for i in range(switches)},
+        "events": {"event_{}".format(i): i for i in range(switches // 10)},
+        "player": {"score": {"top": [1000000 - i for i in range(10)], "average": 123456.7, "total": 100}},
+        "shots": {},
+    }
+
+
+def main():
+    """Run benchmark."""
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--switches", type=int, default=50000)
+    parser.add_argument("--passes", type=int, default=3)
+    args = parser.parse_args()
+
+    FileManager.init()
+    data = _create_audits(args.switches)
+
+    print("{:<8} {:>12} {:>12} {:>12}".format("format", "save (ms)", "load (ms)", "size (kB)"))
+    with tempfile.TemporaryDirectory() as path:
+        for extension in (".yaml", ".json"):
+            filename = os.path.join(path, "audits" + extension)
+            save = timeit.timeit(lambda: FileManager.save(filename, data), number=args.passes) / args.passes
+            load = timeit.timeit(lambda: FileManager.load(filename), number=args.passes) / args.passes
+            if FileManager.load(filename) != data:
+                raise AssertionError("Data changed when saving and loading {}".format(extension))
+            print("{:<8} {:>12.1f} {:>12.1f} {:>12.1f}".format(extension, save * 1e3, load * 1e3,
+                                                               os.path.getsize(filename) / 1024))
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,70 @@
+"""Benchmark partial RGB DMD updates.
+
+Renders frames where only a score digit changes, diffs them with and without
+NumPy and calculates how many frames per second fit through a serial link
+when sending full frames and when sending only the changed region.
+"""
+import argparse
+import timeit
+from unittest.mock import patch
+
+from mpf.devices import dmd
+from mpf.devices.dmd import get_changed_region
+
+
+def _create_frames(count, width, height):
+    """Return frames with a 6x8 pixel digit which changes every frame."""
+    frames = []
+    background = bytearray(width * height * 3)
+    for i in range(width * height):
+        background[i * 3] = i % 64
+    for num in range(count):
+        frame = bytearray(background)
+        for y in range(12, 20):
+            for x in range(100, 106):
+                offset = (y * width + x) * 3
+                frame[offset:offset + 3] = bytes([255, (num * 37 + x) % 256, (num * 11 + y) % 256])
+        frames.append(bytes(frame))
+    return frames
+
+
+def _diff_frames(frames):
+    size = 0
+    for old_frame, new_frame in zip(frames, frames[1:]):
+        start, end = get_changed_region(old_frame, new_frame)
+        size += end - start
+    return size
+
+
+def main():
+    """Run benchmark."""
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--width", type=int, default=128)
+    parser.add_argument("--height", type=int, default=32)
+    parser.add_argument("--frames", type=int, default=200)
+    parser.add_argument("--baud", type=int, default=2000000)
+    args = parser.parse_args()
+
+    frames = _create_frames(args.frames, args.width, args.height)
+    updates = len(frames) - 1
+    full_size = len(frames[0]) + 1
+    partial_size = _diff_frames(frames) / updates + 5
+
+    if dmd.numpy:
+        duration = timeit.timeit(lambda: _diff_frames(frames), number=1) / updates
+        print("{:<24} {:>10.1f} us/frame".format("diff with numpy", duration * 1e6))
+    else:
+        print("numpy is not available")
+
+    with patch.object(dmd, "numpy", None):
+        duration = timeit.timeit(lambda: _diff_frames(frames), number=1) / updates
+    print("{:<24} {:>10.1f} us/frame".format("diff without numpy", duration * 1e6))
+
+    bytes_per_sec = args.baud / 10    # 8N1
+    print("{:<24} {:>10.0f} bytes {:>8.1f} FPS".format("full frames", full_size, bytes_per_sec / full_size))
+    print("{:<24} {:>10.0f} bytes {:>8.1f} FPS".format("partial updates", partial_size,
+                                                       bytes_per_sec / partial_size))
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,69 @@
+"""Benchmark removal of event handlers.
+
+Registers a growing number of handlers in the EventManager and measures how
+long it takes to remove handlers by key and by method. The time per removal
+should not depend on the total number of registered handlers.
+"""
+import argparse
+import timeit
+from unittest.mock import MagicMock
+
+from mpf.core.events import EventManager
+
+
+class _Handler(object):
+
+    """Object with an event handler method."""
+
+    def handler(self, **kwargs):
+        """Handle event."""
+        del kwargs
+
+
+def _create_event_manager():
+    machine = MagicMock()
+    machine.machine_config = {'logging': {'console': {'event_manager': 'none'},
+                                          'file': {'event_manager': 'none'}}}
+    return EventManager(machine)
+
+
+def _benchmark(total_handlers, handlers_per_event, removals):
+    """Return seconds per removal by key and by method."""
+    events = _create_event_manager()
+    keys = []
+    handlers = []
+    for i in range(total_handlers):
+        handler = _Handler()
+        handlers.append(handler)
+        keys.append(events.add_handler("event{}".format(i // handlers_per_event), handler.handler,
+                                       priority=i % 10))
+
+    step = total_handlers // removals
+    start = timeit.default_timer()
+    for key in keys[0:step * removals:step]:
+        events.remove_handler_by_key(key)
+    by_key = (timeit.default_timer() - start) / removals
+
+    start = timeit.default_timer()
+    for handler in handlers[1:step * removals:step]:
+        events.remove_handler(handler.handler)
+    by_method = (timeit.default_timer() - start) / removals
+
+    return by_key, by_method
+
+
+def main():
+    """Run benchmark."""
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--handlers-per-event", type=int, default=10)
+    parser.add_argument("--removals", type=int, default=200)
+    args = parser.parse_args()
+
+    print("{:>10} {:>20} {:>20}".format("handlers", "by key (us)", "by method (us)"))
+    for total_handlers in (500, 5000, 50000):
+        by_key, by_method = _benchmark(total_handlers, args.handlers_per_event, args.removals)
+        print("{:>10} {:>20.2f} {:>20.2f}".format(total_handlers, by_key * 1e6, by_method * 1e6))
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,44 @@
+"""Benchmark compiled placeholder templates against the AST walker.
+
+Evaluates some typical conditional event templates with both
+BasePlaceholderManager.evaluate_template (which walks the syntax tree) and the
+compiled template functions used by BoolTemplate/IntTemplate/FloatTemplate.
+"""
+import argparse
+import timeit
+from unittest.mock import MagicMock
+
+from mpf.core.placeholder_manager import PlaceholderManager
+
+TEMPLATES = [
+    "ball > 1",
+    "param > 1 and a == True",
+    "score % 1000 == 0 or ball == 3",
+    "a if ball > 2 else score * 2 + 7",
+]
+
+
+def main():
+    """Run benchmark."""
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--iterations", type=int, default=100000)
+    args = parser.parse_args()
+
+    machine = MagicMock()
+    machine.game = None
+    placeholder_manager = PlaceholderManager(machine)
+    parameters = {"ball": 2, "param": 3, "a": True, "score": 12000}
+
+    print("{:<35} {:>14} {:>14} {:>8}".format("template", "walker (us)", "compiled (us)", "speedup"))
+    for template_str in TEMPLATES:
+        template = placeholder_manager.build_bool_template(template_str)
+        walker = timeit.timeit(lambda: placeholder_manager.evaluate_template(template.template, parameters),
+                               number=args.iterations) / args.iterations
+        compiled = timeit.timeit(lambda: template.evaluate(parameters),
+                                 number=args.iterations) / args.iterations
+        print("{:<35} {:>14.3f} {:>14.3f} {:>7.1f}x".format(template_str, walker * 1e6, compiled * 1e6,
+                                                             walker / compiled))
+
+
+if __name__ == '__main__':
+    main()
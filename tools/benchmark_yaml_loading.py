@@ -0,0 +1,72 @@
+"""Benchmark loading of YAML config and show files.
+
+Loads all YAML files of the test machines with the python loader, with the
+libyaml based loader, from the in-memory cache of the YamlInterface and from a
+warm ConfigFileCache (which is what a warm boot uses).
+"""
+import argparse
+import glob
+import os
+import tempfile
+import timeit
+
+import ruamel.yaml as yaml
+
+from mpf.core.config_cache import ConfigFileCache
+from mpf.file_interfaces.yaml_interface import YamlInterface, MpfLoader, MpfCLoader
+
+
+def _get_files(path):
+    return sorted(glob.glob(os.path.join(path, "**", "*.yaml"), recursive=True))
+
+
+def _parse_files(files, loader):
+    for file in files:
+        with open(file, encoding='utf8') as f:
+            yaml.load(f, Loader=loader)
+
+
+def _load_files(interface, files):
+    for file in files:
+        interface.load(file, verify_version=False, halt_on_error=False)
+
+
+def main():
+    """Run benchmark."""
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--path", default=os.path.join(os.path.dirname(__file__), os.pardir, "mpf", "tests",
+                                                       "machine_files"))
+    parser.add_argument("--passes", type=int, default=3)
+    args = parser.parse_args()
+
+    files = _get_files(args.path)
+    print("{} files".format(len(files)))
+
+    results = [("python loader", lambda: _parse_files(files, MpfLoader))]
+    if MpfCLoader:
+        results.append(("libyaml loader", lambda: _parse_files(files, MpfCLoader)))
+    else:
+        print("libyaml is not available")
+
+    interface = YamlInterface()
+    YamlInterface.cache = True
+    _load_files(interface, files)
+    results.append(("in-memory cache", lambda: _load_files(interface, files)))
+
+    with tempfile.TemporaryDirectory() as path:
+        cache_file = os.path.join(path, "cache")
+        file_cache = ConfigFileCache(cache_file)
+        _load_files(file_cache, files)
+        file_cache.save()
+
+        def _load_from_file_cache():
+            _load_files(ConfigFileCache(cache_file), files)
+        results.append(("warm file cache", _load_from_file_cache))
+
+        for name, func in results:
+            duration = timeit.timeit(func, number=args.passes) / args.passes
+            print("{:<20} {:>10.1f} ms".format(name, duration * 1e3))
+
+
+if __name__ == '__main__':
+    main()
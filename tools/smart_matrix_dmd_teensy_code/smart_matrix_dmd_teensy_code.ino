@@ -29,6 +29,7 @@ const rgb24 defaultBackgroundColor = {0, 0, 0};
 const int ledPin = 13;
 
 boolean frameOn = false;
+boolean inFrame = false;
 int dataPos = 0;
 int dataExpected = 0;
 
@@ -77,8 +78,23 @@ void loop() {
       backgroundLayer.swapBuffers(true);
       dataPos=0;
       dataExpected = kMatrixWidth * kMatrixHeight * 3;
+      inFrame = true;
       digitalWrite(ledPin, HIGH);
     }
+    else if ( val == 2 && !inFrame )
+    {
+      // partial update: 2 bytes offset and 2 bytes length (big endian) followed by the changed bytes.
+      // the back buffer still contains the last frame because we always swap with copy
+      uint8_t header[4];
+      if (Serial.readBytes((char*)header, 4) == 4) {
+        int offset = (header[0] << 8) | header[1];
+        int length = (header[2] << 8) | header[3];
+        if (offset + length <= kMatrixWidth * kMatrixHeight * 3 &&
+            Serial.readBytes(&buffer[offset], length) == (size_t)length) {
+          swap = true;
+        }
+      }
+    }
     else {
       buffer[dataPos++] = val;
       dataExpected--;
@@ -95,6 +111,7 @@ void loop() {
     backgroundLayer.swapBuffers(true);
     dataPos = 0;
     dataExpected = kMatrixWidth * kMatrixHeight * 3;
+    inFrame = false;
     digitalWrite(ledPin, frameOn);
     frameOn = !frameOn;
   }